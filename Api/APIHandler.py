@@ -4,11 +4,28 @@ This wraps the new SupabaseAuthService to maintain compatibility with existing c
 """
 
 import asyncio
-from typing import Optional, Dict, Any
+from types import SimpleNamespace
+from typing import Optional, Dict, Any, List
 from services.supabase_auth_service import SupabaseAuthService
+from services.supabase_service import CYCLE_KIND_FILTERS
 from Views.globals.app_logger import app_logger
 
 
+# remote payload keys that are named differently in the cycles table
+REMOTE_CYCLE_COLUMNS = {
+    'threshold_top': 'threshold_upper',
+    'threshold_bottom': 'threshold_lower',
+}
+# remote payload keys with no cycles column
+REMOTE_CYCLE_SKIPPED = frozenset({'orders'})
+
+
+def _remote_cycle_row(cycle: Dict) -> Dict:
+    """Map a to_remote_dict() payload onto the cycles table columns"""
+    return {REMOTE_CYCLE_COLUMNS.get(key, key): value
+            for key, value in cycle.items() if key not in REMOTE_CYCLE_SKIPPED}
+
+
 class API:
     """
     Compatibility wrapper for the old PocketBase API
@@ -103,6 +120,82 @@ class API:
             app_logger.error(f"Error getting user accounts: {e}")
             return []
 
+    async def bulk_update_cycles(self, cycles: List[Dict]) -> List[str]:
+        """Update many existing cycles concurrently; returns the ids that were written"""
+        if not cycles:
+            return []
+
+        client = self.auth_service.client if self.auth_service else None
+        if client is None:
+            app_logger.error(
+                "Cannot bulk update cycles without an initialized Supabase client")
+            return []
+
+        async def update_one(cycle):
+            row = _remote_cycle_row(cycle)
+            cycle_id = row.pop('id')
+            # UPDATE only: a cycle deleted remotely is not recreated
+            await client.table('cycles').update(row).eq('id', cycle_id).execute()
+            return cycle_id
+
+        results = await asyncio.gather(
+            *(update_one(cycle) for cycle in cycles), return_exceptions=True)
+
+        updated = []
+        for cycle, result in zip(cycles, results):
+            if isinstance(result, BaseException):
+                app_logger.error(
+                    f"Error updating cycle {cycle.get('id')}: {result}")
+            else:
+                updated.append(result)
+        return updated
+
+    async def get_all_AH_active_cycles_by_account(self, account_id: str, fields: str = "id") -> list:
+        """Get an account's open AH cycles with only the given columns"""
+        return await self._get_active_cycles_by_account(account_id, fields, 'AH')
+
+    async def get_all_CT_active_cycles_by_account(self, account_id: str, fields: str = "id") -> list:
+        """Get an account's open CT cycles with only the given columns"""
+        return await self._get_active_cycles_by_account(account_id, fields, 'CT')
+
+    async def _get_active_cycles_by_account(self, account_id: str, fields: str, kind: str) -> list:
+        """Open cycles of one kind of an account, filtered and trimmed by the database"""
+        try:
+            client = self.auth_service.client if self.auth_service else None
+            if client is None:
+                app_logger.error(
+                    "Cannot get cycles without an initialized Supabase client")
+                return []
+
+            result = await client.table('cycles').select(fields).eq(
+                'account', account_id).eq('is_closed', False).or_(
+                CYCLE_KIND_FILTERS[kind]).execute()
+            # legacy callers read cycle rows by attribute
+            return [SimpleNamespace(**row) for row in result.data or []]
+
+        except Exception as e:
+            app_logger.error(f"Error getting active cycles for account {account_id}: {e}")
+            return []
+
+    async def get_cycles_by_ids(self, cycle_ids: List[str]) -> list:
+        """Get full cycle rows for the given ids in one request"""
+        if not cycle_ids:
+            return []
+
+        try:
+            client = self.auth_service.client if self.auth_service else None
+            if client is None:
+                app_logger.error(
+                    "Cannot get cycles without an initialized Supabase client")
+                return []
+
+            result = await client.table('cycles').select('*').in_('id', cycle_ids).execute()
+            return [SimpleNamespace(**row) for row in result.data or []]
+
+        except Exception as e:
+            app_logger.error(f"Error getting {len(cycle_ids)} cycles by id: {e}")
+            return []
+
     def get_current_user(self) -> Optional[Dict]:
         """Get current user data"""
         return self.current_user_data
@@ -4,7 +4,8 @@ CycleTrader Repository - Compatibility layer for Supabase
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Any, Tuple
 from services.supabase_service import SupabaseService
 
 logger = logging.getLogger(__name__)
@@ -95,6 +96,71 @@ class CTRepo:
             logger.error(f"Error in async update_cycle: {e}")
         return False
 
+    def get_active_cycles(self, account_id: str) -> List[Any]:
+        """Get open cycles by account - compatibility method"""
+        try:
+            return asyncio.run(self._async_get_active_cycles(account_id))
+        except Exception as e:
+            logger.error(f"Error getting active cycles for account {account_id}: {e}")
+            return []
+
+    async def _async_get_active_cycles(self, account_id: str) -> List[Any]:
+        """Async implementation of get_active_cycles"""
+        await self._ensure_initialized()
+
+        try:
+            if self.supabase_service:
+                rows = await self.supabase_service.get_active_cycles_by_account(
+                    account_id, kind='CT')
+                # legacy callers read cycle rows by attribute
+                return [SimpleNamespace(**row) for row in rows]
+        except Exception as e:
+            logger.error(f"Error in async get_active_cycles: {e}")
+        return []
+
+    def get_active_cycle_keys(self, account_id: str) -> List[Tuple[str, str, Any]]:
+        """Get (id, remote_id, updated_at) of open cycles by account - compatibility method"""
+        try:
+            return asyncio.run(self._async_get_active_cycle_keys(account_id))
+        except Exception as e:
+            logger.error(f"Error getting active cycle keys for account {account_id}: {e}")
+            return []
+
+    async def _async_get_active_cycle_keys(self, account_id: str) -> List[Tuple[str, str, Any]]:
+        """Async implementation of get_active_cycle_keys"""
+        await self._ensure_initialized()
+
+        try:
+            if self.supabase_service:
+                rows = await self.supabase_service.get_active_cycles_by_account(
+                    account_id, columns='id, updated_at', kind='CT')
+                # Supabase cycle rows are keyed by their remote id
+                return [(row['id'], row['id'], row.get('updated_at')) for row in rows]
+        except Exception as e:
+            logger.error(f"Error in async get_active_cycle_keys: {e}")
+        return []
+
+    def get_cycles_by_remote_ids(self, remote_ids: List[str]) -> Dict[str, Any]:
+        """Get cycles keyed by remote id with one query - compatibility method"""
+        try:
+            return asyncio.run(self._async_get_cycles_by_remote_ids(remote_ids))
+        except Exception as e:
+            logger.error(f"Error getting cycles by remote ids: {e}")
+            return {}
+
+    async def _async_get_cycles_by_remote_ids(self, remote_ids: List[str]) -> Dict[str, Any]:
+        """Async implementation of get_cycles_by_remote_ids"""
+        await self._ensure_initialized()
+
+        try:
+            if self.supabase_service:
+                # Supabase cycle rows are keyed by their remote id
+                rows = await self.supabase_service.get_cycles_by_ids(remote_ids)
+                return {row['id']: SimpleNamespace(**row) for row in rows}
+        except Exception as e:
+            logger.error(f"Error in async get_cycles_by_remote_ids: {e}")
+        return {}
+
     def get_cycles_by_account(self, account_id: str) -> List[Dict]:
         """Get cycles by account - compatibility method"""
         try:
@@ -114,3 +180,24 @@ class CTRepo:
         except Exception as e:
             logger.error(f"Error in async get_cycles_by_account: {e}")
         return []
+
+    def get_orders_by_tickets(self, tickets: List[int]) -> Dict[int, Any]:
+        """Get orders keyed by ticket with one query - compatibility method"""
+        try:
+            return asyncio.run(self._async_get_orders_by_tickets(tickets))
+        except Exception as e:
+            logger.error(f"Error getting orders by tickets: {e}")
+            return {}
+
+    async def _async_get_orders_by_tickets(self, tickets: List[int]) -> Dict[int, Any]:
+        """Async implementation of get_orders_by_tickets"""
+        await self._ensure_initialized()
+
+        try:
+            if self.supabase_service:
+                rows = await self.supabase_service.get_orders_by_tickets(tickets)
+                # legacy callers read order rows by attribute
+                return {row['ticket']: SimpleNamespace(**row) for row in rows}
+        except Exception as e:
+            logger.error(f"Error in async get_orders_by_tickets: {e}")
+        return {}
@@ -12,6 +12,7 @@ logger = logging.getLogger(__name__)
 
 class MockUser:
     """Mock user object for compatibility"""
+    __slots__ = ('username', 'password', 'id')
 
     def __init__(self, username: str, password: str, user_id: str = None):
         self.username = username
@@ -0,0 +1,66 @@
+-- Database functions used by the real-time trading system.
+-- Apply in the Supabase SQL editor (or psql) against the project database.
+
+-- Sum profit and volume of a cycle's orders server-side so callers get a
+-- single row back instead of every order row.
+-- Used by: cycles/CT_cycle_v2.py CTCycleV2.calculate_metrics
+create or replace function cycle_metrics(order_ids uuid[])
+returns table(total_profit numeric, total_volume numeric)
+language sql
+stable
+as $$
+    select coalesce(sum(profit), 0), coalesce(sum(volume), 0)
+    from orders
+    where id = any(order_ids)
+$$;
+
+-- Append one level to a cycle's done_price_levels without shipping the whole
+-- array; a level that is already present leaves the row untouched.
+-- Levels are {"price": <4-decimal price>, "direction": "BUY"|"SELL"} objects,
+-- the format cycles/CT_cycle.py reads and writes.
+-- Used by: cycles/CT_cycle_v2.py CTCycleV2.handle_zone_forward
+create or replace function append_done_level(cycle_id uuid, level jsonb)
+returns void
+language sql
+as $$
+    update cycles
+    set done_price_levels = coalesce(done_price_levels, '[]'::jsonb) || jsonb_build_array(level),
+        updated_at = now()
+    where id = cycle_id
+      and not coalesce(done_price_levels, '[]'::jsonb) @> jsonb_build_array(level)
+$$;
+
+-- Write the live profit of many orders in one round trip. Only existing rows
+-- are updated (a deleted order is not re-inserted) and the ids that were
+-- written are returned.
+-- Rows are {"id", "profit", "order_data", "updated_at"} objects.
+-- Used by: Orders/orders_manager_v2.py OrdersManagerV2.update_order_profits
+create or replace function update_order_profits(rows jsonb)
+returns table(id uuid)
+language sql
+as $$
+    update orders o
+    set profit = r.profit,
+        order_data = r.order_data,
+        updated_at = r.updated_at
+    from jsonb_to_recordset(rows) as r(id uuid, profit numeric, order_data jsonb, updated_at timestamptz)
+    where o.id = r.id
+    returning o.id
+$$;
+
+-- Write the live profit and volume of many cycles in one round trip. Only
+-- existing rows are updated and the ids that were written are returned.
+-- Rows are {"id", "total_profit", "total_volume", "updated_at"} objects.
+-- Used by: cycles/cycles_manager_v2.py CyclesManagerV2.update_cycle_profits
+create or replace function update_cycle_profits(rows jsonb)
+returns table(id uuid)
+language sql
+as $$
+    update cycles c
+    set total_profit = r.total_profit,
+        total_volume = r.total_volume,
+        updated_at = r.updated_at
+    from jsonb_to_recordset(rows) as r(id uuid, total_profit numeric, total_volume numeric, updated_at timestamptz)
+    where c.id = r.id
+    returning c.id
+$$;
@@ -0,0 +1,15 @@
+-- Indexes supporting the queries run by the cycle sync loops.
+-- Apply in the Supabase SQL editor (or psql) against the project database.
+-- Cycles are looked up by remote id through the cycles primary key, so no
+-- separate remote_id index is needed.
+
+-- Open cycles of an account, fetched on every sync pass.
+-- Used by: services/supabase_service.py SupabaseService.get_active_cycles_by_account
+create index concurrently if not exists cycles_account_active_idx
+    on cycles (account)
+    where is_closed = false;
+
+-- Orders of a cycle's tickets, fetched when building remote payloads.
+-- Used by: services/supabase_service.py SupabaseService.get_orders_by_tickets
+create index concurrently if not exists orders_ticket_idx
+    on orders (ticket);
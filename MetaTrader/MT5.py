@@ -1,5 +1,7 @@
 """ MetaTrader 5 expert advisor class to manage the MetaTrader 5 expert advisor. """
 # from aiomql import MetaTrader as MT5
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from Views.globals.app_state import store
 import MetaTrader5 as Mt5
 # Mt5=MT5()
@@ -14,6 +16,7 @@ class MetaTrader:
         self.server = server
         self.authorized = False
         self.account_id = username
+        self._order_executor = None
 
     def initialize(self, path):
         launched = False
@@ -26,7 +29,6 @@ class MetaTrader:
                 'Initialization failed, check internet connection. You must have Meta Trader 5 installed.')
             Mt5.shutdown()
         else:
-            print('You are connected to your MetaTrader account.')
             return self.connect()
 
     def connect(self):
@@ -106,6 +108,19 @@ class MetaTrader:
         symbols = Mt5.symbols_get()
         return symbols
 
+    async def send_order_async(self, order_func, *args):
+        """ Run a blocking order call (buy, sell, close_order, ...) without blocking the event loop
+
+        The Python package has no OrderSendAsync, so order_send runs on a single
+        dedicated worker thread. Order sends are serialized with each other, but
+        other MT5 calls (quotes, positions) keep running on the loop thread.
+        """
+        if self._order_executor is None:
+            self._order_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="mt5-orders")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._order_executor, order_func, *args)
+
     def buy(self, symbol, volume, magic, sl, tp, sltp_type, slippage, comment=None):
         """ Buy a symbol """
         symbol_info = Mt5.symbol_info(symbol)
@@ -10,6 +10,8 @@ from datetime import datetime
 import threading
 import time
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +34,15 @@ class OrdersManagerV2:
         self.suspicious_orders = []  # Orders in DB but not in MT5
         self.false_closed_orders = []  # Orders marked closed but still open
 
+        # DB order profits/volumes as flat arrays, contiguous per cycle,
+        # so cycle totals are summed in one vectorized pass
+        self._order_rows = {}     # order_id -> row in the arrays below
+        self._cycle_segments = {}  # cycle_id -> index into _segment_starts
+        self._segment_starts = np.zeros(0, dtype=np.intp)
+        self._profit = np.zeros(0)
+        self._volume = np.zeros(0)
+        self._live = np.zeros(0)  # 1.0 while the order is still cached
+
         # Performance optimization
         self.mt5_lock = threading.Lock()
         self.update_interval = 0.5  # 500ms for balance between performance and accuracy
@@ -142,9 +153,35 @@ class OrdersManagerV2:
                         'updated_at': order['updated_at']
                     }
 
+            self._index_order_totals()
+
         except Exception as e:
             self.logger.error(f"Error loading DB orders: {e}")
             self.db_orders = {}
+            self._index_order_totals()
+
+    def _index_order_totals(self):
+        """Rebuild the per-cycle order arrays from the cached DB orders"""
+        orders = sorted(self.db_orders.values(),
+                        key=lambda order: str(order.get('cycle_id')))
+        count = len(orders)
+
+        self._profit = np.fromiter((order.get('profit') or 0 for order in orders),
+                                   dtype=np.float64, count=count)
+        self._volume = np.fromiter((order.get('volume') or 0 for order in orders),
+                                   dtype=np.float64, count=count)
+        self._live = np.ones(count)
+
+        self._order_rows = {}
+        self._cycle_segments = {}
+        starts = []
+        for row, order in enumerate(orders):
+            self._order_rows[order['id']] = row
+            cycle_id = order.get('cycle_id')
+            if cycle_id not in self._cycle_segments:
+                self._cycle_segments[cycle_id] = len(starts)
+                starts.append(row)
+        self._segment_starts = np.asarray(starts, dtype=np.intp)
 
     async def identify_suspicious_orders(self):
         """Identify orders that exist in DB but not in MT5"""
@@ -173,7 +210,7 @@ class OrdersManagerV2:
     async def sync_orders_to_db(self):
         """Sync order profits and status from MT5 to database"""
         try:
-            update_tasks = []
+            changed = []
 
             for order_id, order_data in self.db_orders.items():
                 ticket = order_data.get('ticket')
@@ -187,58 +224,81 @@ class OrdersManagerV2:
                     # Check if profit has changed significantly
                     db_profit = order_data.get('profit', 0)
                     if abs(current_profit - db_profit) >= 0.01:  # Update if change > 1 cent
-                        update_tasks.append(self.update_order_profit(
-                            order_id, current_profit, mt5_data))
+                        changed.append((order_id, current_profit, mt5_data))
 
-            # Execute all updates concurrently
-            if update_tasks:
-                await asyncio.gather(*update_tasks, return_exceptions=True)
+            # Write all changed orders in one request
+            if changed:
+                await self.update_order_profits(changed)
 
         except Exception as e:
             self.logger.error(f"Error syncing orders to DB: {e}")
 
-    async def update_order_profit(self, order_id: str, profit: float, mt5_data: Dict):
-        """Update single order profit in database"""
+    async def update_order_profits(self, changed: List[tuple]):
+        """Update the profit of many existing orders in one update_order_profits call"""
         try:
-            update_data = {
-                'profit': round(profit, 2),
-                'updated_at': datetime.utcnow().isoformat()
-            }
-
-            # Also update order_data with latest MT5 info
-            order_data = self.db_orders[order_id]['order_data'].copy()
-            order_data.update({
-                'current_price': mt5_data.get('price_current', 0),
-                'profit': profit,
-                'swap': mt5_data.get('swap', 0),
-                'commission': mt5_data.get('commission', 0)
-            })
-            update_data['order_data'] = order_data
+            updated_at = datetime.utcnow().isoformat()
+            rows = []
+            for order_id, profit, mt5_data in changed:
+                # Also update order_data with latest MT5 info
+                order_data = self.db_orders[order_id]['order_data'].copy()
+                order_data.update({
+                    'current_price': mt5_data.get('price_current', 0),
+                    'profit': profit,
+                    'swap': mt5_data.get('swap', 0),
+                    'commission': mt5_data.get('commission', 0)
+                })
+                rows.append({
+                    'id': order_id,
+                    'profit': round(profit, 2),
+                    'order_data': order_data,
+                    'updated_at': updated_at
+                })
 
-            # Update in Supabase
-            result = await self.supabase_client.table('orders').update(update_data).eq('id', order_id).execute()
+            # Update in Supabase; only rows that still exist are written
+            result = await self.supabase_client.rpc(
+                'update_order_profits', {'rows': rows}).execute()
+            updated = {row['id'] for row in result.data or ()}
 
-            if result.data:
-                # Update local cache
-                self.db_orders[order_id]['profit'] = profit
-                self.db_orders[order_id]['order_data'] = order_data
-
-                # Send real-time update via WebSocket
-                if self.websocket_service:
-                    try:
-                        await self.websocket_service.send_order_update(self.account_id, {
-                            'order_id': order_id,
-                            'ticket': mt5_data.get('ticket'),
-                            'profit': profit,
-                            'price_current': mt5_data.get('price_current', 0),
-                            'updated_at': datetime.utcnow().isoformat()
-                        })
-                    except Exception as e:
-                        self.logger.error(
-                            f"Error sending WebSocket order update: {e}")
+            async with asyncio.TaskGroup() as tg:
+                for (order_id, profit, mt5_data), row in zip(changed, rows):
+                    if order_id in updated:
+                        tg.create_task(self._apply_order_profit(
+                            order_id, profit, row['order_data'], mt5_data, updated_at))
 
         except Exception as e:
-            self.logger.error(f"Error updating order {order_id} profit: {e}")
+            self.logger.error(
+                f"Error updating profit of {len(changed)} orders: {e}")
+
+    async def update_order_profit(self, order_id: str, profit: float, mt5_data: Dict):
+        """Update single order profit in database"""
+        await self.update_order_profits([(order_id, profit, mt5_data)])
+
+    async def _apply_order_profit(self, order_id: str, profit: float, order_data: Dict,
+                                  mt5_data: Dict, updated_at: str):
+        """Update the cached order and push the change over WebSocket"""
+        if order_id not in self.db_orders:
+            return
+
+        # Update local cache
+        self.db_orders[order_id]['profit'] = profit
+        self.db_orders[order_id]['order_data'] = order_data
+        row = self._order_rows.get(order_id)
+        if row is not None:
+            self._profit[row] = profit
+
+        # Send real-time update via WebSocket
+        if self.websocket_service:
+            try:
+                await self.websocket_service.send_order_update(self.account_id, {
+                    'order_id': order_id,
+                    'ticket': mt5_data.get('ticket'),
+                    'profit': profit,
+                    'price_current': mt5_data.get('price_current', 0),
+                    'updated_at': updated_at
+                })
+            except Exception as e:
+                self.logger.error(
+                    f"Error sending WebSocket order update: {e}")
 
     async def fix_suspicious_orders(self):
         """Fix orders that appear closed in MT5 but open in DB"""
@@ -319,6 +379,11 @@ class OrdersManagerV2:
                 # Remove from local cache
                 if order_id in self.db_orders:
                     del self.db_orders[order_id]
+                row = self._order_rows.pop(order_id, None)
+                if row is not None:
+                    self._profit[row] = 0
+                    self._volume[row] = 0
+                    self._live[row] = 0
 
                 # Trigger cycle recalculation
                 if cycle_id:
@@ -429,11 +494,18 @@ class OrdersManagerV2:
         except Exception as e:
             self.logger.error(f"Error in force sync: {e}")
 
+    def _close_order_locked(self, ticket: int) -> bool:
+        """Close an order in MT5 while holding mt5_lock"""
+        with self.mt5_lock:
+            return self.meta_trader.close_order(ticket)
+
     async def close_order_by_ticket(self, ticket: int) -> bool:
         """Close specific order by ticket"""
         try:
-            with self.mt5_lock:
-                success = self.meta_trader.close_order(ticket)
+            # mt5_lock is taken on the order worker thread, not across the
+            # await, so MT5 calls stay serialized without blocking the loop
+            success = await self.meta_trader.send_order_async(
+                self._close_order_locked, ticket)
 
             if success:
                 # Find and update the order in database
@@ -468,6 +540,34 @@ class OrdersManagerV2:
                 cycle_orders.append(order_data)
         return cycle_orders
 
+    async def get_orders_grouped_by_cycle(self, cycle_ids) -> Dict[str, List[Dict]]:
+        """Get the orders of many cycles in one pass, keyed by cycle id"""
+        grouped = {cycle_id: [] for cycle_id in cycle_ids}
+        for order_data in self.db_orders.values():
+            cycle_orders = grouped.get(order_data.get('cycle_id'))
+            if cycle_orders is not None:
+                cycle_orders.append(order_data)
+        return grouped
+
+    async def get_cycle_totals(self, cycle_ids: List[str]):
+        """Profit, volume and order count of each cycle, aligned with cycle_ids"""
+        segments = len(self._segment_starts)
+        if segments:
+            profits = np.add.reduceat(self._profit, self._segment_starts)
+            volumes = np.add.reduceat(self._volume, self._segment_starts)
+            counts = np.add.reduceat(self._live, self._segment_starts)
+        else:
+            profits = volumes = counts = np.zeros(0)
+
+        # A trailing zero slot stands for cycles without cached orders
+        profits = np.append(profits, 0.0)
+        volumes = np.append(volumes, 0.0)
+        counts = np.append(counts, 0.0)
+
+        index = np.fromiter((self._cycle_segments.get(cycle_id, segments) for cycle_id in cycle_ids),
+                            dtype=np.intp, count=len(cycle_ids))
+        return profits[index], volumes[index], counts[index]
+
     async def get_orders_by_symbol(self, symbol: str) -> List[Dict]:
         """Get all orders for a specific symbol"""
         symbol_orders = []
@@ -1,7 +1,7 @@
 from Strategy.strategy import Strategy
 import threading
 from Orders.order import order
-from cycles.CT_cycle import cycle
+from cycles.CT_cycle import make_cycle
 from DB.db_engine import engine
 from DB.ct_strategy.repositories.ct_repo import CTRepo
 import asyncio
@@ -47,6 +47,8 @@ class CycleTrader(Strategy):
         self.hedge_sl = 100
         self.prevent_opposing_trades = True
         self.last_candle_time = None
+        # per-tick {symbol: (ask, bid, pips)} snapshot shared by all cycles
+        self._quotes = {}
         self.init_settings()
 
     def initialize(self, config, settings):
@@ -290,7 +292,7 @@ class CycleTrader(Strategy):
                 user_id = content["user_id"]
                 cycle_id = content['id']
                 cycle_data = self.local_api.get_cycle_by_remote_id(cycle_id)
-                seleced_cycle = cycle(
+                seleced_cycle = make_cycle(
                     cycle_data, self.meta_trader, self.meta_trader, "db")
                 seleced_cycle.close_cycle(sent_by_admin, user_id, username)
                 self.client.update_CT_cycle_by_id(
@@ -314,7 +316,7 @@ class CycleTrader(Strategy):
             elif message == "close_all_cycles":
                 active_cycles = await self.get_all_active_cycles()
                 for cycle_data in active_cycles:
-                    cycle_obj = cycle(cycle_data, self.meta_trader, self, "db")
+                    cycle_obj = make_cycle(cycle_data, self.meta_trader, self, "db")
                     cycle_obj.close_cycle(
                         content["sent_by_admin"], content["user_id"], content["user_name"])
                     self.client.update_CT_cycle_by_id(
@@ -359,6 +361,23 @@ class CycleTrader(Strategy):
 
             self.client.send_log(data)
 
+    def get_quote(self, symbol):
+        """
+        This function returns the quote of a symbol for the current tick.
+
+        Parameters:
+        symbol (str): The symbol to quote.
+
+        Returns:
+        tuple: The (ask, bid, pips) of the symbol.
+        """
+        quote = self._quotes.get(symbol)
+        if quote is None:
+            symbol_info = self.meta_trader.get_symbol_info(symbol)
+            quote = (symbol_info.ask, symbol_info.bid, symbol_info.point * 10)
+            self._quotes[symbol] = quote
+        return quote
+
     def string_to_array(self, string):
         """
         This function converts a string to an array.
@@ -425,7 +444,7 @@ class CycleTrader(Strategy):
                 "threshold_upper": upper_threshold,
                 "threshold_lower": lower_threshold,
             }
-            New_cycle = cycle(data, self.meta_trader, self.bot)
+            New_cycle = make_cycle(data, self.meta_trader, self.bot)
             New_cycle.open_price = order1[0].price_open
             if order1:
                 order_obj = order(
@@ -489,7 +508,7 @@ class CycleTrader(Strategy):
 
                 # Check existing cycles to see if there's already a buy or sell at this level
                 for cycle_data in active_cycles:
-                    cycle_obj = cycle(cycle_data, self.meta_trader, self, "db")
+                    cycle_obj = make_cycle(cycle_data, self.meta_trader, self, "db")
 
                     # Check if the cycle is at current level using the adaptive buffer
                     is_at_up_level = abs(
@@ -560,6 +579,8 @@ class CycleTrader(Strategy):
         """
         while True:
             try:
+                # start every tick with a fresh quote snapshot
+                self._quotes.clear()
                 active_cycles = await self.get_all_active_cycles()
                 New_cycles_Restrition = False
 
@@ -572,7 +593,7 @@ class CycleTrader(Strategy):
                     down_price = bid-(self.autotrade_pips_restriction/2)*pips
 
                     for cycle_data in active_cycles:
-                        cycle_obj = cycle(
+                        cycle_obj = make_cycle(
                             cycle_data, self.meta_trader, self, "db")
                         if len(cycle_obj.orders) <= 2 and len(cycle_obj.closed) == 0 and len(cycle_obj.hedge) == 0:
                             if cycle_obj.open_price > 0:
@@ -581,7 +602,7 @@ class CycleTrader(Strategy):
 
                 tasks = []
                 for cycle_data in active_cycles:
-                    cycle_obj = cycle(cycle_data, self.meta_trader, self, "db")
+                    cycle_obj = make_cycle(cycle_data, self.meta_trader, self, "db")
                     if not self.stop:
                         tasks.append(cycle_obj.manage_cycle_orders(
                             self.zone_forward, self.zone_forward2))
@@ -214,7 +214,8 @@ class CycleTraderV2(BaseStrategy):
                         'order_type': 'market'
                     }
 
-                    mt_order = self.meta_trader.buy(
+                    mt_order = await self.meta_trader.send_order_async(
+                        self.meta_trader.buy,
                         self.symbol, self.lot_sizes[0], self.bot.magic,
                         0, 0, "PIPS", self.slippage, "initial"
                     )
@@ -257,7 +258,8 @@ class CycleTraderV2(BaseStrategy):
                         'order_type': 'pending'
                     }
 
-                    mt_order = self.meta_trader.buy_stop(
+                    mt_order = await self.meta_trader.send_order_async(
+                        self.meta_trader.buy_stop,
                         self.symbol, price, self.lot_sizes[0], self.bot.magic,
                         0, 0, "PIPS", self.slippage, "pending"
                     )
@@ -275,7 +277,8 @@ class CycleTraderV2(BaseStrategy):
                         'order_type': 'pending'
                     }
 
-                    mt_order = self.meta_trader.buy_limit(
+                    mt_order = await self.meta_trader.send_order_async(
+                        self.meta_trader.buy_limit,
                         self.symbol, price, self.lot_sizes[0], self.bot.magic,
                         0, 0, "PIPS", self.slippage, "pending"
                     )
@@ -314,7 +317,8 @@ class CycleTraderV2(BaseStrategy):
                 }
 
                 # Execute market order
-                mt_order = self.meta_trader.sell(
+                mt_order = await self.meta_trader.send_order_async(
+                    self.meta_trader.sell,
                     self.symbol, self.lot_sizes[0], self.bot.magic,
                     0, 0, "PIPS", self.slippage, "initial"
                 )
@@ -353,7 +357,8 @@ class CycleTraderV2(BaseStrategy):
                         'order_type': 'pending'
                     }
 
-                    mt_order = self.meta_trader.sell_stop(
+                    mt_order = await self.meta_trader.send_order_async(
+                        self.meta_trader.sell_stop,
                         self.symbol, price, self.lot_sizes[0], self.bot.magic,
                         0, 0, "PIPS", self.slippage, "pending"
                     )
@@ -371,7 +376,8 @@ class CycleTraderV2(BaseStrategy):
                         'order_type': 'pending'
                     }
 
-                    mt_order = self.meta_trader.sell_limit(
+                    mt_order = await self.meta_trader.send_order_async(
+                        self.meta_trader.sell_limit,
                         self.symbol, price, self.lot_sizes[0], self.bot.magic,
                         0, 0, "PIPS", self.slippage, "pending"
                     )
@@ -422,14 +428,17 @@ class CycleTraderV2(BaseStrategy):
                 }
 
                 # Execute both orders
-                buy_mt_order = self.meta_trader.buy(
-                    self.symbol, self.lot_sizes[0], self.bot.magic,
-                    0, 0, "PIPS", self.slippage, "initial"
-                )
-
-                sell_mt_order = self.meta_trader.sell(
-                    self.symbol, self.lot_sizes[0], self.bot.magic,
-                    0, 0, "PIPS", self.slippage, "initial"
+                buy_mt_order, sell_mt_order = await asyncio.gather(
+                    self.meta_trader.send_order_async(
+                        self.meta_trader.buy,
+                        self.symbol, self.lot_sizes[0], self.bot.magic,
+                        0, 0, "PIPS", self.slippage, "initial"
+                    ),
+                    self.meta_trader.send_order_async(
+                        self.meta_trader.sell,
+                        self.symbol, self.lot_sizes[0], self.bot.magic,
+                        0, 0, "PIPS", self.slippage, "initial"
+                    )
                 )
 
                 if buy_mt_order and sell_mt_order:
@@ -601,7 +610,8 @@ class CycleTraderV2(BaseStrategy):
                 'order_type': 'auto'
             }
 
-            mt_order = self.meta_trader.buy(
+            mt_order = await self.meta_trader.send_order_async(
+                self.meta_trader.buy,
                 self.symbol, self.lot_sizes[0], self.bot.magic,
                 0, 0, "PIPS", self.slippage, "auto"
             )
@@ -636,7 +646,8 @@ class CycleTraderV2(BaseStrategy):
                 'order_type': 'auto'
             }
 
-            mt_order = self.meta_trader.sell(
+            mt_order = await self.meta_trader.send_order_async(
+                self.meta_trader.sell,
                 self.symbol, self.lot_sizes[0], self.bot.magic,
                 0, 0, "PIPS", self.slippage, "auto"
             )
@@ -767,7 +778,8 @@ class CycleTraderV2(BaseStrategy):
             for order_id, order_data in self.active_orders.items():
                 if order_data.get('ticket') == order_ticket:
                     # Close order in MetaTrader
-                    success = self.meta_trader.close_order(order_ticket)
+                    success = await self.meta_trader.send_order_async(
+                        self.meta_trader.close_order, order_ticket)
 
                     if success:
                         # Update database
@@ -877,12 +889,14 @@ class CycleTraderV2(BaseStrategy):
 
             # Create new order
             if cycle_type == 'BUY':
-                mt_order = self.meta_trader.buy(
+                mt_order = await self.meta_trader.send_order_async(
+                    self.meta_trader.buy,
                     self.symbol, lot_size, self.bot.magic,
                     0, 0, "PIPS", self.slippage, f"zone_forward_{order_index}"
                 )
             else:
-                mt_order = self.meta_trader.sell(
+                mt_order = await self.meta_trader.send_order_async(
+                    self.meta_trader.sell,
                     self.symbol, lot_size, self.bot.magic,
                     0, 0, "PIPS", self.slippage, f"zone_forward_{order_index}"
                 )
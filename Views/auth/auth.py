@@ -1,20 +1,24 @@
 from Views.globals.app_logger import app_logger
-from Views.globals.app_configs import AppConfigs
+from Views.globals.app_configs import get_app_configs
 from helpers.store import store
 from helpers.actions_creators import add_user, add_mt5, GetUser
-from Api.APIHandler import API
 # from Views.globals.app_state import store
 import asyncio
-from Bots.account import Account
-
-from Orders.orders_manager import orders_manager
-from cycles.cycles_manager import cycles_manager
-from helpers.store import store
 
 import multiprocessing
 from multiprocessing import Queue
 import logging
-from helpers.sync import MT5_LOCK, sync_manager
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import TYPE_CHECKING
+
+# The API, account and manager modules pull in the trading and database
+# stacks; they are imported where a login actually needs them so the app
+# can start and render without loading them
+if TYPE_CHECKING:
+    from Api.APIHandler import API
 
 # Create a Manager object
 
@@ -30,6 +34,42 @@ from helpers.sync import MT5_LOCK, sync_manager
 # Authenticate with the API
 # get accounts
 
+# Recent successful logins, so re-authenticating the same user shortly after
+# (UI reload, retry) skips the remote round trip. Entries are never evicted
+# early: a password change or logout takes effect once LOGIN_CACHE_TTL
+# seconds have passed since the cached login
+LOGIN_CACHE_TTL = 60
+LOGIN_CACHE_MAX_SIZE = 1024
+_login_cache: dict[str, tuple[float, dict, "API"]] = {}
+_login_cache_lock = threading.Lock()
+
+
+def _login_cache_key(username: str, password: str) -> str:
+    return hashlib.sha256(f"{username}:{password}".encode()).hexdigest()
+
+
+def _get_cached_login(key: str):
+    with _login_cache_lock:
+        entry = _login_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[0]:
+            del _login_cache[key]
+            return None
+        return entry[1], entry[2]
+
+
+def _cache_login(key: str, user_data: dict, auth: "API"):
+    with _login_cache_lock:
+        if len(_login_cache) >= LOGIN_CACHE_MAX_SIZE:
+            now = time.monotonic()
+            for expired in [k for k, entry in _login_cache.items() if entry[0] <= now]:
+                del _login_cache[expired]
+            if len(_login_cache) >= LOGIN_CACHE_MAX_SIZE:
+                # drop the oldest entry
+                del _login_cache[next(iter(_login_cache))]
+        _login_cache[key] = (time.monotonic() + LOGIN_CACHE_TTL, user_data, auth)
+
 
 async def login(
     username: str, password: str
@@ -45,11 +85,19 @@ async def login(
 
         # On successful login, set the token in the AppState
         # ******* Do other stuff Here ********
-        app_configs = AppConfigs()
-        auth = API(app_configs.pb_url)
-        user_data = auth.login(username, password)
-        if user_data is None:
-            return (False, "Login failed")
+        cache_key = _login_cache_key(username, password)
+        cached = _get_cached_login(cache_key)
+        if cached is not None:
+            user_data, auth = cached
+        else:
+            from Api.APIHandler import API
+
+            app_configs = get_app_configs()
+            auth = API(app_configs.pb_url)
+            user_data = auth.login(username, password)
+            if user_data is None:
+                return (False, "Login failed")
+            _cache_login(cache_key, user_data, auth)
         store.dispatch(add_user(user_data, auth, username, password))
 
         # return success status and messge
@@ -58,15 +106,17 @@ async def login(
     except Exception as e:
         # Show snackbar with the error message
         # # log the error
-        app_logger.error(f"Login failed: {e}")
+        app_logger.error("Login failed: %s", e)
         return (False, "Login failed")
 
 
 # launch the metatrader
 def launch_metatrader(data, authorized):
     from MetaTrader.MT5 import MetaTrader
-    import logging
-    import time
+    from Api.APIHandler import API
+    from Bots.account import Account
+    from Orders.orders_manager import orders_manager
+    from cycles.cycles_manager import cycles_manager
     from helpers.sync import MT5_LOCK, sync_manager
 
     # Configure additional logging for synchronization issues
@@ -84,6 +134,16 @@ def launch_metatrader(data, authorized):
     server_username = data.get('server_username')
     server_password = data.get('server_password')
     try:
+        # The remote API login does not depend on MT5, so it runs in a worker
+        # thread while the terminal starts and the account is checked
+        app_configs = get_app_configs()
+        auth = API(app_configs.pb_url)
+        auth_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="remote-login")
+        auth_future = auth_executor.submit(
+            auth.login, server_username, server_password)
+        auth_executor.shutdown(wait=False)
+
         # ******* Do other stuff Here ********
         expert = MetaTrader(username, password, server)
         logged = expert.initialize(program_path)
@@ -103,19 +163,17 @@ def launch_metatrader(data, authorized):
                 return False
 
             app_logger.info(
-                f"Successfully connected to MetaTrader 5 account: {acc['login']}")
+                "Successfully connected to MetaTrader 5 account: %s", acc['login'])
             sync_logger.info(
-                f"MT5 Connection established for account: {acc['login']}")
+                "MT5 Connection established for account: %s", acc['login'])
         except Exception as acc_error:
             app_logger.error(
-                f"Error accessing MT5 account information: {acc_error}")
+                "Error accessing MT5 account information: %s", acc_error)
             authorized.put(False)
             return False
 
         # Connect to remote API
-        app_configs = AppConfigs()
-        auth = API(app_configs.pb_url)
-        auth_result = auth.login(server_username, server_password)
+        auth_result = auth_future.result()
 
         if not auth_result:
             app_logger.error("Failed to authenticate with remote API")
@@ -139,29 +197,29 @@ def launch_metatrader(data, authorized):
 
         async def main():
             try:
-                # Start account background task
-                task1 = asyncio.create_task(user_account.run_in_background())
+                # One task group owns the background tasks, so a failure or
+                # shutdown cancels all of them together
+                async with asyncio.TaskGroup() as tg:
+                    # Start account background task
+                    tg.create_task(user_account.run_in_background())
 
-                # Add a small delay between task starts to prevent initial race conditions
-                await asyncio.sleep(1)
+                    # Add a small delay between task starts to prevent initial race conditions
+                    await asyncio.sleep(1)
 
-                # Start orders manager with error handling
-                task2 = asyncio.create_task(OrdersManager.run_in_thread())
+                    # Start orders manager with error handling
+                    tg.create_task(OrdersManager.run_in_thread())
 
-                # Add another delay before cycles manager
-                await asyncio.sleep(1)
+                    # Add another delay before cycles manager
+                    await asyncio.sleep(1)
 
-                # Start cycles manager with error handling
-                task3 = asyncio.create_task(cyclesManager.run_in_thread())
+                    # Start cycles manager with error handling
+                    tg.create_task(cyclesManager.run_in_thread())
 
-                # Log successful startup
-                sync_logger.info("All background tasks started successfully")
-
-                # Wait for all tasks
-                await asyncio.gather(task1, task2, task3)
+                    # Log successful startup
+                    sync_logger.info("All background tasks started successfully")
             except Exception as task_error:
-                app_logger.error(f"Error in background tasks: {task_error}")
-                sync_logger.error(f"Background task error: {task_error}")
+                app_logger.error("Error in background tasks: %s", task_error)
+                sync_logger.error("Background task error: %s", task_error)
 
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
@@ -184,19 +242,38 @@ def launch_metatrader(data, authorized):
     except Exception as e:
         # Show snackbar with the error message
         # log the error
-        app_logger.error(f"Metatrader launch failed: {e}")
-        sync_logger.critical(f"Fatal error in Metatrader launch: {e}")
+        app_logger.error("Metatrader launch failed: %s", e)
+        sync_logger.critical("Fatal error in Metatrader launch: %s", e)
         authorized.put(False)
         return False
 
 
+# (MT5 login, server, terminal path) -> the process holding that terminal
+# session and running its account, orders and cycles managers
+_metatrader_processes: dict[tuple[str, str, str], multiprocessing.Process] = {}
+
+
+def _metatrader_session_key(data) -> tuple[str, str, str]:
+    return (str(data.get('username')), str(data.get('server')), str(data.get('program_path')))
+
+
 def launch_metatrader_in_process(data):
+    # A repeated login for a session that is already live reuses it instead
+    # of initializing the terminal and starting the managers again
+    process_key = _metatrader_session_key(data)
+    running = _metatrader_processes.get(process_key)
+    if running is not None and running.is_alive():
+        app_logger.info(
+            "MetaTrader account %s on %s is already running", process_key[0], process_key[1])
+        return running.is_alive
+
     # ns=multiprocessing.Manager().Namespace()
     authorized = Queue()
     p = multiprocessing.Process(
         target=launch_metatrader, args=(data, authorized))
     p.daemon = True
     p.start()
+    _metatrader_processes[process_key] = p
     return p.is_alive
 
     # store.dispatch(add_mt5(user, account, expert))
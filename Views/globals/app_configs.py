@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 
 
@@ -8,3 +10,9 @@ class AppConfigs(BaseSettings):
     # Pocketbase configs
     pb_url: str = "https://pdapp.fppatrading.com"  # the pocketbase url
     auth_collection: str = "users"  # the collection to authenticate with, ex: 'users'
+
+
+@lru_cache(maxsize=1)
+def get_app_configs() -> AppConfigs:
+    """The app configs, read from the environment once per process"""
+    return AppConfigs()
@@ -0,0 +1,24 @@
+import flet
+
+# Shared headline styles; a TextStyle is never mutated after creation, so one
+# instance serves every page render
+HEADLINE_STYLE_LARGE = flet.TextStyle(
+    size=28,
+    weight=flet.FontWeight.BOLD,
+    color=flet.Colors.PRIMARY,
+)
+HEADLINE_STYLE_MEDIUM = flet.TextStyle(
+    size=24,
+    weight=flet.FontWeight.BOLD,
+    color=flet.Colors.PRIMARY,
+)
+
+
+def primary_button(text: str, on_click) -> flet.ElevatedButton:
+    """A fixed-width button used for the main navigation entries"""
+    return flet.ElevatedButton(
+        text=text,
+        expand=False,
+        on_click=on_click,
+        width=300,
+    )
@@ -1,6 +1,7 @@
 import flet
 from helpers.store import store
 from Views.globals.app_router import AppRoutes
+from Views.globals.app_theme import HEADLINE_STYLE_LARGE, primary_button
 from fletx import Xview
 
 
@@ -11,19 +12,11 @@ class HomePageView(Xview):
 
         headline = flet.Text(
             value="Patrick Display",
-            style=flet.TextStyle(
-                size=28,
-                weight=flet.FontWeight.BOLD,
-                color=flet.Colors.PRIMARY,
-            ),
+            style=HEADLINE_STYLE_LARGE,
             text_align=flet.TextAlign.CENTER,
         )
-        add_account_button = flet.ElevatedButton(
-            text="Add User",
-            expand=False,
-            on_click=lambda e: self.go(AppRoutes.LOGIN_SUPABASE),
-            width=300,
-        )
+        add_account_button = primary_button(
+            "Add User", lambda e: self.go(AppRoutes.LOGIN_SUPABASE))
 
         states = store.get_state()
         users = states['users']['users']
@@ -33,11 +26,9 @@ class HomePageView(Xview):
             user_buttons.controls.append(
                 flet.Row(
                     controls=[
-                        flet.ElevatedButton(
-                            text=user['name'],
-                            expand=False,
-                            width=300,
-                            on_click=lambda e, user=user: self.go(
+                        primary_button(
+                            user['name'],
+                            lambda e, user=user: self.go(
                                 f'/accounts/{user["id"]}'),
                         )
                     ],
@@ -55,11 +46,9 @@ class HomePageView(Xview):
                 user_buttons.controls.append(
                     flet.Row(
                         controls=[
-                            flet.ElevatedButton(
-                                text=user['name'],
-                                expand=False,
-                                width=300,
-                                on_click=lambda e, user=user: self.go(
+                            primary_button(
+                                user['name'],
+                                lambda e, user=user: self.go(
                                     f'/accounts/{user["id"]}'),
                             )
                         ],
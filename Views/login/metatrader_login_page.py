@@ -3,6 +3,7 @@ import asyncio
 from Views.auth import auth
 from Views.globals.app_logger import app_logger
 from Views.globals.app_router import  AppRoutes
+from Views.globals.app_theme import HEADLINE_STYLE_MEDIUM
 from fletx import Xview
 from helpers.store import store
 from helpers.actions_creators import GetUser
@@ -40,7 +41,8 @@ class Mt5LoginPageView(Xview):
         async def on_login(e):
             login_progress.visible = True
             login_progress.update()
-            await asyncio.sleep(1)
+            # Yield once so the progress bar paints before the launch starts
+            await asyncio.sleep(0)
             data: dict[str, any] = {
                 "username":   username.value,
                 "password":   password.value,
@@ -62,7 +64,7 @@ class Mt5LoginPageView(Xview):
                 mt5_logger.set_mt5_credentials(data)
 
             else:
-                app_logger.error(msg=f"Login failed")
+                app_logger.error("Login failed")
 
         def load_saved_credentials():
             try:
@@ -75,25 +77,25 @@ class Mt5LoginPageView(Xview):
 
                 return credentials
             except Exception as e:
-                app_logger.error(f"Failed to load saved credentials: {e}")
+                app_logger.error("Failed to load saved credentials: %s", e)
                 return None
         credentials = load_saved_credentials()
         headline = flet.Text(
             value="Login to Metatrader 5 ",
-            style=flet.TextStyle(
-                size=24,
-                weight=flet.FontWeight.BOLD,
-                color=flet.Colors.PRIMARY,
-            ),
+            style=HEADLINE_STYLE_MEDIUM,
             text_align=flet.TextAlign.CENTER,
         )
 
+        saved_username, saved_password, saved_server, saved_program_path = (
+            (credentials.username, credentials.password, credentials.server, credentials.program_path)
+            if credentials is not None else ("", "", "", ""))
+
         username = flet.TextField(label="Username", expand=False, width=500,
-                                        value=credentials.username if credentials is not None else "")
+                                        value=saved_username)
         password = flet.TextField(label="Password", password=True, width=500,
-                                        value=credentials.password if credentials is not None else "")
+                                        value=saved_password)
         server = flet.TextField(label="Server", expand=False, width=500,
-                                value=credentials.server if credentials is not None else "")
+                                value=saved_server)
         program_path_picker_dialog = flet.FilePicker(
             on_result=on_program_path_picker_pressed,
         )
@@ -115,7 +117,7 @@ class Mt5LoginPageView(Xview):
         )
 
         program_path_text = flet.Text(
-            value=credentials.program_path if credentials is not None else "",
+            value=saved_program_path,
         )
         login_progress = flet.ProgressBar(visible=False)
         return flet.View(
@@ -3,10 +3,14 @@ import asyncio
 from Views.auth import auth
 from Views.globals.app_logger import app_logger
 from Views.globals.app_router import AppRoutes
+from Views.globals.app_theme import HEADLINE_STYLE_MEDIUM
 from DB.remote_login.repositories.remote_login_repo import RemoteLoginRepo
 from DB.db_engine import engine
 from fletx import Xview
 
+# Shared by every render of the page; the repo sets up its auth service once
+_remote_login_repo = RemoteLoginRepo(engine=engine)
+
 
 class RemoteLoginPageView(Xview):
 
@@ -14,62 +18,61 @@ class RemoteLoginPageView(Xview):
 
         async def retuen_home(e):
             self.go(AppRoutes.HOME)
-            self.update()
 
         async def on_login(e):
             login_progress.visible = True
-            self.update()
+            login_progress.update()
+            # Yield once so the progress bar paints before the login starts
+            await asyncio.sleep(0)
 
-            await asyncio.sleep(1)
             data: dict[str, any] = {
                 "username":    username.value,
                 "password":    password.value,
             }
             result = await auth.login(**data)
             login_progress.visible = False
-            self.update()
             if result[0]:
                 # TODO: navigate to the home page
                 app_logger.info("Login successful, navigating to home page")
-                remote_logger = RemoteLoginRepo(engine=engine)
-                credentials = remote_logger.set_pb_credentials(data)
+                credentials = _remote_login_repo.set_pb_credentials(data)
                 if credentials is None:
+                    login_progress.update()
                     app_logger.error("Failed to save credentials")
                     return
                 self.back()
                 if result[1]:
                     app_logger.info(msg=result[1])
             else:
-                app_logger.error(msg=f"Login failed: {result[1]}")
+                # Only a failed login stays on this page to show the change
+                login_progress.update()
+                app_logger.error("Login failed: %s", result[1])
 
         def load_saved_credentials():
             try:
                 # Assuming `local_auth` has a method `get_credentials` returning a dict with keys 'username' and 'password'
-                remote_logger = RemoteLoginRepo(engine=engine)
-                credentials = remote_logger.get_pb_credintials()
+                credentials = _remote_login_repo.get_pb_credintials()
                 if credentials is None:
                     return None
 
                 return credentials
             except Exception as e:
-                app_logger.error(f"Failed to load saved credentials: {e}")
+                app_logger.error("Failed to load saved credentials: %s", e)
                 return None
 
         credentials = load_saved_credentials()
         headline = flet.Text(
             value="Login to Patrick Server",
-            style=flet.TextStyle(
-                size=24,
-                weight=flet.FontWeight.BOLD,
-                color=flet.Colors.PRIMARY,
-            ),
+            style=HEADLINE_STYLE_MEDIUM,
             text_align=flet.TextAlign.CENTER,
         )
 
+        saved_username, saved_password = (
+            (credentials.username, credentials.password) if credentials is not None else ("", ""))
+
         username = flet.TextField(label="Username", expand=False, width=500,
-                                        value=credentials.username if credentials is not None else "")
+                                  value=saved_username)
         password = flet.TextField(label="Password", password=True, width=500,
-                                        value=credentials.password if credentials is not None else "")
+                                  value=saved_password)
         login_button = flet.Button(
             text="Login",
             on_click=on_login,
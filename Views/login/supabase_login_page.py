@@ -9,6 +9,7 @@ from typing import Optional, Dict, Any
 from Views.auth import supabase_auth
 from Views.globals.app_logger import app_logger
 from Views.globals.app_router import AppRoutes
+from Views.globals.app_theme import HEADLINE_STYLE_LARGE
 from fletx import Xview
 
 
@@ -28,7 +29,6 @@ class SupabaseLoginPageView(Xview):
         def return_home(e):
             """Navigate back to home page"""
             self.go(AppRoutes.HOME)
-            self.update()
 
         def on_login(e):
             """Handle login button click"""
@@ -49,12 +49,10 @@ class SupabaseLoginPageView(Xview):
             login_progress.visible = True
             login_button.text = "Logging in..."
             login_button.disabled = True
-            self.update()
+            self.page.update(login_progress, login_button)
 
             try:
-                # Simulate minimum loading time for better UX
                 import time
-                time.sleep(0.5)
 
                 # Attempt login using sync wrapper to avoid event loop conflicts
                 success, message = supabase_auth.login_sync(
@@ -64,7 +62,7 @@ class SupabaseLoginPageView(Xview):
 
                 if success:
                     app_logger.info(
-                        f"Login successful for {email_field.value}")
+                        "Login successful for %s", email_field.value)
                     self.show_success("Login successful! Redirecting...")
 
                     # Small delay before navigation
@@ -74,21 +72,22 @@ class SupabaseLoginPageView(Xview):
                     self.go(AppRoutes.HOME)
                 else:
                     app_logger.error(
-                        f"Login failed for {email_field.value}: {message}")
-                    self.show_error(f"Login failed: {message}")
+                        "Login failed for %s: %s", email_field.value, message)
+                    self.show_error(f"Login failed: {message}", update=False)
 
             except Exception as e:
-                app_logger.error(f"Login error: {e}")
+                app_logger.error("Login error: %s", e)
                 self.show_error(
-                    "An unexpected error occurred. Please try again.")
+                    "An unexpected error occurred. Please try again.", update=False)
 
             finally:
-                # Hide loading state
+                # Hide loading state, flushing any message in the same update
                 self.login_in_progress = False
                 login_progress.visible = False
                 login_button.text = "Login"
                 login_button.disabled = False
-                self.update()
+                self.page.update(self.status_message,
+                                 login_progress, login_button)
 
         def on_forgot_password(e):
             """Handle forgot password click"""
@@ -111,11 +110,7 @@ class SupabaseLoginPageView(Xview):
         # UI Components
         page_title = flet.Text(
             value="Peaceful Investment Trading System",
-            style=flet.TextStyle(
-                size=28,
-                weight=flet.FontWeight.BOLD,
-                color=flet.Colors.PRIMARY,
-            ),
+            style=HEADLINE_STYLE_LARGE,
             text_align=flet.TextAlign.CENTER,
         )
 
@@ -269,31 +264,32 @@ class SupabaseLoginPageView(Xview):
             bgcolor="#f5f5f5",
         )
 
-    def show_error(self, message: str):
+    def show_error(self, message: str, update: bool = True):
         """Show error message"""
         self.status_message.value = message
         self.status_message.color = flet.Colors.ERROR
         self.status_message.visible = True
-        self.update()
+        if update:
+            self.status_message.update()
 
     def show_success(self, message: str):
         """Show success message"""
         self.status_message.value = message
         self.status_message.color = flet.Colors.PRIMARY
         self.status_message.visible = True
-        self.update()
+        self.status_message.update()
 
     def show_info(self, message: str):
         """Show info message"""
         self.status_message.value = message
         self.status_message.color = flet.Colors.ON_SURFACE_VARIANT
         self.status_message.visible = True
-        self.update()
+        self.status_message.update()
 
     def clear_message(self):
         """Clear status message"""
         self.status_message.visible = False
-        self.update()
+        self.status_message.update()
 
 
 class QuickLoginView(Xview):
@@ -314,13 +310,13 @@ class QuickLoginView(Xview):
                 success, message = await supabase_auth.login(email, password)
 
                 if success:
-                    app_logger.info(f"Quick login successful for {email}")
+                    app_logger.info("Quick login successful for %s", email)
                     self.go(AppRoutes.HOME)
                 else:
-                    app_logger.error(f"Quick login failed: {message}")
+                    app_logger.error("Quick login failed: %s", message)
 
             except Exception as e:
-                app_logger.error(f"Quick login error: {e}")
+                app_logger.error("Quick login error: %s", e)
 
         async def on_test_user_1(e):
             await quick_login("test@example.com", "testpassword")
@@ -80,8 +80,9 @@ class cycle:
                 self.remove_pending_order(order_ticket)
     # create cycle data
 
-    def to_dict(self):
-        data = {
+    # fields shared by the local row and the remote payload
+    def _build_base_dict(self):
+        return {
             "bot": self.bot_id,
             "account": self.account,
             "is_pending": self.is_pending,
@@ -92,47 +93,36 @@ class cycle:
             "zone_index": self.zone_index,
             "status": self.status,
             "symbol": self.symbol,
+            "closing_method": self.closing_method,
+            "opened_by": self.opened_by,
+            "cycle_type": self.cycle_type,
+        }
+
+    def to_dict(self):
+        data = self._build_base_dict()
+        data.update({
             "total_profit": self.total_profit,
             "total_volume": self.total_volume,
-            "closing_method": self.closing_method,
             "initial": self.initial,
             "hedge": self.hedge,
             "pending": self.pending,
             "closed": self.closed,
             "recovery": self.recovery,
             "max_recovery": self.max_recovery,
-            "opened_by": self.opened_by,
             "remote_id": self.cycle_id,
-            "cycle_type": self.cycle_type,
-
-        }
+        })
 
         return data
     # create cycle  data to  send to remote server
 
     def to_remote_dict(self):
-        data = {
-            "bot": self.bot_id,
-            "account": self.account,
-            "is_pending": self.is_pending,
-            "is_closed": self.is_closed,
-            "lower_bound": self.lower_bound,
-            "upper_bound": self.upper_bound,
-            "lot_idx": self.lot_idx,
-            "zone_index": self.zone_index,
-            "status": self.status,
-            "symbol": self.symbol,
+        data = self._build_base_dict()
+        data.update({
             "total_profit": round(float(self.total_profit), 2),
             "total_volume": round(float(self.total_volume), 2),
-            "closing_method": self.closing_method,
             "orders": {
                 "orders": []},
-            "opened_by": self.opened_by,
-            "cycle_type": self.cycle_type,
-
-
-
-        }
+        })
         #  go through the orders and add them to the data
         for order_ticket in self.orders:
             order_data = self.local_api.get_order_by_ticket(order_ticket)
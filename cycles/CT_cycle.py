@@ -1,113 +1,160 @@
 import datetime
+import logging
 from Orders.order import order
 import MetaTrader5 as Mt5
 from DB.db_engine import engine
 from DB.ct_strategy.repositories.ct_repo import CTRepo
 from types import SimpleNamespace
 import json
+import orjson
+from itertools import chain
 from helpers.sync import verify_order_status, sync_delay, MT5_LOCK
 
+logger = logging.getLogger(__name__)
+
+
+def _as_price_level_list(value):
+    """Normalize stored done_price_levels into a list of {"price", "direction"} dicts"""
+    # If it's a dictionary (from PocketBase), convert to empty list
+    if isinstance(value, dict):
+        return []
+    # If it's a JSON string, parse it
+    elif isinstance(value, str):
+        try:
+            parsed = json.loads(value)
+            value = [] if isinstance(parsed, dict) else parsed
+        except:
+            return []
+    # Make sure it's a list
+    elif value is None:
+        return []
+    return [level for level in map(_as_price_level, value) if level is not None]
+
+
+def _as_price_level(level):
+    """One done price level as a dict, or None if it cannot be read
+
+    Also reads the "price_DIRECTION" strings CTCycleV2 wrote before it
+    stored dicts
+    """
+    try:
+        if isinstance(level, dict):
+            return {"price": float(level["price"]), "direction": level["direction"]}
+        if isinstance(level, str):
+            price, _, direction = level.rpartition("_")
+            return {"price": float(price), "direction": direction}
+        raise TypeError(level)
+    except (KeyError, TypeError, ValueError):
+        logger.warning(f"Skipping unreadable done price level: {level!r}")
+        return None
+
 
 class cycle:
+    # field names that differ between DB rows and remote/dict payloads
+    _cycle_id_field = "id"
+    _threshold_upper_field = "threshold_top"
+    _threshold_lower_field = "threshold_bottom"
+    # only DB-backed cycles start out in sync with the stored row
+    _loaded_from_db = False
+
+    def __new__(cls, data=None, mt5=None, bot=None, source=None):
+        # plain cycle(...) calls are routed to the class for their source
+        if cls is cycle:
+            cls = _CYCLE_BY_SOURCE.get(source, CycleFromDict)
+        return super().__new__(cls)
+
     def __init__(self, data, mt5, bot, source=None):
         if data is None:
             raise ValueError("Cannot initialize CTcycle with None data")
 
-        # Helper function to safely get attributes
-        def safe_get(obj, attr, default=None):
-            if source == "db":
-                value = getattr(obj, attr, default)
-            elif source == "remote":
-                value = getattr(obj, attr, default)
-            else:
-                value = obj.get(attr, default)
-
-            # Special handling for done_price_levels to ensure it's always a list
-            if attr == "done_price_levels":
-                # If it's a dictionary (from PocketBase), convert to empty list
-                if isinstance(value, dict):
-                    return []
-                # If it's a JSON string, parse it
-                elif isinstance(value, str):
-                    try:
-                        parsed = json.loads(value)
-                        return [] if isinstance(parsed, dict) else parsed
-                    except:
-                        return []
-                # Make sure it's a list
-                elif value is None:
-                    return []
-
-            return value
-
-        self.bot_id = safe_get(data, "bot", "")
-        self.initial = safe_get(data, "initial", [])
-        self.hedge = safe_get(data, "hedge", [])
-        self.recovery = safe_get(data, "recovery", [])
-        self.pending = safe_get(data, "pending", [])
-        self.closed = safe_get(data, "closed", [])
-        self.threshold = safe_get(data, "threshold", [])
-        self.is_closed = safe_get(data, "is_closed", False)
-        self.lower_bound = safe_get(data, "lower_bound", 0)
-        self.upper_bound = safe_get(data, "upper_bound", 0)
-        self.lot_idx = safe_get(data, "lot_idx", 0)
-        self.zone_index = safe_get(data, "zone_index", 0)
-        self.status = safe_get(data, "status", "")
-        self.symbol = safe_get(data, "symbol", "")
-        self.total_profit = safe_get(data, "total_profit", 0)
-        self.total_volume = safe_get(data, "total_volume", 0)
-        self.closing_method = safe_get(data, "closing_method", {})
-        self.opened_by = safe_get(data, "opened_by", {})
-        self.account = safe_get(data, "account", "")
-
-        # Handle IDs safely
-        self.id = safe_get(data, "id", "")
-        self.cycle_id = safe_get(
-            data, "remote_id", "") if source == "db" else safe_get(data, "id", "")
-        self.is_pending = safe_get(data, "is_pending", False)
-
         self.local_api = CTRepo(engine=engine)
         self.mt5 = mt5
         self.bot = bot
-
-        self.threshold_upper = safe_get(
-            data, "threshold_upper", 0) if source == "db" else safe_get(data, "threshold_top", 0)
-        self.threshold_lower = safe_get(
-            data, "threshold_lower", 0) if source == "db" else safe_get(data, "threshold_bottom", 0)
-        self.cycle_type = safe_get(data, "cycle_type", "")
-
-        # Safely handle orders
-        if source == 'remote':
-            orders_data = safe_get(data, "orders", {})
-            if isinstance(orders_data, dict):
-                orders_list = orders_data.get("orders", [])
-                self.orders = self.get_orders_from_remote(orders_list)
-            else:
-                self.orders = []
-        else:
-            self.orders = self.combine_orders()
-
-        # Calculate open price safely
         self.open_price = 0
-        if len(self.initial) > 0:
-            initial_order = self.local_api.get_order_by_ticket(self.initial[0])
-            if initial_order:
-                self.open_price = initial_order.open_price
-
-        self.base_threshold_lower = safe_get(
-            data, "base_threshold_lower", self.threshold_lower)
-        self.base_threshold_upper = safe_get(
-            data, "base_threshold_upper", self.threshold_upper)
+        self._open_price_ticket = None
+        self.refresh(data)
+
+    def refresh(self, data):
+        """Re-read every field from a newer row of the same source, in place"""
+        get = self._read_field
+        self.bot_id = get(data, "bot", "")
+        self.initial = get(data, "initial", [])
+        self.hedge = get(data, "hedge", [])
+        self.recovery = get(data, "recovery", [])
+        self.pending = get(data, "pending", [])
+        self.closed = get(data, "closed", [])
+        self.threshold = get(data, "threshold", [])
+        # kind -> order list so removals don't branch on the stored kind
+        self._kind_list = {
+            "initial": self.initial,
+            "hedge": self.hedge,
+            "recovery": self.recovery,
+            "pending": self.pending,
+            "threshold": self.threshold,
+        }
+        self.is_closed = get(data, "is_closed", False)
+        self.lower_bound = get(data, "lower_bound", 0)
+        self.upper_bound = get(data, "upper_bound", 0)
+        self.lot_idx = get(data, "lot_idx", 0)
+        self.zone_index = get(data, "zone_index", 0)
+        self.status = get(data, "status", "")
+        self.symbol = get(data, "symbol", "")
+        self.total_profit = get(data, "total_profit", 0)
+        self.total_volume = get(data, "total_volume", 0)
+        self.closing_method = get(data, "closing_method", {})
+        self.opened_by = get(data, "opened_by", {})
+        self.account = get(data, "account", "")
+
+        # Handle IDs safely
+        self.id = get(data, "id", "")
+        self.cycle_id = get(data, self._cycle_id_field, "")
+        self.is_pending = get(data, "is_pending", False)
+
+        # thresholds are kept rounded so the serializers can copy them as-is
+        self.threshold_upper = round(
+            float(get(data, self._threshold_upper_field, 0)), 2)
+        self.threshold_lower = round(
+            float(get(data, self._threshold_lower_field, 0)), 2)
+        self.cycle_type = get(data, "cycle_type", "")
+
+        self.orders = self._load_orders(data)
+
+        # Calculate open price safely, only looking it up again when the
+        # first initial order changes
+        first_initial = self.initial[0] if self.initial else None
+        if first_initial != self._open_price_ticket:
+            self.open_price = 0
+            self._open_price_ticket = None
+            if first_initial is not None:
+                initial_order = self.local_api.get_order_by_ticket(first_initial)
+                if initial_order:
+                    self.open_price = initial_order.open_price
+                    self._open_price_ticket = first_initial
+
+        self.base_threshold_lower = round(float(get(
+            data, "base_threshold_lower", self.threshold_lower)), 2)
+        self.base_threshold_upper = round(float(get(
+            data, "base_threshold_upper", self.threshold_upper)), 2)
         self.buyLots = 0
         self.sellLots = 0
 
         # New fields for zone forward threshold order system
-        self.done_price_levels = safe_get(data, "done_price_levels", [])
-        self.current_direction = safe_get(data, "current_direction", "BUY")
-        self.initial_threshold_price = safe_get(
+        self.done_price_levels = _as_price_level_list(
+            get(data, "done_price_levels", []))
+        self.current_direction = get(data, "current_direction", "BUY")
+        self.initial_threshold_price = get(
             data, "initial_threshold_price", self.open_price)
-        self.direction_switched = safe_get(data, "direction_switched", False)
-        self.next_order_index = safe_get(data, "next_order_index", 0)
+        self.direction_switched = get(data, "direction_switched", False)
+        self.next_order_index = get(data, "next_order_index", 0)
+        # last state written to the DB, lets update_cycle skip no-op writes
+        self._last_snapshot = self._snapshot() if self._loaded_from_db else None
+
+    @staticmethod
+    def _read_field(data, attr, default=None):
+        return data.get(attr, default)
+
+    def _load_orders(self, data):
+        return self.combine_orders()
 
     def combine_orders(self):
         return self.initial + self.hedge + self.pending + self.recovery + self.threshold
@@ -132,104 +179,103 @@ class cycle:
                 order_ticket = order_obj.ticket
                 result.append(order_ticket)
 
-                if order_kind == "initial":
-                    self.remove_initial_order(order_ticket)
-                elif order_kind == "hedge":
-                    self.remove_hedge_order(order_ticket)
-                elif order_kind == "recovery":
-                    self.remove_recovery_order(order_ticket)
-                elif order_kind == "pending":
-                    self.remove_pending_order(order_ticket)
-                elif order_kind == "threshold":
-                    self.remove_threshold_order(order_ticket)
+                self._remove_tracked_order(order_kind, order_ticket)
             except Exception as e:
                 print(f"Error processing order from remote: {e}")
 
         return result
 
-    def to_dict(self):
-        data = {
-
+    # fields shared by the local row and the remote payload
+    def _build_base_dict(self):
+        return {
             "bot": self.bot_id,
             "account": self.account,
             "is_pending": self.is_pending,
             "is_closed": self.is_closed,
-            "lower_bound": self.lower_bound,
-            "upper_bound": self.upper_bound,
             "lot_idx": self.lot_idx,
             "zone_index": self.zone_index,
             "status": self.status,
             "symbol": self.symbol,
-            "total_profit": self.total_profit,
-            "total_volume": self.total_volume,
             "closing_method": self.closing_method,
-            "initial": self.initial,
-            "hedge": self.hedge,
-            "pending": self.pending,
-            "closed": self.closed,
-            "recovery": self.recovery,
-            "threshold": self.threshold,
             "opened_by": self.opened_by,
-            "remote_id": self.cycle_id,
-            "threshold_upper": round(float(self.threshold_upper), 2),
-            "threshold_lower": round(float(self.threshold_lower), 2),
-            "base_threshold_lower": round(float(self.base_threshold_lower), 2),
-            "base_threshold_upper": round(float(self.base_threshold_upper), 2),
             "cycle_type": self.cycle_type,
             # New fields for zone forward
             "done_price_levels": self.done_price_levels,
             "current_direction": self.current_direction,
             "initial_threshold_price": self.initial_threshold_price,
             "direction_switched": self.direction_switched,
-            "next_order_index": self.next_order_index
-
+            "next_order_index": self.next_order_index,
         }
 
+    def to_dict(self):
+        data = self._build_base_dict()
+        data.update({
+            "lower_bound": self.lower_bound,
+            "upper_bound": self.upper_bound,
+            "total_profit": self.total_profit,
+            "total_volume": self.total_volume,
+            "initial": self.initial,
+            "hedge": self.hedge,
+            "pending": self.pending,
+            "closed": self.closed,
+            "recovery": self.recovery,
+            "threshold": self.threshold,
+            "remote_id": self.cycle_id,
+            "threshold_upper": self.threshold_upper,
+            "threshold_lower": self.threshold_lower,
+            "base_threshold_lower": self.base_threshold_lower,
+            "base_threshold_upper": self.base_threshold_upper,
+        })
+
         return data
     # create cycle  data to  send to remote server
 
     def to_remote_dict(self):
-        data = {
-            "bot": self.bot_id,
-            "account": self.account,
-            "is_pending": self.is_pending,
-            "is_closed": self.is_closed,
+        data = self._build_base_dict()
+        data.update({
             "lower_bound": round(self.lower_bound, 2),
             "upper_bound": round(self.upper_bound, 2),
-            "lot_idx": self.lot_idx,
-            "zone_index": self.zone_index,
-            "status": self.status,
-            "symbol": self.symbol,
             "total_profit": round(float(self.total_profit), 2),
             "total_volume": round(float(self.total_volume), 2),
-            "closing_method": self.closing_method,
             "orders": {
                 "orders": []},
-            "opened_by": self.opened_by,
-            "cycle_type": self.cycle_type,
-            "threshold_top": round(float(self.threshold_upper), 2),
-            "threshold_bottom": round(float(self.threshold_lower), 2),
-            # New fields for zone forward
-            "done_price_levels": self.done_price_levels,
-            "current_direction": self.current_direction,
-            "initial_threshold_price": self.initial_threshold_price,
-            "direction_switched": self.direction_switched,
-            "next_order_index": self.next_order_index
+            "threshold_top": self.threshold_upper,
+            "threshold_bottom": self.threshold_lower,
+        })
+        #  fetch the open and closed orders in one go and add them to the data
+        rows = self.local_api.get_orders_by_tickets(self.orders + self.closed)
+        data["orders"]["orders"] = [
+            order(rows[ticket], rows[ticket].is_pending, self.mt5,
+                  self.local_api, "db", self.id).to_dict()
+            for ticket in chain(self.orders, self.closed) if ticket in rows]
+        return data
 
-        }
-        #  go through the orders and add them to the data
-        for order_ticket in self.orders:
-            order_data = self.local_api.get_order_by_ticket(order_ticket)
-            order_obj = order(order_data, order_data.is_pending,
-                              self.mt5, self.local_api, "db", self.id)
-            data["orders"]["orders"].append(order_obj.to_dict())
+    # insert a freshly placed MT5 order's row without building an order wrapper
+    def _persist_new_order(self, mt5_order):
+        logger.info(f"Creating order with ticket {mt5_order.ticket}")
+        return self.local_api.create_order({
+            "ticket": mt5_order.ticket,
+            "comment": mt5_order.comment,
+            "commission": 0,
+            "is_pending": False,
+            "kind": mt5_order.comment,
+            "magic_number": mt5_order.magic,
+            "open_price": round(mt5_order.price_open, 2),
+            "open_time": datetime.datetime.fromtimestamp(mt5_order.time).strftime(
+                "%Y-%m-%d %H:%M:%S"),
+            "profit": round(mt5_order.profit, 2),
+            "sl": round(mt5_order.sl, 2),
+            "swap": round(mt5_order.swap, 2),
+            "symbol": mt5_order.symbol,
+            "tp": round(mt5_order.tp, 2),
+            "type": mt5_order.type,
+            "volume": round(mt5_order.volume, 2),
+            "is_closed": False,
+            "trailing_steps": 0,
+            "account": self.mt5.account_id,
+            "cycle_id": self.id,
+        })
 
-        for order_ticket in self.closed:
-            order_data = self.local_api.get_order_by_ticket(order_ticket)
-            order_obj = order(order_data, order_data.is_pending,
-                              self.mt5, self.local_api, "db", self.id)
-            data["orders"]["orders"].append(order_obj.to_dict())
-        return data
     # add  initial order
 
     def add_initial_order(self, order_ticket):
@@ -259,28 +305,38 @@ class cycle:
     # remove pending order from pending
 
     def remove_pending_order(self, order_ticket):
-        if order_ticket in self.pending:
-            self.pending.remove(order_ticket)
+        self._remove_tracked_order("pending", order_ticket)
 
     # remove initial order from initial list
     def remove_initial_order(self, order_ticket):
-        if order_ticket in self.initial:
-            self.initial.remove(order_ticket)
+        self._remove_tracked_order("initial", order_ticket)
 
     # remove hedge order from hedge list
     def remove_hedge_order(self, order_ticket):
-        if order_ticket in self.hedge:
-            self.hedge.remove(order_ticket)
+        self._remove_tracked_order("hedge", order_ticket)
 
     # remove recovery order from recovery list
     def remove_recovery_order(self, order_ticket):
-        if order_ticket in self.recovery:
-            self.recovery.remove(order_ticket)
+        self._remove_tracked_order("recovery", order_ticket)
 
     # remove threshold order from  list\
     def remove_threshold_order(self, order_ticket):
-        if order_ticket in self.threshold:
-            self.threshold.remove(order_ticket)
+        self._remove_tracked_order("threshold", order_ticket)
+
+    # remove a closed order from the list of its kind; a filled pending
+    # order may already have moved to initial, so it is dropped from both
+    def remove_order_by_ticket(self, order_ticket, kind):
+        self._remove_tracked_order(kind, order_ticket)
+        if kind == "pending":
+            self._remove_tracked_order("initial", order_ticket)
+
+    # the lists keep their order since hedge[-1], recovery[-1], initial[0]
+    # and the threshold sequence are read positionally, so removal stays an
+    # ordered list.remove rather than an O(1) swap-pop
+    def _remove_tracked_order(self, kind, order_ticket):
+        tickets = self._kind_list.get(kind)
+        if tickets is not None and order_ticket in tickets:
+            tickets.remove(order_ticket)
 
     # update cylce orders
     async def update_cycle(self, remote_api):
@@ -338,19 +394,7 @@ class cycle:
             # Update the state based on verification results
             if is_closed:
                 # Order is truly closed
-                if order_data.kind == "initial":
-                    self.remove_initial_order(order_ticket)
-                elif order_data.kind == "hedge":
-                    self.remove_hedge_order(order_ticket)
-                elif order_data.kind == "recovery":
-                    self.remove_recovery_order(order_ticket)
-                elif order_data.kind == "pending":
-                    if order_ticket in self.pending:
-                        self.remove_pending_order(order_ticket)
-                    if order_ticket in self.initial:
-                        self.remove_initial_order(order_ticket)
-                elif order_data.kind == "threshold":
-                    self.remove_threshold_order(order_ticket)
+                self.remove_order_by_ticket(order_ticket, order_data.kind)
 
                 # Add to closed list if not already there
                 if order_ticket not in self.closed:
@@ -405,9 +449,7 @@ class cycle:
 
             if new_order:
                 self.add_initial_order(new_order[0].ticket)
-                new_order_obj = order(
-                    new_order[0], False, self.mt5, self.local_api, "mt5", self.id)
-                new_order_obj.create_order()
+                self._persist_new_order(new_order[0])
 
         # Directly check with MT5 if any orders are still open
         any_still_open = False
@@ -438,8 +480,10 @@ class cycle:
             self.status = "open"
             print(f"Fixed cycle {self.id} incorrectly marked as closed")
 
-        # Save cycle state
-        self.local_api.Update_cycle(self.id, self.to_dict())
+        # Save cycle state, unless nothing changed since it was last stored
+        data = self.to_dict()
+        if self._snapshot(data) != self._last_snapshot:
+            self.update_CT_cycle(data)
     # create a new cycle
 
     def create_cycle(self):
@@ -476,7 +520,7 @@ class cycle:
             self.closing_method["user_id"] = user_id
             self.closing_method["status"] = "closed by User"
         self.closing_method["username"] = username
-        self.local_api.Update_cycle(self.id, self.to_dict())
+        self.update_CT_cycle()
 
         return True
 
@@ -496,28 +540,26 @@ class cycle:
         # Check for direction switch based on lost orders
         self.check_direction_switch()
 
-        ask = self.mt5.get_ask(self.symbol)
-        bid = self.mt5.get_bid(self.symbol)
+        ask, bid, pips = self._get_quote()
+        thr_step = threshold * pips
 
         # Original cycle management logic for initial status
         if self.status == "initial":
             # Check if the cycle is in the initial phase
             if (self.cycle_type == "BUY"):
                 if len(self.hedge) == 0:
-                    if bid < self.open_price-self.bot.hedge_sl*self.mt5.get_pips(self.symbol):
+                    if bid < self.open_price-self.bot.hedge_sl*pips:
                         self.hedge_buy_order()
             if (self.cycle_type == "SELL"):
                 if len(self.hedge) == 0:
-                    if ask > self.open_price+self.bot.hedge_sl*self.mt5.get_pips(self.symbol):
+                    if ask > self.open_price+self.bot.hedge_sl*pips:
                         self.hedge_sell_order()
             if ask > self.upper_bound:
                 total_sell = self.count_initial_sell_orders()
                 if total_sell >= 1:
-                    self.base_threshold_lower = self.open_price - \
-                        threshold * self.mt5.get_pips(self.symbol)
+                    self.base_threshold_lower = round(self.open_price - thr_step, 2)
                     self.threshold_lower = self.base_threshold_lower
-                    self.base_threshold_upper = self.upper_bound + \
-                        threshold * self.mt5.get_pips(self.symbol)
+                    self.base_threshold_upper = round(self.upper_bound + thr_step, 2)
                     self.threshold_upper = self.base_threshold_upper
                     self.close_initial_buy_orders()
                     self.status = "recovery"
@@ -526,21 +568,17 @@ class cycle:
                     self.update_CT_cycle()
                 else:
                     self.status = "recovery"
-                    self.base_threshold_lower = self.open_price - \
-                        threshold * self.mt5.get_pips(self.symbol)
+                    self.base_threshold_lower = round(self.open_price - thr_step, 2)
                     self.threshold_lower = self.base_threshold_lower
-                    self.base_threshold_upper = self.upper_bound + \
-                        threshold * self.mt5.get_pips(self.symbol)
+                    self.base_threshold_upper = round(self.upper_bound + thr_step, 2)
                     self.threshold_upper = self.base_threshold_upper
             elif bid < self.lower_bound:
                 total_buy = self.count_initial_buy_orders()
                 if total_buy >= 1:
                     self.close_initial_sell_orders()
-                    self.base_threshold_lower = self.lower_bound - \
-                        threshold * self.mt5.get_pips(self.symbol)
+                    self.base_threshold_lower = round(self.lower_bound - thr_step, 2)
                     self.threshold_lower = self.base_threshold_lower
-                    self.base_threshold_upper = self.open_price + \
-                        threshold * self.mt5.get_pips(self.symbol)
+                    self.base_threshold_upper = round(self.open_price + thr_step, 2)
                     self.threshold_upper = self.base_threshold_upper
                     self.status = "recovery"
                     self.hedge_buy_order()
@@ -548,11 +586,9 @@ class cycle:
                     self.update_CT_cycle()
                 else:
                     self.status = "recovery"
-                    self.base_threshold_lower = self.lower_bound - \
-                        threshold * self.mt5.get_pips(self.symbol)
+                    self.base_threshold_lower = round(self.lower_bound - thr_step, 2)
                     self.threshold_lower = self.base_threshold_lower
-                    self.base_threshold_upper = self.open_price + \
-                        threshold * self.mt5.get_pips(self.symbol)
+                    self.base_threshold_upper = round(self.open_price + thr_step, 2)
                     self.threshold_upper = self.base_threshold_upper
 
         elif self.status in ["recovery", "max_recovery"]:
@@ -563,7 +599,7 @@ class cycle:
                 # When in BUY mode, check if we should place a new buy order at threshold upper
                 if ask >= self.threshold_upper and len(self.hedge) > 0:
                     next_price_level = self.threshold_upper + \
-                        threshold2 * self.mt5.get_pips(self.symbol)
+                        threshold2 * pips
 
                     # # Only place the order if this price level hasn't been marked as "done"
                     # if not self.should_skip_price_level(next_price_level, "BUY"):
@@ -578,7 +614,7 @@ class cycle:
                 # When in SELL mode, check if we should place a new sell order at threshold lower
                 if bid <= self.threshold_lower and len(self.hedge) > 0:
                     next_price_level = self.threshold_lower - \
-                        threshold2 * self.mt5.get_pips(self.symbol)
+                        threshold2 * pips
 
                     # # Only place the order if this price level hasn't been marked as "done"
                     # if not self.should_skip_price_level(next_price_level, "SELL"):
@@ -607,19 +643,18 @@ class cycle:
                     break
 
     def threshold_Reposition(self, threshold):
+        thr_step = threshold * self._get_quote()[2]
         buy_n = 0
         sell_n = 0
         for order_ticket in self.threshold:
             order_data_db = self.local_api.get_order_by_ticket(order_ticket)
-            orderobj = order(order_data_db, self.is_pending,
-                             self.mt5, self.local_api, "db", self.id)
-            if orderobj.type == Mt5.ORDER_TYPE_SELL:
-                self.threshold_lower = orderobj.open_price - threshold * \
-                    self.mt5.get_pips(self.symbol)
+            if order_data_db.type == Mt5.ORDER_TYPE_SELL:
+                self.threshold_lower = round(
+                    order_data_db.open_price - thr_step, 2)
                 sell_n += 1
-            if orderobj.type == Mt5.ORDER_TYPE_BUY:
-                self.threshold_upper = orderobj.open_price+threshold * \
-                    self.mt5.get_pips(self.symbol)
+            if order_data_db.type == Mt5.ORDER_TYPE_BUY:
+                self.threshold_upper = round(
+                    order_data_db.open_price + thr_step, 2)
                 buy_n += 1
         if sell_n == 0:
 
@@ -645,9 +680,7 @@ class cycle:
         total_sell = 0
         for ticket in self.initial:
             order_data_db = self.local_api.get_order_by_ticket(ticket)
-            orderobj = order(order_data_db, self.is_pending,
-                             self.mt5, self.local_api, "db", self.id)
-            if orderobj.type == Mt5.ORDER_TYPE_SELL:
+            if order_data_db.type == Mt5.ORDER_TYPE_SELL:
                 total_sell += 1
         return total_sell
 
@@ -655,9 +688,7 @@ class cycle:
         total_buy = 0
         for ticket in self.initial:
             order_data_db = self.local_api.get_order_by_ticket(ticket)
-            orderobj = order(order_data_db, self.is_pending,
-                             self.mt5, self.local_api, "db", self.id)
-            if orderobj.type == Mt5.ORDER_TYPE_BUY:
+            if order_data_db.type == Mt5.ORDER_TYPE_BUY:
                 total_buy += 1
         return total_buy
 
@@ -683,14 +714,13 @@ class cycle:
             # add the order to the hedge list
             self.hedge.append(hedge_order[0].ticket)
             # create a new order
-            order_obj = order(
-                hedge_order[0], False, self.mt5, self.local_api, "mt5", self.id)
-            order_obj.create_order()
+            self._persist_new_order(hedge_order[0])
             if self.status != "initial":
-                self.lower_bound = float(hedge_order[0].price_open) - float(
-                    self.bot.zones[self.zone_index]) * float(self.mt5.get_pips(self.symbol))
-                self.upper_bound = float(hedge_order[0].price_open) + float(
-                    self.bot.zones[self.zone_index]) * float(self.mt5.get_pips(self.symbol))
+                price_open = float(hedge_order[0].price_open)
+                zone_step = float(self.bot.zones[self.zone_index]) * \
+                    float(self._get_quote()[2])
+                self.lower_bound = price_open - zone_step
+                self.upper_bound = price_open + zone_step
 
         # update the upper and lower by the zone index
     def recovery_buy_order(self):
@@ -700,9 +730,7 @@ class cycle:
             if len(recovery_order) > 0:
                 self.recovery.append(recovery_order[0].ticket)
                 # create a new order
-                order_obj = order(
-                    recovery_order[0], False, self.mt5, self.local_api, "mt5", self.id)
-                order_obj.create_order()
+                self._persist_new_order(recovery_order[0])
 
     def threshold_buy_order(self, threshold, lot_index=0):
         lot_idx = lot_index if hasattr(self.bot, 'lot_sizes') else 0
@@ -713,12 +741,10 @@ class cycle:
             self.symbol, lot_size, self.bot.bot.magic, self.bot.hedges_numbers, 0, "PIPS", self.bot.slippage, "threshold")
         if len(threshold_order) > 0:
             # add the order to the threshold list
-            self.threshold_upper = threshold
+            self.threshold_upper = round(float(threshold), 2)
             self.threshold.append(threshold_order[0].ticket)
             # create a new order
-            order_obj = order(
-                threshold_order[0], False, self.mt5, self.local_api, "mt5", self.id)
-            order_obj.create_order()
+            self._persist_new_order(threshold_order[0])
 
     def threshold_sell_order(self, threshold, lot_index=0):
         lot_idx = lot_index if hasattr(self.bot, 'lot_sizes') else 0
@@ -729,12 +755,10 @@ class cycle:
             self.symbol, lot_size, self.bot.bot.magic, self.bot.hedges_numbers, 0, "PIPS", self.bot.slippage, "threshold")
         if len(threshold_order) > 0:
             # add the order to the threshold list
-            self.threshold_lower = threshold
+            self.threshold_lower = round(float(threshold), 2)
             self.threshold.append(threshold_order[0].ticket)
             # create a new order
-            order_obj = order(
-                threshold_order[0], False, self.mt5, self.local_api, "mt5", self.id)
-            order_obj.create_order()
+            self._persist_new_order(threshold_order[0])
 
     def hedge_sell_order(self):
         self.orders = self.combine_orders()
@@ -761,15 +785,14 @@ class cycle:
             # add the order to the hedge list
             self.hedge.append(hedge_order[0].ticket)
             # create a new order
-            order_obj = order(
-                hedge_order[0], False, self.mt5, self.local_api, "mt5", self.id)
-            order_obj.create_order()
+            self._persist_new_order(hedge_order[0])
             # update the upper and lower by the zone index
             if self.status != "initial":
-                self.lower_bound = float(hedge_order[0].price_open) - float(
-                    self.bot.zones[self.zone_index]) * float(self.mt5.get_pips(self.symbol))
-                self.upper_bound = float(hedge_order[0].price_open) + float(
-                    self.bot.zones[self.zone_index]) * float(self.mt5.get_pips(self.symbol))
+                price_open = float(hedge_order[0].price_open)
+                zone_step = float(self.bot.zones[self.zone_index]) * \
+                    float(self._get_quote()[2])
+                self.lower_bound = price_open - zone_step
+                self.upper_bound = price_open + zone_step
 
     def recovery_sell_order(self):
         # recovery order
@@ -779,17 +802,14 @@ class cycle:
             if len(recovery_order) > 0:
                 self.recovery.append(recovery_order[0].ticket)
                 # create a new order
-                order_obj = order(
-                    recovery_order[0], False, self.mt5, self.local_api, "mt5", self.id)
-                order_obj.create_order()
+                self._persist_new_order(recovery_order[0])
 
     def go_opposite_direction(self):
         # check recovery order length
         if len(self.recovery) < 1:
             return
         if len(self.recovery) > 0:
-            ask = self.mt5.get_ask(self.symbol)
-            bid = self.mt5.get_bid(self.symbol)
+            ask, bid, _ = self._get_quote()
             if ask > self.upper_bound:
                 self.close_recovery_orders()
                 self.hedge_sell_order()
@@ -800,27 +820,26 @@ class cycle:
                 self.recovery_buy_order()
 
     def close_recovery_orders(self):
-        for ticket in self.recovery:
+        # iterate over a snapshot, the list is emptied in one go afterwards
+        for ticket in list(self.recovery):
             order_data_db = self.local_api.get_order_by_ticket(ticket)
             orderobj = order(order_data_db, self.is_pending,
                              self.mt5, self.local_api, "db", self.id)
             orderobj.close_order()
             orderobj.is_closed = True
             orderobj.update_order()
-            self.recovery.remove(ticket)
             self.closed.append(ticket)
+        # clear in place, _kind_list keeps a reference to this list
+        self.recovery.clear()
 
     def go_hedge_direction(self):
         if len(self.hedge) > 0:
-            ask = self.mt5.get_ask(self.symbol)
-            bid = self.mt5.get_bid(self.symbol)
+            ask, bid, _ = self._get_quote()
             if ask > self.upper_bound:
                 last_hedge = self.hedge[-1]
                 order_data_db = self.local_api.get_order_by_ticket(last_hedge)
-                orderobj = order(order_data_db, self.is_pending,
-                                 self.mt5, self.local_api, "db", self.id)
-                last_hedge_type = orderobj.type
-                last_hedge_profit = orderobj.profit
+                last_hedge_type = order_data_db.type
+                last_hedge_profit = order_data_db.profit
                 # if last_hedge_type == Mt5.ORDER_TYPE_SELL and last_hedge_profit < 0:
                 if (len(self.recovery) > 0):
                     last_recovery = self.recovery[-1]
@@ -834,10 +853,8 @@ class cycle:
             elif bid < self.lower_bound:
                 last_hedge = self.hedge[-1]
                 order_data_db = self.local_api.get_order_by_ticket(last_hedge)
-                orderobj = order(order_data_db, self.is_pending,
-                                 self.mt5, self.local_api, "db", self.id)
-                last_hedge_type = orderobj.type
-                last_hedge_profit = orderobj.profit
+                last_hedge_type = order_data_db.type
+                last_hedge_profit = order_data_db.profit
                 # if last_hedge_type == Mt5.ORDER_TYPE_BUY and last_hedge_profit < 0:
                 if (len(self.recovery) > 0):
                     last_recovery = self.recovery[-1]
@@ -849,8 +866,24 @@ class cycle:
                 self.hedge_buy_order()
                 self.recovery_buy_order()
 
-    def update_CT_cycle(self):
-        self.local_api.Update_cycle(self.id, self.to_dict())
+    # (ask, bid, pips) of the symbol: the strategy's per-tick snapshot when
+    # the bot keeps one, otherwise read from MT5 (cycles_manager and order
+    # pass themselves as the bot)
+    def _get_quote(self):
+        get_quote = getattr(self.bot, "get_quote", None)
+        if get_quote is not None:
+            return get_quote(self.symbol)
+        return (self.mt5.get_ask(self.symbol), self.mt5.get_bid(self.symbol),
+                self.mt5.get_pips(self.symbol))
+
+    def update_CT_cycle(self, data=None):
+        data = data if data is not None else self.to_dict()
+        self.local_api.Update_cycle(self.id, data)
+        self._last_snapshot = self._snapshot(data)
+
+    def _snapshot(self, data=None):
+        return orjson.dumps(data if data is not None else self.to_dict(), default=str,
+                            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
     #  close   cycle when hits  takeprofit
 
     async def close_cycle_on_takeprofit(self, take_profit, remote_api):
@@ -871,8 +904,9 @@ class cycle:
         }
 
         # Check if this price level is already marked as done
+        half_pip = self._get_quote()[2] * 0.5
         for level in self.done_price_levels:
-            if abs(level["price"] - price_level) < self.mt5.get_pips(self.symbol) * 0.5 and level["direction"] == direction:
+            if abs(level["price"] - price_level) < half_pip and level["direction"] == direction:
                 return
 
         self.done_price_levels.append(done_level)
@@ -880,10 +914,9 @@ class cycle:
 
     def should_skip_price_level(self, price_level, direction):
         """Check if a price level should be skipped because it's marked as done"""
+        min_diff = self._get_quote()[2] * 0.5  # Half pip tolerance
         for done_level in self.done_price_levels:
             price_diff = abs(done_level["price"] - price_level)
-            min_diff = self.mt5.get_pips(
-                self.symbol) * 0.5  # Half pip tolerance
 
             if price_diff <= min_diff and done_level["direction"] == direction:
                 return True
@@ -906,10 +939,9 @@ class cycle:
 
             if all_buy_orders_lost:
                 # Get current price
-                current_price = self.mt5.get_bid(self.symbol)
+                _, current_price, pips = self._get_quote()
                 # If price dropped significantly below initial price
-                significant_drop = significant_drop_pips * \
-                    self.mt5.get_pips(self.symbol)
+                significant_drop = significant_drop_pips * pips
 
                 if self.initial_threshold_price > 0 and current_price < (self.initial_threshold_price - significant_drop):
                     self.current_direction = "SELL"
@@ -930,10 +962,9 @@ class cycle:
 
             if all_sell_orders_lost:
                 # Get current price
-                current_price = self.mt5.get_ask(self.symbol)
+                current_price, _, pips = self._get_quote()
                 # If price rose significantly above initial price
-                significant_rise = significant_drop_pips * \
-                    self.mt5.get_pips(self.symbol)
+                significant_rise = significant_drop_pips * pips
 
                 if self.initial_threshold_price > 0 and current_price > (self.initial_threshold_price + significant_rise):
                     self.current_direction = "BUY"
@@ -942,3 +973,45 @@ class cycle:
                     if hasattr(self.bot, 'lot_sizes') and self.next_order_index < len(self.bot.lot_sizes) - 1:
                         self.next_order_index += 1
                     self.update_CT_cycle()
+
+
+class CycleFromDB(cycle):
+    """ CT cycle loaded from a local DB row """
+    _cycle_id_field = "remote_id"
+    _threshold_upper_field = "threshold_upper"
+    _threshold_lower_field = "threshold_lower"
+    _loaded_from_db = True
+
+    @staticmethod
+    def _read_field(data, attr, default=None):
+        return getattr(data, attr, default)
+
+
+class CycleFromRemote(cycle):
+    """ CT cycle loaded from a remote record """
+
+    @staticmethod
+    def _read_field(data, attr, default=None):
+        return getattr(data, attr, default)
+
+    def _load_orders(self, data):
+        # Safely handle orders
+        orders_data = getattr(data, "orders", {})
+        if isinstance(orders_data, dict):
+            return self.get_orders_from_remote(orders_data.get("orders", []))
+        return []
+
+
+class CycleFromDict(cycle):
+    """ CT cycle built from a plain dict """
+
+
+_CYCLE_BY_SOURCE = {
+    "db": CycleFromDB,
+    "remote": CycleFromRemote,
+}
+
+
+def make_cycle(data, mt5, bot, source=None):
+    """Build the CT cycle class specialized for the given data source"""
+    return _CYCLE_BY_SOURCE.get(source, CycleFromDict)(data, mt5, bot, source)
@@ -4,13 +4,141 @@ Refactored for direct Supabase operations without PocketBase dependencies
 """
 
 import asyncio
+import bisect
 import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import json
+import time
+from services.db_pool import get_db_pool
 
 logger = logging.getLogger(__name__)
 
+# Delay before coalesced order-list changes are written to Supabase, and
+# the longest wait between retries after a failed write
+FLUSH_DELAY = 0.05
+FLUSH_MAX_BACKOFF = 5
+
+# How long a combined get_all_orders list may be reused
+ORDERS_CACHE_TTL = 0.5
+
+# How long a formatted UTC timestamp is reused before formatting a new one
+TIMESTAMP_TTL = 0.1
+_timestamp_cache = (float('-inf'), '')
+
+# Events are buffered and inserted in batches every EVENT_BATCH_INTERVAL seconds
+EVENT_BATCH_INTERVAL = 0.2
+_pending_events: List[tuple] = []
+_event_flush_task: Optional[asyncio.Task] = None
+
+
+# Order type -> cycle column holding its order ids
+ORDER_LISTS = {
+    'initial': 'initial_orders',
+    'hedge': 'hedge_orders',
+    'recovery': 'recovery_orders',
+    'pending': 'pending_orders',
+    'threshold': 'threshold_orders'
+}
+
+
+def _done_level_key(price_level: float, direction: str) -> int:
+    """Pack a 4-decimal price level and its direction into one integer"""
+    return int(round(price_level * 10000)) * 2 + (0 if direction == 'BUY' else 1)
+
+
+def _parse_done_levels(levels) -> List[int]:
+    """Sorted packed keys from stored levels
+
+    Reads the {"price", "direction"} dicts CT_cycle.py also stores, plus the
+    "price_DIRECTION" strings written by earlier versions
+    """
+    if isinstance(levels, str):
+        try:
+            levels = json.loads(levels)
+        except ValueError:
+            levels = []
+    if not isinstance(levels, list):
+        levels = []
+
+    keys = set()
+    for level in levels:
+        try:
+            if isinstance(level, dict):
+                keys.add(_done_level_key(
+                    float(level['price']), level['direction']))
+            elif isinstance(level, str):
+                price, _, direction = level.rpartition('_')
+                keys.add(_done_level_key(float(price), direction))
+            else:
+                raise TypeError(level)
+        except (KeyError, TypeError, ValueError):
+            logger.warning(f"Skipping unreadable done price level: {level!r}")
+    return sorted(keys)
+
+
+def _done_level_row(level_key: int) -> Dict:
+    """Stored form of a packed key, the same shape CT_cycle.py writes"""
+    return {
+        'price': (level_key // 2) / 10000,
+        'direction': 'SELL' if level_key % 2 else 'BUY'
+    }
+
+
+def _order_list_property(order_type: str) -> property:
+    """Expose one entry of CTCycleV2._order_lists as its <type>_orders column"""
+
+    def getter(self):
+        return self._order_lists[order_type]
+
+    def setter(self, value):
+        self._order_lists[order_type] = value
+        self._orders_cache = {}
+
+    return property(getter, setter)
+
+
+def _now_iso() -> str:
+    """Current UTC time in ISO format, reformatted at most every TIMESTAMP_TTL"""
+    global _timestamp_cache
+    now = time.monotonic()
+    if now - _timestamp_cache[0] >= TIMESTAMP_TTL:
+        _timestamp_cache = (now, datetime.utcnow().isoformat())
+    return _timestamp_cache[1]
+
+
+def _queue_event(supabase_client, event_data: Dict):
+    """Buffer an event and schedule a batched insert on the running loop"""
+    global _event_flush_task
+    _pending_events.append((supabase_client, event_data))
+    # A task left behind by an earlier (closed) loop is replaced
+    if (_event_flush_task is None or _event_flush_task.done() or
+            _event_flush_task.get_loop() is not asyncio.get_running_loop()):
+        _event_flush_task = asyncio.create_task(_flush_events_later())
+
+
+async def _flush_events_later():
+    await asyncio.sleep(EVENT_BATCH_INTERVAL)
+    await flush_events()
+
+
+async def flush_events():
+    """Insert every buffered event now, with one request per client"""
+    if not _pending_events:
+        return
+
+    batches = {}
+    for supabase_client, event_data in _pending_events:
+        batches.setdefault(id(supabase_client),
+                           (supabase_client, []))[1].append(event_data)
+    _pending_events.clear()
+
+    for supabase_client, events in batches.values():
+        try:
+            await supabase_client.table('events').insert(events).execute()
+        except Exception as e:
+            logger.error(f"Error sending {len(events)} events: {e}")
+
 
 class CTCycleV2:
     """
@@ -18,89 +146,90 @@ class CTCycleV2:
     Optimized for real-time performance and sub-second updates
     """
 
+    # Order id lists, stored together in _order_lists
+    initial_orders = _order_list_property('initial')
+    hedge_orders = _order_list_property('hedge')
+    recovery_orders = _order_list_property('recovery')
+    pending_orders = _order_list_property('pending')
+    threshold_orders = _order_list_property('threshold')
+    closed_orders = _order_list_property('closed')
+
+    @property
+    def done_price_levels(self) -> List[Dict]:
+        """Price levels already traded, in their stored form
+
+        _done_levels holds the same levels as sorted packed keys for lookups
+        """
+        return [_done_level_row(key) for key in self._done_levels]
+
+    @done_price_levels.setter
+    def done_price_levels(self, levels):
+        self._done_levels = _parse_done_levels(levels)
+
     def __init__(self, supabase_client, meta_trader, bot, cycle_data: Dict = None):
         self.supabase_client = supabase_client
         self.meta_trader = meta_trader
         self.bot = bot
         self.logger = logger
 
+        data = cycle_data or {}
+        now = _now_iso()
+
         # Core cycle properties
-        self.id = cycle_data.get('id', '') if cycle_data else ''
-        self.bot_id = cycle_data.get('bot', '') if cycle_data else bot.id
-        self.account = cycle_data.get(
-            'account', '') if cycle_data else bot.account_id
-        self.symbol = cycle_data.get('symbol', '') if cycle_data else ''
-        self.cycle_type = cycle_data.get(
-            'cycle_type', 'BUY') if cycle_data else 'BUY'
+        self.id = data.get('id', '')
+        self.bot_id = data.get('bot', '') if cycle_data else bot.id
+        self.account = data.get('account', '') if cycle_data else bot.account_id
+        self.symbol = data.get('symbol', '')
+        # Pip value is static per symbol, resolved on first use
+        self._pip_value = None
+        self.cycle_type = data.get('cycle_type', 'BUY')
 
         # Status and bounds
-        self.is_closed = cycle_data.get(
-            'is_closed', False) if cycle_data else False
-        self.is_pending = cycle_data.get(
-            'is_pending', False) if cycle_data else False
-        self.status = cycle_data.get(
-            'status', 'initial') if cycle_data else 'initial'
-        self.lower_bound = cycle_data.get(
-            'lower_bound', 0) if cycle_data else 0
-        self.upper_bound = cycle_data.get(
-            'upper_bound', 0) if cycle_data else 0
+        self.is_closed = data.get('is_closed', False)
+        self.is_pending = data.get('is_pending', False)
+        self.status = data.get('status', 'initial')
+        self.lower_bound = data.get('lower_bound', 0)
+        self.upper_bound = data.get('upper_bound', 0)
 
         # Trading metrics
-        self.total_profit = cycle_data.get(
-            'total_profit', 0) if cycle_data else 0
-        self.total_volume = cycle_data.get(
-            'total_volume', 0) if cycle_data else 0
-        self.lot_idx = cycle_data.get('lot_idx', 0) if cycle_data else 0
-        self.zone_index = cycle_data.get('zone_index', 0) if cycle_data else 0
+        self.total_profit = data.get('total_profit', 0)
+        self.total_volume = data.get('total_volume', 0)
+        self.lot_idx = data.get('lot_idx', 0)
+        self.zone_index = data.get('zone_index', 0)
 
         # Order arrays - stored as order IDs for Supabase
-        self.initial_orders = cycle_data.get(
-            'initial_orders', []) if cycle_data else []
-        self.hedge_orders = cycle_data.get(
-            'hedge_orders', []) if cycle_data else []
-        self.recovery_orders = cycle_data.get(
-            'recovery_orders', []) if cycle_data else []
-        self.pending_orders = cycle_data.get(
-            'pending_orders', []) if cycle_data else []
-        self.threshold_orders = cycle_data.get(
-            'threshold_orders', []) if cycle_data else []
-        self.closed_orders = cycle_data.get(
-            'closed_orders', []) if cycle_data else []
+        self._order_lists = {
+            order_type: data.get(f'{order_type}_orders', [])
+            for order_type in (*ORDER_LISTS, 'closed')
+        }
 
         # Threshold system for CT strategy
-        self.threshold_upper = cycle_data.get(
-            'threshold_upper', 0) if cycle_data else 0
-        self.threshold_lower = cycle_data.get(
-            'threshold_lower', 0) if cycle_data else 0
-        self.base_threshold_upper = cycle_data.get(
-            'base_threshold_upper', 0) if cycle_data else 0
-        self.base_threshold_lower = cycle_data.get(
-            'base_threshold_lower', 0) if cycle_data else 0
+        self.threshold_upper = data.get('threshold_upper', 0)
+        self.threshold_lower = data.get('threshold_lower', 0)
+        self.base_threshold_upper = data.get('base_threshold_upper', 0)
+        self.base_threshold_lower = data.get('base_threshold_lower', 0)
 
         # Zone forward system
-        self.done_price_levels = cycle_data.get(
-            'done_price_levels', []) if cycle_data else []
-        self.current_direction = cycle_data.get(
-            'current_direction', 'BUY') if cycle_data else 'BUY'
-        self.initial_threshold_price = cycle_data.get(
-            'initial_threshold_price', 0) if cycle_data else 0
-        self.direction_switched = cycle_data.get(
-            'direction_switched', False) if cycle_data else False
-        self.next_order_index = cycle_data.get(
-            'next_order_index', 0) if cycle_data else 0
+        self.done_price_levels = data.get('done_price_levels', [])
+        self.current_direction = data.get('current_direction', 'BUY')
+        self.initial_threshold_price = data.get('initial_threshold_price', 0)
+        self.direction_switched = data.get('direction_switched', False)
+        self.next_order_index = data.get('next_order_index', 0)
 
         # Metadata
-        self.closing_method = cycle_data.get(
-            'closing_method', {}) if cycle_data else {}
-        self.opened_by = cycle_data.get('opened_by', {}) if cycle_data else {}
-        self.created_at = cycle_data.get('created_at', datetime.utcnow(
-        ).isoformat()) if cycle_data else datetime.utcnow().isoformat()
-        self.updated_at = cycle_data.get('updated_at', datetime.utcnow(
-        ).isoformat()) if cycle_data else datetime.utcnow().isoformat()
+        self.closing_method = data.get('closing_method', {})
+        self.opened_by = data.get('opened_by', {})
+        self.created_at = data.get('created_at', now)
+        self.updated_at = data.get('updated_at', now)
 
         # Performance optimization
-        self._orders_cache = {}  # Cache order data to reduce DB calls
+        # include_closed -> (combined order ids, monotonic time built)
+        self._orders_cache = {}
         self._last_cache_update = None
+        self._dirty_fields = set()  # Columns changed since the last flush
+        self._flush_task = None
+        # Tracked columns as of the last successful update_cycle write
+        self._last_update_state = None
 
     async def create_cycle(self) -> str:
         """Create cycle in Supabase with real-time updates"""
@@ -131,15 +260,26 @@ class CTCycleV2:
             self.logger.error(f"Error creating CT cycle: {e}")
             return None
 
-    async def update_cycle(self, updates: Dict = None):
-        """Update cycle in Supabase with real-time sync"""
+    async def update_cycle(self, updates: Dict = None, metrics_fresh: bool = False):
+        """Update cycle in Supabase with real-time sync
+
+        metrics_fresh skips recalculating profit and volume when the caller
+        has just done so
+        """
         try:
             if not self.id:
                 self.logger.warning("Cannot update cycle without ID")
                 return False
 
             # Calculate current profit and volume from orders
-            await self.calculate_metrics()
+            if not metrics_fresh:
+                await self.calculate_metrics()
+
+            # Nothing to write if the tracked columns match the last update
+            state = (self.total_profit, self.total_volume, self.status,
+                     self.threshold_upper, self.threshold_lower)
+            if not updates and state == self._last_update_state:
+                return True
 
             # Prepare update data
             update_data = {
@@ -148,15 +288,20 @@ class CTCycleV2:
                 'status': self.status,
                 'threshold_upper': self.threshold_upper,
                 'threshold_lower': self.threshold_lower,
-                'updated_at': datetime.utcnow().isoformat()
+                'updated_at': _now_iso()
             }
 
             # Add any additional updates
             if updates:
                 update_data.update(updates)
 
-            # Update in Supabase
-            result = await self.supabase_client.table('cycles').update(update_data).eq('id', self.id).execute()
+            # Update in Supabase; the event is queued without waiting on it
+            result = await self.supabase_client.table('cycles').update(
+                update_data).eq('id', self.id).execute()
+            await self.send_event('CT_CYCLE_UPDATED', {
+                'cycle_id': self.id,
+                'updates': update_data
+            })
 
             if result.data:
                 # Update local properties
@@ -164,12 +309,9 @@ class CTCycleV2:
                     if hasattr(self, key):
                         setattr(self, key, value)
 
-                # Send real-time event
-                await self.send_event('CT_CYCLE_UPDATED', {
-                    'cycle_id': self.id,
-                    'updates': update_data
-                })
-
+                self._last_update_state = (
+                    self.total_profit, self.total_volume, self.status,
+                    self.threshold_upper, self.threshold_lower)
                 return True
             else:
                 self.logger.error(f"Failed to update cycle {self.id}")
@@ -188,6 +330,9 @@ class CTCycleV2:
             # Close all open orders first
             await self.close_all_orders()
 
+            # Write any queued order-list changes before closing
+            await self.flush()
+
             # Update cycle as closed
             closing_data = {
                 'is_closed': True,
@@ -197,9 +342,9 @@ class CTCycleV2:
                     'sent_by_admin': sent_by_admin,
                     'user_id': user_id,
                     'username': username,
-                    'closed_at': datetime.utcnow().isoformat()
+                    'closed_at': _now_iso()
                 },
-                'updated_at': datetime.utcnow().isoformat()
+                'updated_at': _now_iso()
             }
 
             result = await self.supabase_client.table('cycles').update(closing_data).eq('id', self.id).execute()
@@ -217,6 +362,9 @@ class CTCycleV2:
                     'closed_by': username
                 })
 
+                # Deliver the close event (and anything queued before it) now
+                await flush_events()
+
                 self.logger.info(
                     f"Closed CT cycle {self.id} with profit {self.total_profit}")
                 return True
@@ -231,35 +379,16 @@ class CTCycleV2:
     async def add_order(self, order_id: str, order_type: str = "initial"):
         """Add order to appropriate list and update in Supabase"""
         try:
-            # Add to appropriate list
-            if order_type == "initial":
-                self.initial_orders.append(order_id)
-                self.status = "initial"
-            elif order_type == "hedge":
-                self.hedge_orders.append(order_id)
-                self.status = "hedge"
-            elif order_type == "recovery":
-                self.recovery_orders.append(order_id)
-                self.status = "recovery"
-            elif order_type == "pending":
-                self.pending_orders.append(order_id)
-                self.status = "pending"
-            elif order_type == "threshold":
-                self.threshold_orders.append(order_id)
-                self.status = "threshold"
-
-            # Update in Supabase
-            update_data = {
-                'initial_orders': self.initial_orders,
-                'hedge_orders': self.hedge_orders,
-                'recovery_orders': self.recovery_orders,
-                'pending_orders': self.pending_orders,
-                'threshold_orders': self.threshold_orders,
-                'status': self.status,
-                'updated_at': datetime.utcnow().isoformat()
-            }
+            attr = ORDER_LISTS.get(order_type)
+            if attr is None:
+                self.logger.warning(f"Unknown order type {order_type} for cycle {self.id}")
+                return
 
-            await self.supabase_client.table('cycles').update(update_data).eq('id', self.id).execute()
+            getattr(self, attr).append(order_id)
+            self.status = order_type
+
+            # Queue the change for the next coalesced update
+            self._mark_dirty(attr, 'status')
 
             # Clear cache to force refresh
             self._orders_cache = {}
@@ -273,41 +402,21 @@ class CTCycleV2:
     async def remove_order(self, order_id: str):
         """Remove order from all lists and update in Supabase"""
         try:
-            removed = False
+            removed = []
 
             # Remove from all lists
-            if order_id in self.initial_orders:
-                self.initial_orders.remove(order_id)
-                removed = True
-            if order_id in self.hedge_orders:
-                self.hedge_orders.remove(order_id)
-                removed = True
-            if order_id in self.recovery_orders:
-                self.recovery_orders.remove(order_id)
-                removed = True
-            if order_id in self.pending_orders:
-                self.pending_orders.remove(order_id)
-                removed = True
-            if order_id in self.threshold_orders:
-                self.threshold_orders.remove(order_id)
-                removed = True
+            for attr in ORDER_LISTS.values():
+                orders = getattr(self, attr)
+                if order_id in orders:
+                    orders.remove(order_id)
+                    removed.append(attr)
 
             if removed:
                 # Add to closed orders
                 self.closed_orders.append(order_id)
 
-                # Update in Supabase
-                update_data = {
-                    'initial_orders': self.initial_orders,
-                    'hedge_orders': self.hedge_orders,
-                    'recovery_orders': self.recovery_orders,
-                    'pending_orders': self.pending_orders,
-                    'threshold_orders': self.threshold_orders,
-                    'closed_orders': self.closed_orders,
-                    'updated_at': datetime.utcnow().isoformat()
-                }
-
-                await self.supabase_client.table('cycles').update(update_data).eq('id', self.id).execute()
+                # Queue the change for the next coalesced update
+                self._mark_dirty('closed_orders', *removed)
 
                 # Clear cache
                 self._orders_cache = {}
@@ -318,28 +427,63 @@ class CTCycleV2:
         except Exception as e:
             self.logger.error(f"Error removing order from cycle: {e}")
 
-    async def get_all_orders(self, include_closed: bool = False) -> List[str]:
-        """Get all order IDs for this cycle"""
-        orders = (self.initial_orders + self.hedge_orders + self.recovery_orders +
-                  self.pending_orders + self.threshold_orders)
+    def _mark_dirty(self, *fields: str):
+        """Record changed columns and schedule a single delayed flush"""
+        self._dirty_fields.update(fields)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._schedule_flush())
+
+    async def _schedule_flush(self):
+        """Wait for further changes to pile up, then flush them together
+
+        Keeps flushing while changes arrive during a write, and retries
+        failed writes with a growing delay
+        """
+        delay = FLUSH_DELAY
+        while self._dirty_fields and self.id:
+            await asyncio.sleep(delay)
+            if await self.flush():
+                delay = FLUSH_DELAY
+            else:
+                delay = min(delay * 2, FLUSH_MAX_BACKOFF)
+
+    async def flush(self) -> bool:
+        """Write all pending column changes to Supabase in one update"""
+        if not self._dirty_fields or not self.id:
+            return True
 
-        if include_closed:
-            orders.extend(self.closed_orders)
+        dirty = self._dirty_fields
+        self._dirty_fields = set()
+        update_data = {field: getattr(self, field) for field in dirty}
+        update_data['updated_at'] = _now_iso()
 
+        try:
+            await self.supabase_client.table('cycles').update(update_data).eq('id', self.id).execute()
+            self.updated_at = update_data['updated_at']
+            return True
+        except Exception as e:
+            # Keep the columns dirty so the next flush retries them
+            self._dirty_fields |= dirty
+            self.logger.error(f"Error flushing cycle {self.id}: {e}")
+            return False
+
+    async def get_all_orders(self, include_closed: bool = False) -> List[str]:
+        """Get all order IDs for this cycle"""
+        now = time.monotonic()
+        cached = self._orders_cache.get(include_closed)
+        if cached is not None and now - cached[1] < ORDERS_CACHE_TTL:
+            return cached[0]
+
+        orders = [order_id
+                  for order_type, orders in self._order_lists.items()
+                  if include_closed or order_type != 'closed'
+                  for order_id in orders]
+        self._orders_cache[include_closed] = (orders, now)
         return orders
 
     async def get_orders_by_type(self, order_type: str) -> List[str]:
         """Get orders by type"""
-        type_map = {
-            'initial': self.initial_orders,
-            'hedge': self.hedge_orders,
-            'recovery': self.recovery_orders,
-            'pending': self.pending_orders,
-            'threshold': self.threshold_orders,
-            'closed': self.closed_orders
-        }
-
-        return type_map.get(order_type, [])
+        return self._order_lists.get(order_type, [])
 
     async def calculate_metrics(self):
         """Calculate total profit and volume from all orders"""
@@ -351,18 +495,23 @@ class CTCycleV2:
                 self.total_volume = 0
                 return
 
-            # Get orders from Supabase
-            orders_result = await self.supabase_client.table('orders').select('*').in_('id', all_order_ids).execute()
-
-            total_profit = 0
-            total_volume = 0
-
-            for order in orders_result.data:
-                total_profit += order.get('profit', 0)
-                total_volume += order.get('volume', 0)
+            pool = await get_db_pool()
+            if pool is not None:
+                # Sum over a pooled direct connection
+                async with pool.acquire() as conn:
+                    metrics = await conn.fetchrow(
+                        'select sum(profit) as total_profit, sum(volume) as total_volume '
+                        'from orders where id = any($1::uuid[])', all_order_ids)
+            else:
+                # Let Postgres sum the orders (see DB/supabase_functions.sql)
+                metrics_result = await self.supabase_client.rpc(
+                    'cycle_metrics', {'order_ids': all_order_ids}).execute()
+                metrics = metrics_result.data[0] if metrics_result.data else {}
 
-            self.total_profit = round(total_profit, 2)
-            self.total_volume = round(total_volume, 2)
+            self.total_profit = round(
+                float(metrics['total_profit'] or 0), 2) if metrics else 0
+            self.total_volume = round(
+                float(metrics['total_volume'] or 0), 2) if metrics else 0
 
         except Exception as e:
             self.logger.error(f"Error calculating metrics: {e}")
@@ -373,28 +522,53 @@ class CTCycleV2:
         """Close all open orders for this cycle"""
         try:
             open_order_ids = await self.get_all_orders(include_closed=False)
+            if not open_order_ids:
+                return
 
-            for order_id in open_order_ids:
-                # Get order data
-                order_result = await self.supabase_client.table('orders').select('*').eq('id', order_id).execute()
+            # Get the tickets of every open order in one query
+            pool = await get_db_pool()
+            if pool is not None:
+                async with pool.acquire() as conn:
+                    rows = await conn.fetch(
+                        'select id::text as id, order_data from orders where id = any($1::uuid[])',
+                        open_order_ids)
+                orders = [{'id': row['id'], 'order_data': json.loads(row['order_data'])
+                           if isinstance(row['order_data'], str) else row['order_data']}
+                          for row in rows]
+            else:
+                orders_result = await self.supabase_client.table('orders').select(
+                    'id, order_data').in_('id', open_order_ids).execute()
+                orders = orders_result.data or []
 
-                if order_result.data:
-                    order = order_result.data[0]
-                    ticket = order.get('order_data', {}).get('ticket')
+            closed_ids = []
+            for order in orders:
+                ticket = (order.get('order_data') or {}).get('ticket')
 
-                    if ticket:
-                        # Close order in MetaTrader
-                        success = self.meta_trader.close_order(ticket)
+                # Close order in MetaTrader
+                if ticket and self.meta_trader.close_order(ticket):
+                    closed_ids.append(order['id'])
 
-                        if success:
-                            # Update order status in database
-                            await self.supabase_client.table('orders').update({
-                                'status': 'CLOSED',
-                                'updated_at': datetime.utcnow().isoformat()
-                            }).eq('id', order_id).execute()
+            if not closed_ids:
+                return
 
-                            # Move to closed orders
-                            await self.remove_order(order_id)
+            # Update the status of all closed orders at once
+            await self.supabase_client.table('orders').update({
+                'status': 'CLOSED',
+                'updated_at': _now_iso()
+            }).in_('id', closed_ids).execute()
+
+            # Move them to closed orders with a single cycle update
+            closed_set = set(closed_ids)
+            changed = ['closed_orders']
+            for order_type, attr in ORDER_LISTS.items():
+                orders = self._order_lists[order_type]
+                remaining = [order_id for order_id in orders if order_id not in closed_set]
+                if len(remaining) != len(orders):
+                    self._order_lists[order_type] = remaining
+                    changed.append(attr)
+            self.closed_orders.extend(closed_ids)
+            self._orders_cache = {}
+            self._mark_dirty(*changed)
 
         except Exception as e:
             self.logger.error(f"Error closing all orders: {e}")
@@ -406,12 +580,12 @@ class CTCycleV2:
             if self.is_closed:
                 return
 
-            # Get current price
-            current_price = self.meta_trader.get_ask(
-                self.symbol) if self.cycle_type == 'BUY' else self.meta_trader.get_bid(self.symbol)
-
-            # Update metrics
-            await self.calculate_metrics()
+            # Get current price while the metrics are being fetched
+            get_price = self.meta_trader.get_ask if self.cycle_type == 'BUY' else self.meta_trader.get_bid
+            current_price, _ = await asyncio.gather(
+                asyncio.to_thread(get_price, self.symbol),
+                self.calculate_metrics()
+            )
 
             # Handle threshold orders based on CT strategy logic
             await self.handle_threshold_orders(threshold, threshold2, current_price)
@@ -419,8 +593,8 @@ class CTCycleV2:
             # Handle zone forward logic
             await self.handle_zone_forward(current_price)
 
-            # Update cycle
-            await self.update_cycle()
+            # Update cycle with the metrics fetched above
+            await self.update_cycle(metrics_fresh=True)
 
         except Exception as e:
             self.logger.error(f"Error managing cycle orders: {e}")
@@ -433,8 +607,9 @@ class CTCycleV2:
 
             if len(self.threshold_orders) < 10:  # Max threshold orders
                 # Check if we need to place threshold orders
-                pip_value = self.meta_trader.get_pips(self.symbol)
-                threshold_distance = threshold * pip_value
+                if self._pip_value is None:
+                    self._pip_value = self.meta_trader.get_pips(self.symbol)
+                threshold_distance = threshold * self._pip_value
 
                 # Place threshold orders based on current position
                 if self.cycle_type == 'BUY' and current_price <= (self.initial_threshold_price - threshold_distance):
@@ -451,30 +626,36 @@ class CTCycleV2:
             # Check if price level has been done before
             price_level = round(current_price, 4)
 
-            if not self.should_skip_price_level(price_level, self.current_direction):
-                # Mark price level as done
-                self.mark_price_level_as_done(
-                    price_level, self.current_direction)
+            # Known levels need neither a local change nor a DB write
+            if self.should_skip_price_level(price_level, self.current_direction):
+                return
+
+            # Mark price level as done
+            self.mark_price_level_as_done(
+                price_level, self.current_direction)
 
-                # Update in database
-                await self.supabase_client.table('cycles').update({
-                    'done_price_levels': self.done_price_levels,
-                    'updated_at': datetime.utcnow().isoformat()
-                }).eq('id', self.id).execute()
+            # Append only the new key server-side instead of resending the array
+            await self.supabase_client.rpc('append_done_level', {
+                'cycle_id': self.id,
+                'level': _done_level_row(
+                    _done_level_key(price_level, self.current_direction))
+            }).execute()
 
         except Exception as e:
             self.logger.error(f"Error handling zone forward: {e}")
 
     def mark_price_level_as_done(self, price_level: float, direction: str):
         """Mark price level as done"""
-        level_key = f"{price_level}_{direction}"
-        if level_key not in self.done_price_levels:
-            self.done_price_levels.append(level_key)
+        level_key = _done_level_key(price_level, direction)
+        idx = bisect.bisect_left(self._done_levels, level_key)
+        if idx == len(self._done_levels) or self._done_levels[idx] != level_key:
+            self._done_levels.insert(idx, level_key)
 
     def should_skip_price_level(self, price_level: float, direction: str) -> bool:
         """Check if price level should be skipped"""
-        level_key = f"{price_level}_{direction}"
-        return level_key in self.done_price_levels
+        level_key = _done_level_key(price_level, direction)
+        idx = bisect.bisect_left(self._done_levels, level_key)
+        return idx < len(self._done_levels) and self._done_levels[idx] == level_key
 
     async def create_threshold_buy_order(self, price: float):
         """Create threshold buy order"""
@@ -531,12 +712,7 @@ class CTCycleV2:
             'total_volume': self.total_volume,
             'lot_idx': self.lot_idx,
             'zone_index': self.zone_index,
-            'initial_orders': self.initial_orders,
-            'hedge_orders': self.hedge_orders,
-            'recovery_orders': self.recovery_orders,
-            'pending_orders': self.pending_orders,
-            'threshold_orders': self.threshold_orders,
-            'closed_orders': self.closed_orders,
+            **{f'{order_type}_orders': orders for order_type, orders in self._order_lists.items()},
             'threshold_upper': self.threshold_upper,
             'threshold_lower': self.threshold_lower,
             'base_threshold_upper': self.base_threshold_upper,
@@ -553,7 +729,7 @@ class CTCycleV2:
         }
 
     async def send_event(self, event_type: str, content: Dict, severity: str = 'INFO'):
-        """Send real-time event to Supabase"""
+        """Queue a real-time event for a batched insert into Supabase"""
         try:
             event_data = {
                 'uuid': f"{datetime.utcnow().timestamp()}_{self.bot.id}_{self.id}",
@@ -562,10 +738,11 @@ class CTCycleV2:
                 'content': content,
                 'event_type': event_type,
                 'severity': severity,
-                'created_at': datetime.utcnow().isoformat()
+                'created_at': _now_iso()
             }
 
-            await self.supabase_client.table('events').insert(event_data).execute()
+            # Inserted in the background by the batching worker
+            _queue_event(self.supabase_client, event_data)
 
         except Exception as e:
             self.logger.error(f"Error sending event: {e}")
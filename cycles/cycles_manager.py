@@ -1,15 +1,17 @@
 from cycles.AH_cycle import cycle as AH_cycle
-from cycles.CT_cycle import cycle as CTcycle
+from cycles.CT_cycle import make_cycle as make_CT_cycle
 from DB.db_engine import engine
 from DB.ah_strategy.repositories.ah_repo import AHRepo
 from DB.ct_strategy.repositories.ct_repo import CTRepo
 import time
 import asyncio
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from Views.globals.app_logger import app_logger as logger
 
 
 class cycles_manager:
-    def __init__(self, mt5, remote_api, account):
+    def __init__(self, mt5, remote_api, account, enable_fix_pass=True):
         self.mt5 = mt5
         self.ah_repo = AHRepo(engine=engine)
         self.ct_repo = CTRepo(engine=engine)
@@ -18,76 +20,210 @@ class cycles_manager:
         self.remote_AH_cycles = []
         self.all_CT_cycles = []
         self.remote_CT_cycles = []
+        # local cycle id -> (row updated_at, cycle object, remote payload),
+        # reused across sync passes while the row is unchanged
+        self._ah_cycle_cache = {}
+        self._ct_cycle_cache = {}
+        # kind -> {remote cycle id: hash of the payload last pushed successfully}
+        self._last_pushed_hash = {}
         self.account = account
+        # Set by the realtime subscription whenever a cycle row changes
+        self._sync_requested = None
+        self._cycles_channel = None
+        # Safety-net resync when no change notification arrives
+        self.resync_interval = 30
+        # Notifications arriving this soon after the first share one pass
+        self.change_debounce = 0.1
+        # Closed-cycle repair scans a day of cycles, so it runs less often
+        self.enable_fix_pass = enable_fix_pass
+        self.fix_closed_interval = 300
+        self._last_fix_ts = float('-inf')
+        # Blocking repo/remote calls run here so the sync passes overlap
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=16, thread_name_prefix="cycles-io")
+        # Held while a sync pass runs; an overlapping pass is skipped
+        self._ah_lock = asyncio.Lock()
+        self._ct_lock = asyncio.Lock()
 
     def get_all_AH_active_cycles(self):
         try:
-            cycles = self.ah_repo.get_active_cycles(self.account.id)
-            active_cycles = [
-                cycle for cycle in cycles if cycle.is_closed is False]
-            return active_cycles
+            # Only (id, remote_id, updated_at) of the open cycles; full rows
+            # are fetched for the ones that changed
+            return self.ah_repo.get_active_cycle_keys(self.account.id)
         except Exception as e:
             logger.error(f"Error getting all AH active cycles: {e}")
             return []
 
     def get_all_CT_active_cycles(self):
         try:
-            cycles = self.ct_repo.get_active_cycles(self.account.id)
-            active_cycles = [
-                cycle for cycle in cycles if cycle.is_closed is False]
-            return active_cycles
+            # Only (id, remote_id, updated_at) of the open cycles; full rows
+            # are fetched for the ones that changed
+            return self.ct_repo.get_active_cycle_keys(self.account.id)
         except Exception as e:
             logger.error(f"Error getting all CT active cycles: {e}")
             return []
 
-    def get_remote_AH_active_cycles(self):
+    async def get_remote_AH_active_cycles(self):
         try:
-            cycles = self.remote_api.get_all_AH_active_cycles_by_account(
+            # Open cycles only, and only their ids; full rows are fetched for
+            # the few that need creating locally
+            cycles = await self.remote_api.get_all_AH_active_cycles_by_account(
                 self.account.id)
-            if cycles is None or len(cycles) == 0:
-                return []
-            active_cycles = [
-                cycle for cycle in cycles if cycle.is_closed is False]
-            return active_cycles
+            return cycles or []
         except Exception as e:
             logger.error(f"Error getting remote AH active cycles: {e}")
             return []
 
-    def get_remote_CT_active_cycles(self):
+    async def get_remote_CT_active_cycles(self):
         try:
-            cycles = self.remote_api.get_all_CT_active_cycles_by_account(
+            # Open cycles only, and only their ids; full rows are fetched for
+            # the few that need creating locally
+            cycles = await self.remote_api.get_all_CT_active_cycles_by_account(
                 self.account.id)
-            if cycles is None or len(cycles) == 0:
-                return []
-            active_cycles = [
-                cycle for cycle in cycles if cycle.is_closed is False]
-            return active_cycles
+            return cycles or []
         except Exception as e:
             logger.error(f"Error getting remote CT active cycles: {e}")
             return []
 
+    async def subscribe_to_cycle_changes(self):
+        """
+        Subscribe to Supabase Realtime changes on this account's cycles.
+
+        Returns:
+            bool: True if the subscription is active, False to keep polling
+        """
+        auth_service = getattr(self.remote_api, "auth_service", None)
+        client = getattr(auth_service, "client", None)
+        if client is None:
+            logger.warning(
+                "No realtime client available, cycles manager will poll")
+            return False
+
+        loop = asyncio.get_running_loop()
+        self._sync_requested = asyncio.Event()
+
+        def on_cycle_change(payload):
+            loop.call_soon_threadsafe(self._sync_requested.set)
+
+        try:
+            self._cycles_channel = client.channel(
+                f"cycles-{self.account.id}")
+            self._cycles_channel.on_postgres_changes(
+                "*",
+                schema="public",
+                table="cycles",
+                filter=f"account=eq.{self.account.id}",
+                callback=on_cycle_change,
+            )
+            await self._cycles_channel.subscribe()
+            logger.info(
+                f"Subscribed to cycle changes for account {self.account.id}")
+            return True
+        except Exception as e:
+            logger.error(f"Error subscribing to cycle changes: {e}")
+            self._sync_requested = None
+            return False
+
+    async def wait_for_cycle_changes(self):
+        """Wait for a change notification, or poll when not subscribed"""
+        if self._sync_requested is None:
+            await asyncio.sleep(1)
+            return
+
+        try:
+            await asyncio.wait_for(self._sync_requested.wait(), self.resync_interval)
+            # Let a burst of writes settle so it triggers a single pass
+            await asyncio.sleep(self.change_debounce)
+        except asyncio.TimeoutError:
+            pass
+        self._sync_requested.clear()
+
     async def run_cycles_manager(self):
+        await self.subscribe_to_cycle_changes()
         while True:
             try:
-                await asyncio.gather(
-                    self.sync_AH_cycles(),
-                    self.sync_CT_cycles(),
-                    self.fix_incorrectly_closed_cycles()
-                )
-                await asyncio.sleep(1)
+                passes = [self.sync_AH_cycles(), self.sync_CT_cycles()]
+                if self.enable_fix_pass and \
+                        time.monotonic() - self._last_fix_ts >= self.fix_closed_interval:
+                    self._last_fix_ts = time.monotonic()
+                    passes.append(self.fix_incorrectly_closed_cycles())
+                await asyncio.gather(*passes)
+                await self.wait_for_cycle_changes()
             except Exception as e:
                 logger.error(f"Error in run_cycles_manager: {e}")
 
+    async def _run_blocking(self, func, *args):
+        """Run a blocking repo, remote or cycle-building call on the I/O pool"""
+        return await asyncio.get_running_loop().run_in_executor(self._io_pool, func, *args)
+
+    async def _fetch_stale_rows(self, cycle_keys, cycle_cache, repo):
+        """
+        Fetch full rows for the active cycles whose cached object is out of date.
+
+        Args:
+            cycle_keys: (id, remote_id, updated_at) of the active cycles
+            cycle_cache: The pass cache of (updated_at, cycle object, payload)
+            repo: The repository for the cycle type (AH or CT)
+
+        Returns:
+            dict: Full rows keyed by cycle id; cycles missing here are current
+        """
+        stale_ids = []
+        for cycle_id, _, version in cycle_keys:
+            cached = cycle_cache.get(cycle_id)
+            if cached is None or version is None or cached[0] != version:
+                stale_ids.append(cycle_id)
+
+        if not stale_ids:
+            return {}
+        return await self._run_blocking(repo.get_cycles_by_remote_ids, stale_ids)
+
+    def _load_AH_cycle(self, cycle_data):
+        """Build an AH cycle from a local row along with its remote payload"""
+        cycle_obj = AH_cycle(cycle_data, self.mt5, self, "db")
+        return cycle_obj, cycle_obj.to_remote_dict()
+
+    def _load_CT_cycle(self, cycle_data, cycle_obj=None):
+        """Build (or refresh in place) a CT cycle along with its remote payload"""
+        if cycle_obj is None:
+            cycle_obj = make_CT_cycle(cycle_data, self.mt5, self, "db")
+        else:
+            cycle_obj.refresh(cycle_data)
+        return cycle_obj, cycle_obj.to_remote_dict()
+
     async def sync_AH_cycles(self):
+        """Run one AH sync pass, skipping it if the previous one is still running"""
+        if self._ah_lock.locked():
+            return
+        async with self._ah_lock:
+            await self._sync_AH_cycles()
+
+    async def _sync_AH_cycles(self):
         try:
-            self.all_AH_cycles = self.get_all_AH_active_cycles()  # get all orders from MT5
+            self.all_AH_cycles = await self._run_blocking(
+                self.get_all_AH_active_cycles)  # get all orders from MT5
             # get all orders from remote
-            self.remote_AH_cycles = self.get_remote_AH_active_cycles()
+            self.remote_AH_cycles = await self.get_remote_AH_active_cycles()
 
             if self.remote_AH_cycles is None:
                 logger.error("remote_AH_cycles is None")
                 return
 
+            local_remote_ids = {
+                remote_id for _, remote_id, _ in self.all_AH_cycles}
+            # Fetch the local rows of every remote-only cycle in one query
+            missing_ids = [
+                remote_cycle.id for remote_cycle in self.remote_AH_cycles
+                if remote_cycle is not None and remote_cycle.id not in local_remote_ids]
+            rows_by_remote_id = await self._run_blocking(
+                self.ah_repo.get_cycles_by_remote_ids, missing_ids) if missing_ids else {}
+            # Full remote rows for the cycles that have to be created locally
+            to_create = [
+                cycle_id for cycle_id in missing_ids if cycle_id not in rows_by_remote_id]
+            remote_rows = {
+                row.id: row for row in await self.remote_api.get_cycles_by_ids(to_create)} if to_create else {}
+            # Remote updates collected for a single bulk request
+            payload = []
             for remote_cycle in self.remote_AH_cycles:
                 try:
                     if remote_cycle is None:
@@ -96,19 +232,19 @@ class cycles_manager:
                         continue
 
                     cycle_id = remote_cycle.id
-                    if cycle_id not in [cycle.remote_id for cycle in self.all_AH_cycles]:
-                        cycle_data = self.ah_repo.get_cycle_by_remote_id(
-                            cycle_id)
+                    if cycle_id not in local_remote_ids:
+                        cycle_data = rows_by_remote_id.get(cycle_id)
                         if cycle_data is not None:
-                            cycle_obj = AH_cycle(
-                                cycle_data, self.mt5, self, "db")
-                            self.remote_api.update_AH_cycle_by_id(
-                                cycle_obj.cycle_id, cycle_obj.to_remote_dict())
+                            cycle_obj, remote_dict = await self._run_blocking(
+                                self._load_AH_cycle, cycle_data)
+                            payload.append(
+                                {**remote_dict, "id": cycle_obj.cycle_id})
                         if cycle_data is None:
                             try:
                                 cycle_obj = AH_cycle(
-                                    remote_cycle, self.mt5, self, "remote")
-                                self.ah_repo.create_cycle(cycle_obj.to_dict())
+                                    remote_rows[cycle_id], self.mt5, self, "remote")
+                                await self._run_blocking(
+                                    self.ah_repo.create_cycle, cycle_obj.to_dict())
                             except Exception as creation_error:
                                 logger.error(
                                     f"Error creating AH cycle from remote data: {creation_error}")
@@ -116,38 +252,74 @@ class cycles_manager:
                     logger.error(
                         f"Error processing remote AH cycle: {cycle_error}")
 
-            for cycle_data in self.all_AH_cycles:
+            # Push every local cycle to the remote in the same request
+            stale_rows = await self._fetch_stale_rows(
+                self.all_AH_cycles, self._ah_cycle_cache, self.ah_repo)
+            cycle_cache = {}
+            for cycle_id, _, version in self.all_AH_cycles:
                 try:
-                    if cycle_data is None:
-                        logger.error("Found None cycle_data in all_AH_cycles")
+                    cached = self._ah_cycle_cache.get(cycle_id)
+                    if cycle_id in stale_rows:
+                        cycle_obj, remote_dict = await self._run_blocking(
+                            self._load_AH_cycle, stale_rows[cycle_id])
+                    elif cached is not None and cached[0] == version:
+                        _, cycle_obj, remote_dict = cached
+                    else:
+                        # Closed since its key was read
                         continue
-
-                    cycle_obj = AH_cycle(cycle_data, self.mt5, self, "db")
+                    cycle_cache[cycle_id] = (version, cycle_obj, remote_dict)
                     remote_id = cycle_obj.cycle_id
 
                     if not remote_id:
                         logger.error(
-                            f"Empty remote_id for local AH cycle {cycle_data.id}")
+                            f"Empty remote_id for local AH cycle {cycle_id}")
                         continue
 
-                    self.remote_api.update_AH_cycle_by_id(
-                        remote_id, cycle_obj.to_remote_dict())
+                    payload.append({**remote_dict, "id": remote_id})
                 except Exception as local_cycle_error:
                     logger.error(
                         f"Error processing local AH cycle: {local_cycle_error}")
+
+            # Drop cycles that are no longer active
+            self._ah_cycle_cache = cycle_cache
+
+            await self.push_changed_cycles("AH", payload)
         except Exception as e:
             logger.error(f"Error in sync_AH_cycles: {e}")
 
     async def sync_CT_cycles(self):
+        """Run one CT sync pass, skipping it if the previous one is still running"""
+        if self._ct_lock.locked():
+            return
+        async with self._ct_lock:
+            await self._sync_CT_cycles()
+
+    async def _sync_CT_cycles(self):
         try:
-            self.all_CT_cycles = self.get_all_CT_active_cycles()
+            self.all_CT_cycles = await self._run_blocking(
+                self.get_all_CT_active_cycles)
 
-            self.remote_CT_cycles = self.get_remote_CT_active_cycles()
+            self.remote_CT_cycles = await self.get_remote_CT_active_cycles()
 
             if self.remote_CT_cycles is None:
                 logger.error("remote_CT_cycles is None")
                 return
 
+            local_remote_ids = {
+                remote_id for _, remote_id, _ in self.all_CT_cycles}
+            # Fetch the local rows of every remote-only cycle in one query
+            missing_ids = [
+                remote_cycle.id for remote_cycle in self.remote_CT_cycles
+                if remote_cycle is not None and remote_cycle.id not in local_remote_ids]
+            rows_by_remote_id = await self._run_blocking(
+                self.ct_repo.get_cycles_by_remote_ids, missing_ids) if missing_ids else {}
+            # Full remote rows for the cycles that have to be created locally
+            to_create = [
+                cycle_id for cycle_id in missing_ids if cycle_id not in rows_by_remote_id]
+            remote_rows = {
+                row.id: row for row in await self.remote_api.get_cycles_by_ids(to_create)} if to_create else {}
+            # Remote updates collected for a single bulk request
+            payload = []
             for remote_cycle in self.remote_CT_cycles:
                 if remote_cycle is None:
                     logger.error("Found None remote_cycle in remote_CT_cycles")
@@ -156,20 +328,20 @@ class cycles_manager:
                 try:
                     cycle_id = remote_cycle.id
 
-                    if cycle_id not in [cycle.remote_id for cycle in self.all_CT_cycles]:
-                        cycle_data = self.ct_repo.get_cycle_by_remote_id(
-                            cycle_id)
+                    if cycle_id not in local_remote_ids:
+                        cycle_data = rows_by_remote_id.get(cycle_id)
 
                         if cycle_data is not None:
-                            cycle_obj = CTcycle(
-                                cycle_data, self.mt5, self, "db")
-                            self.remote_api.update_CT_cycle_by_id(
-                                cycle_obj.cycle_id, cycle_obj.to_remote_dict())
+                            cycle_obj, remote_dict = await self._run_blocking(
+                                self._load_CT_cycle, cycle_data)
+                            payload.append(
+                                {**remote_dict, "id": cycle_obj.cycle_id})
                         if cycle_data is None:
                             try:
-                                cycle_obj = CTcycle(
-                                    remote_cycle, self.mt5, self, "remote")
-                                self.ct_repo.create_cycle(cycle_obj.to_dict())
+                                cycle_obj = make_CT_cycle(
+                                    remote_rows[cycle_id], self.mt5, self, "remote")
+                                await self._run_blocking(
+                                    self.ct_repo.create_cycle, cycle_obj.to_dict())
                             except Exception as creation_error:
                                 logger.error(
                                     f"Error creating cycle from remote data: {creation_error}")
@@ -177,29 +349,72 @@ class cycles_manager:
                     logger.error(
                         f"Error processing remote cycle: {cycle_error}")
 
-            for cycle_data in self.all_CT_cycles:
+            # Push every local cycle to the remote in the same request
+            stale_rows = await self._fetch_stale_rows(
+                self.all_CT_cycles, self._ct_cycle_cache, self.ct_repo)
+            cycle_cache = {}
+            for cycle_id, _, version in self.all_CT_cycles:
                 try:
-                    if cycle_data is None:
-                        logger.error("Found None cycle_data in all_CT_cycles")
+                    cached = self._ct_cycle_cache.get(cycle_id)
+                    if cycle_id in stale_rows:
+                        cycle_obj, remote_dict = await self._run_blocking(
+                            self._load_CT_cycle, stale_rows[cycle_id],
+                            cached[1] if cached is not None else None)
+                    elif cached is not None and cached[0] == version:
+                        _, cycle_obj, remote_dict = cached
+                    else:
+                        # Closed since its key was read
                         continue
-
-                    cycle_obj = CTcycle(cycle_data, self.mt5, self, "db")
+                    cycle_cache[cycle_id] = (version, cycle_obj, remote_dict)
                     remote_id = cycle_obj.cycle_id
 
                     if not remote_id:
                         logger.error(
-                            f"Empty remote_id for local cycle {cycle_data.id}")
+                            f"Empty remote_id for local cycle {cycle_id}")
                         continue
 
-                    remote_dict = cycle_obj.to_remote_dict()
-                    self.remote_api.update_CT_cycle_by_id(
-                        remote_id, remote_dict)
+                    payload.append({**remote_dict, "id": remote_id})
                 except Exception as local_cycle_error:
                     logger.error(
                         f"Error processing local cycle: {local_cycle_error}")
+
+            # Drop cycles that are no longer active
+            self._ct_cycle_cache = cycle_cache
+
+            await self.push_changed_cycles("CT", payload)
         except Exception as e:
             logger.error(f"Error in sync_CT_cycles: {e}")
 
+    async def push_changed_cycles(self, kind, payload):
+        """
+        Push only the cycles whose payload changed since the last successful push.
+
+        Args:
+            kind: "AH" or "CT", the sync pass the payload comes from
+            payload: Remote cycle dicts, each carrying its remote "id"
+        """
+        previous = self._last_pushed_hash.get(kind, {})
+        # Rebuilt from this pass, so cycles that are no longer active drop out
+        pushed = {}
+        changed = []
+        hashes = {}
+        for remote_dict in payload:
+            payload_hash = hash(orjson.dumps(
+                remote_dict, default=str,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS))
+            remote_id = remote_dict["id"]
+            if previous.get(remote_id) == payload_hash:
+                pushed[remote_id] = payload_hash
+            else:
+                changed.append(remote_dict)
+                hashes[remote_id] = payload_hash
+
+        if changed:
+            # only cycles that were written are remembered; the rest retry next pass
+            for remote_id in await self.remote_api.bulk_update_cycles(changed):
+                pushed[remote_id] = hashes[remote_id]
+        self._last_pushed_hash[kind] = pushed
+
     async def fix_incorrectly_closed_cycles(self):
         """
         Check for cycles that are marked as closed but still have open orders in MT5.
@@ -208,22 +423,33 @@ class cycles_manager:
         try:
             # Get all closed cycles from the last 24 hours
             time_24h_ago = int(time.time()) - (24 * 60 * 60)
-            closed_ah_cycles = self.ah_repo.get_recently_closed_cycles(
-                self.account.id, time_24h_ago)
-            closed_ct_cycles = self.ct_repo.get_recently_closed_cycles(
-                self.account.id, time_24h_ago)
-
-            # Process AH cycles
-            fixed_ah_count = 0
-            for cycle_data in closed_ah_cycles:
-                if await self.check_and_fix_closed_cycle(cycle_data, self.ah_repo, AH_cycle, "AH"):
-                    fixed_ah_count += 1
-
-            # Process CT cycles
-            fixed_ct_count = 0
-            for cycle_data in closed_ct_cycles:
-                if await self.check_and_fix_closed_cycle(cycle_data, self.ct_repo, CTcycle, "CT"):
-                    fixed_ct_count += 1
+            closed_ah_cycles, closed_ct_cycles = await asyncio.gather(
+                self._run_blocking(self.ah_repo.get_recently_closed_cycles,
+                                   self.account.id, time_24h_ago),
+                self._run_blocking(self.ct_repo.get_recently_closed_cycles,
+                                   self.account.id, time_24h_ago))
+
+            # One snapshot of what is open in MT5, shared by every cycle check
+            open_positions = {
+                position.ticket: position for position in self.mt5.get_all_positions() or ()}
+            open_orders = {
+                order.ticket: order for order in self.mt5.get_all_orders() or ()}
+
+            # Check every cycle concurrently so the repo/remote updates overlap
+            ah_results, ct_results = await asyncio.gather(
+                asyncio.gather(*(
+                    self.check_and_fix_closed_cycle(
+                        cycle_data, self.ah_repo, AH_cycle, "AH",
+                        open_positions, open_orders)
+                    for cycle_data in closed_ah_cycles), return_exceptions=True),
+                asyncio.gather(*(
+                    self.check_and_fix_closed_cycle(
+                        cycle_data, self.ct_repo, make_CT_cycle, "CT",
+                        open_positions, open_orders)
+                    for cycle_data in closed_ct_cycles), return_exceptions=True)
+            )
+            fixed_ah_count = sum(result is True for result in ah_results)
+            fixed_ct_count = sum(result is True for result in ct_results)
 
             if fixed_ah_count > 0 or fixed_ct_count > 0:
                 logger.info(
@@ -231,7 +457,8 @@ class cycles_manager:
         except Exception as e:
             logger.error(f"Error in fix_incorrectly_closed_cycles: {e}")
 
-    async def check_and_fix_closed_cycle(self, cycle_data, repo, cycle_class, cycle_type):
+    async def check_and_fix_closed_cycle(self, cycle_data, repo, cycle_class, cycle_type,
+                                         open_positions, open_orders):
         """
         Check if a cycle still has open orders in MT5 and fix its status if needed.
 
@@ -240,6 +467,8 @@ class cycles_manager:
             repo: The repository for the cycle type (AH or CT)
             cycle_class: The cycle class to instantiate
             cycle_type: A string indicating the cycle type ("AH" or "CT")
+            open_positions: Open MT5 positions keyed by ticket
+            open_orders: Pending MT5 orders keyed by ticket
 
         Returns:
             bool: True if the cycle was fixed, False otherwise
@@ -249,26 +478,18 @@ class cycles_manager:
             cycle_obj = cycle_class(cycle_data, self.mt5, self, "db")
 
             # Get all order tickets from this cycle
-            all_cycle_orders = cycle_obj.combine_orders()
+            cycle_tickets = set(cycle_obj.combine_orders())
 
             # Check if any orders are still open in MT5
-            still_open = False
-            for ticket in all_cycle_orders:
-                # Check if the order is still open in MT5
-                position = self.mt5.get_position_by_ticket(ticket=ticket)
-                if position and len(position) > 0:
-                    logger.warning(
-                        f"Found open position {ticket} in MT5 for closed {cycle_type} cycle {cycle_data.id}")
-                    still_open = True
-                    break
-
-                # Also check pending orders
-                pending = self.mt5.get_order_by_ticket(ticket=ticket)
-                if pending and len(pending) > 0:
-                    logger.warning(
-                        f"Found pending order {ticket} in MT5 for closed {cycle_type} cycle {cycle_data.id}")
-                    still_open = True
-                    break
+            open_tickets = cycle_tickets & open_positions.keys()
+            pending_tickets = cycle_tickets & open_orders.keys()
+            still_open = bool(open_tickets or pending_tickets)
+            if open_tickets:
+                logger.warning(
+                    f"Found open positions {sorted(open_tickets)} in MT5 for closed {cycle_type} cycle {cycle_data.id}")
+            if pending_tickets:
+                logger.warning(
+                    f"Found pending orders {sorted(pending_tickets)} in MT5 for closed {cycle_type} cycle {cycle_data.id}")
 
             # If we found open orders, update the cycle status
             if still_open:
@@ -280,16 +501,17 @@ class cycles_manager:
                 cycle_obj.status = "open"  # Reset status to open
 
                 # Update in database
-                repo.Update_cycle(cycle_data.id, cycle_obj.to_dict())
+                await self._run_blocking(
+                    repo.Update_cycle, cycle_data.id, cycle_obj.to_dict())
 
                 # Update in remote API if it has a remote ID
                 if cycle_obj.cycle_id:
                     if cycle_type == "AH":
-                        self.remote_api.update_AH_cycle_by_id(
-                            cycle_obj.cycle_id, cycle_obj.to_remote_dict())
+                        update_remote = self.remote_api.update_AH_cycle_by_id
                     else:
-                        self.remote_api.update_CT_cycle_by_id(
-                            cycle_obj.cycle_id, cycle_obj.to_remote_dict())
+                        update_remote = self.remote_api.update_CT_cycle_by_id
+                    await self._run_blocking(
+                        update_remote, cycle_obj.cycle_id, cycle_obj.to_remote_dict())
 
                 return True
 
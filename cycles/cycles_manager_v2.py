@@ -4,14 +4,55 @@ Manages all cycles across strategies with direct Supabase operations
 """
 
 import asyncio
+import heapq
 import logging
+import time
+from collections import defaultdict
+import numpy as np
 from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
-from cycles.CT_cycle_v2 import CTCycleV2
+from datetime import datetime, timedelta, timezone
+from cycles.CT_cycle_v2 import CTCycleV2, flush_events
 from cycles.AH_cycle_v2 import AHCycleV2
 
 logger = logging.getLogger(__name__)
 
+# Writers stamp updated_at before their write lands (cached or tick-start
+# timestamps), so a row can arrive stamped below the newest updated_at
+# already seen. Incremental loads look back this far past that value.
+UPDATED_AT_MARGIN = timedelta(seconds=60)
+
+
+def _parse_updated_at(value) -> Optional[datetime]:
+    """An updated_at value as an aware UTC datetime, None if unreadable"""
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+# uvloop runs the event loop on libuv; it is optional and not available on
+# Windows, where the default loop is kept. Installed at import time so the
+# loop created by asyncio.run() in the launchers already uses it.
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    uvloop = None
+
+
+class MockBot:
+    """Minimal bot stand-in for cycles loaded outside of a strategy"""
+    __slots__ = ('id', 'account_id', 'magic', 'strategy_id')
+
+    def __init__(self, bot_id: str, account_id: str):
+        self.id = bot_id
+        self.account_id = account_id
+        self.magic = 123456  # Default magic number
+        self.strategy_id = 'unknown'  # Will be set by strategy
+
 
 class CyclesManagerV2:
     """
@@ -19,6 +60,10 @@ class CyclesManagerV2:
     Handles cycle synchronization, validation, and lifecycle management
     """
 
+    # Order id list attributes of a cycle (AH cycles have no threshold_orders)
+    ORDER_LIST_NAMES = ('initial_orders', 'hedge_orders', 'recovery_orders',
+                        'pending_orders', 'threshold_orders', 'closed_orders')
+
     def __init__(self, meta_trader, supabase_client, account_id: str, orders_manager, websocket_service=None):
         self.meta_trader = meta_trader
         self.supabase_client = supabase_client
@@ -32,13 +77,28 @@ class CyclesManagerV2:
         self.ct_cycles = {}      # cycle_id -> CTCycleV2 object
         self.ah_cycles = {}      # cycle_id -> AHCycleV2 object
         self.closed_cycles_buffer = {}  # Recently closed cycles for validation
+        # Min-heap of (monotonic expiry, cycle_id) evicting the closed buffer
+        self.closed_buffer_ttl = 3600
+        self._close_expiry = []
+        self._close_deadline = {}  # cycle_id -> expiry of its latest entry
+        self._mock_bots = {}  # (bot_id, account_id) -> shared MockBot
+        self._validation_sig = {}  # cycle_id -> order lists hash last validated
+        self._cycle_kind = {}  # cycle_id -> 'AH' or 'CT'
 
         # Performance optimization
         # 1 second for cycles (less frequent than orders)
         self.update_interval = 1.0
         self.last_sync_time = datetime.utcnow()
         self.validation_interval = 30  # Validate cycle integrity every 30 seconds
-        self.last_validation_time = datetime.utcnow()
+        self.last_validation_time = None  # event loop time, set on start
+
+        # Realtime subscription on this account's cycles; while it is up the
+        # full reload only runs as a safety net every resync_interval seconds
+        self._cycles_channel = None
+        self.resync_interval = 30
+        self.last_load_time = None  # event loop time of the last full load
+        # (count, latest updated_at) of the active cycles at the last full load
+        self._active_cycles_loaded = None
 
         # Statistics
         self.sync_count = 0
@@ -47,34 +107,107 @@ class CyclesManagerV2:
         self.cycles_created = 0
         self.cycles_closed = 0
 
+        # Running profit totals per strategy, moved by each cycle's change
+        self._counted_profit = {}  # cycle_id -> profit included in the totals
+        self._ct_profit_sum = 0.0
+        self._ah_profit_sum = 0.0
+
     async def start(self):
         """Start the cycles manager"""
         self.logger.info(
             f"Starting CyclesManagerV2 for account {self.account_id}")
+        # Run fanned-out coroutines eagerly: most per-cycle checks finish
+        # without suspending, so they never need a scheduled Task
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+        await self.subscribe_to_cycle_changes()
         await self.run_cycles_manager()
 
+    async def shutdown(self):
+        """Send the cycle events still waiting for a batch"""
+        await flush_events()
+
+    async def subscribe_to_cycle_changes(self) -> bool:
+        """Subscribe to Supabase Realtime changes on this account's cycles"""
+        loop = asyncio.get_running_loop()
+
+        def on_cycle_change(payload):
+            # The realtime client may call back from its own thread
+            asyncio.run_coroutine_threadsafe(
+                self._on_cycle_change(payload), loop)
+
+        try:
+            self._cycles_channel = self.supabase_client.channel(
+                f"cycles:{self.account_id}")
+            self._cycles_channel.on_postgres_changes(
+                "*",
+                schema="public",
+                table="cycles",
+                filter=f"account=eq.{self.account_id}",
+                callback=on_cycle_change,
+            )
+            await self._cycles_channel.subscribe()
+            self.logger.info(
+                f"Subscribed to cycle changes for account {self.account_id}")
+            return True
+        except Exception as e:
+            self.logger.error(
+                f"Error subscribing to cycle changes, polling instead: {e}")
+            self._cycles_channel = None
+            return False
+
+    async def _on_cycle_change(self, payload: Dict):
+        """Apply a realtime INSERT/UPDATE/DELETE of a cycle row"""
+        try:
+            change = payload.get('data', payload)
+            event_type = change.get('type') or change.get('eventType')
+            record = change.get('record') or change.get('new') or {}
+            old_record = change.get('old_record') or change.get('old') or {}
+
+            if event_type == 'DELETE' or record.get('is_closed'):
+                cycle_id = record.get('id') or old_record.get('id')
+                if cycle_id in self.active_cycles:
+                    self.remove_cycle(cycle_id)
+            elif record.get('id'):
+                await self.track_cycle(record)
+
+        except Exception as e:
+            self.logger.error(f"Error applying cycle change: {e}")
+
     async def run_cycles_manager(self):
         """Main cycles management loop"""
+        # Intervals are measured on the loop's monotonic clock; wall-clock
+        # time is only taken for what gets persisted
+        loop = asyncio.get_running_loop()
+        if self.last_validation_time is None:
+            self.last_validation_time = loop.time()
+
         while True:
             try:
-                start_time = datetime.utcnow()
-
-                # Load and sync cycles
-                await asyncio.gather(
-                    self.load_active_cycles(),
-                    self.sync_cycle_profits(),
+                start_time = loop.time()
+                # One timestamp for every write made during this tick
+                now = datetime.utcnow()
+                now_iso = now.isoformat()
+
+                # Load and sync cycles; with realtime changes flowing in, the
+                # full reload is only a periodic safety net
+                tasks = [
+                    self.sync_cycle_profits(now_iso),
                     self.validate_cycle_integrity()
-                )
+                ]
+                if (self._cycles_channel is None or self.last_load_time is None or
+                        start_time - self.last_load_time >= self.resync_interval):
+                    tasks.append(self.load_active_cycles(now_iso))
+                    self.last_load_time = start_time
+                await asyncio.gather(*tasks)
 
                 # Check for incorrectly closed cycles
-                if (datetime.utcnow() - self.last_validation_time).seconds >= self.validation_interval:
-                    await self.fix_incorrectly_closed_cycles()
-                    self.last_validation_time = datetime.utcnow()
+                if start_time - self.last_validation_time >= self.validation_interval:
+                    await self.fix_incorrectly_closed_cycles(now)
+                    self.last_validation_time = start_time
 
                 # Performance tracking
                 self.sync_count += 1
-                sync_duration = (datetime.utcnow() -
-                                 start_time).total_seconds()
+                sync_duration = loop.time() - start_time
 
                 if self.sync_count % 30 == 0:  # Log every 30 cycles
                     self.logger.info(
@@ -90,82 +223,156 @@ class CyclesManagerV2:
                 self.logger.error(f"Error in cycles manager loop: {e}")
                 await asyncio.sleep(5)  # Wait longer on error
 
-    async def load_active_cycles(self):
+    async def load_active_cycles(self, now_iso: Optional[str] = None):
         """Load all active cycles from Supabase"""
         try:
-            # Get all active cycles for this account
-            result = await self.supabase_client.table('cycles').select(
+            # Skip the heavy select when neither the number of active cycles
+            # nor their latest update changed since the last load. While that
+            # update is recent a late write may still land below it, so the
+            # select runs anyway.
+            version = await self._active_cycles_version()
+            if version is not None and version == self._active_cycles_loaded:
+                latest = _parse_updated_at(version[1]) if version[1] else None
+                if latest is None or latest <= datetime.now(timezone.utc) - UPDATED_AT_MARGIN:
+                    return
+
+            # Only rows updated since the last full load, minus the margin for
+            # late writes, are downloaded; the ids of all active cycles
+            # reveal the ones closed meanwhile
+            watermark = None
+            if self._active_cycles_loaded and self._active_cycles_loaded[1]:
+                loaded_latest = _parse_updated_at(self._active_cycles_loaded[1])
+                if loaded_latest is not None:
+                    watermark = (loaded_latest - UPDATED_AT_MARGIN).isoformat()
+            rows_query = self.supabase_client.table('cycles').select(
                 '*, orders(*)'
-            ).eq('account', self.account_id).eq('is_closed', False).execute()
-
-            # Clear previous data
-            current_cycle_ids = set()
-
-            for cycle_data in result.data:
-                cycle_id = cycle_data['id']
-                current_cycle_ids.add(cycle_id)
-
-                # Determine cycle type and create appropriate object
-                cycle_type = cycle_data.get('cycle_type', 'BUY')
-
-                # Check if this is a hedge cycle (AdaptiveHedging)
-                if ('hedge_levels' in cycle_data and cycle_data['hedge_levels']) or cycle_type == 'HEDGE':
-                    # AdaptiveHedging cycle
-                    if cycle_id not in self.ah_cycles:
-                        ah_cycle = AHCycleV2(
-                            self.supabase_client,
-                            self.meta_trader,
-                            self.create_mock_bot(cycle_data),
-                            cycle_data
-                        )
-                        self.ah_cycles[cycle_id] = ah_cycle
-                        self.active_cycles[cycle_id] = ah_cycle
-                    else:
-                        # Update existing cycle with latest data
-                        await self.update_cycle_data(self.ah_cycles[cycle_id], cycle_data)
-                else:
-                    # CycleTrader cycle
-                    if cycle_id not in self.ct_cycles:
-                        ct_cycle = CTCycleV2(
-                            self.supabase_client,
-                            self.meta_trader,
-                            self.create_mock_bot(cycle_data),
-                            cycle_data
-                        )
-                        self.ct_cycles[cycle_id] = ct_cycle
-                        self.active_cycles[cycle_id] = ct_cycle
-                    else:
-                        # Update existing cycle with latest data
-                        await self.update_cycle_data(self.ct_cycles[cycle_id], cycle_data)
+            ).eq('account', self.account_id).eq('is_closed', False)
+            if watermark is not None:
+                rows_query = rows_query.gte('updated_at', watermark)
+
+            ids_result, result = await asyncio.gather(
+                self.supabase_client.table('cycles').select('id').eq(
+                    'account', self.account_id).eq('is_closed', False).execute(),
+                rows_query.execute()
+            )
+            current_cycle_ids = {row['id'] for row in ids_result.data}
+            cycle_rows = list(result.data)
+
+            # Active cycles not tracked yet, whatever their updated_at
+            untracked_ids = current_cycle_ids - self.active_cycles.keys() - \
+                {cycle_data['id'] for cycle_data in cycle_rows}
+            if untracked_ids:
+                untracked_result = await self.supabase_client.table('cycles').select(
+                    '*, orders(*)'
+                ).in_('id', list(untracked_ids)).execute()
+                cycle_rows.extend(untracked_result.data)
+
+            for cycle_data in cycle_rows:
+                if cycle_data['id'] in current_cycle_ids:
+                    await self.track_cycle(cycle_data, now_iso)
 
             # Remove cycles that are no longer active
             for cycle_id in list(self.active_cycles.keys()):
                 if cycle_id not in current_cycle_ids:
                     self.remove_cycle(cycle_id)
 
+            self._active_cycles_loaded = version
+            self.last_sync_time = datetime.utcnow()
+
         except Exception as e:
             self.logger.error(f"Error loading active cycles: {e}")
 
-    def create_mock_bot(self, cycle_data: Dict) -> object:
-        """Create a mock bot object from cycle data for compatibility"""
-        class MockBot:
-            def __init__(self, cycle_data):
-                self.id = cycle_data.get('bot', '')
-                self.account_id = cycle_data.get('account', '')
-                self.magic = 123456  # Default magic number
-                self.strategy_id = 'unknown'  # Will be set by strategy
+    async def _active_cycles_version(self) -> Optional[tuple]:
+        """(row count, latest updated_at) of the account's active cycles"""
+        try:
+            active = self.supabase_client.table('cycles')
+            count_result, latest_result = await asyncio.gather(
+                active.select('id', count='exact', head=True).eq(
+                    'account', self.account_id).eq('is_closed', False).execute(),
+                active.select('updated_at').eq('account', self.account_id).eq(
+                    'is_closed', False).order('updated_at', desc=True).limit(1).execute()
+            )
+            latest = latest_result.data[0]['updated_at'] if latest_result.data else None
+            return count_result.count, latest
 
-        return MockBot(cycle_data)
+        except Exception as e:
+            self.logger.error(f"Error checking active cycles version: {e}")
+            return None
+
+    async def track_cycle(self, cycle_data: Dict, now_iso: Optional[str] = None):
+        """Create the cycle object for a new active cycle or refresh a tracked one"""
+        cycle_id = cycle_data['id']
+
+        # Determine cycle type once; it does not change over a cycle's life
+        kind = self._cycle_kind.get(cycle_id)
+        if kind is None:
+            cycle_type = cycle_data.get('cycle_type', 'BUY')
+            # Check if this is a hedge cycle (AdaptiveHedging)
+            kind = 'AH' if cycle_data.get('hedge_levels') or cycle_type == 'HEDGE' else 'CT'
+            self._cycle_kind[cycle_id] = kind
+
+        if kind == 'AH':
+            # AdaptiveHedging cycle
+            if cycle_id not in self.ah_cycles:
+                ah_cycle = AHCycleV2(
+                    self.supabase_client,
+                    self.meta_trader,
+                    self.create_mock_bot(cycle_data),
+                    cycle_data
+                )
+                self.ah_cycles[cycle_id] = ah_cycle
+                self.active_cycles[cycle_id] = ah_cycle
+            else:
+                # Update existing cycle with latest data
+                await self.update_cycle_data(self.ah_cycles[cycle_id], cycle_data, now_iso)
+        else:
+            # CycleTrader cycle
+            if cycle_id not in self.ct_cycles:
+                ct_cycle = CTCycleV2(
+                    self.supabase_client,
+                    self.meta_trader,
+                    self.create_mock_bot(cycle_data),
+                    cycle_data
+                )
+                self.ct_cycles[cycle_id] = ct_cycle
+                self.active_cycles[cycle_id] = ct_cycle
+            else:
+                # Update existing cycle with latest data
+                await self.update_cycle_data(self.ct_cycles[cycle_id], cycle_data, now_iso)
+
+        self._count_cycle_profit(
+            cycle_id, self.active_cycles[cycle_id].total_profit)
+
+    def _count_cycle_profit(self, cycle_id: str, profit: float):
+        """Move the per-strategy profit totals by a cycle's profit change"""
+        profit = profit or 0.0
+        delta = profit - self._counted_profit.get(cycle_id, 0.0)
+        self._counted_profit[cycle_id] = profit
+        if cycle_id in self.ah_cycles:
+            self._ah_profit_sum += delta
+        else:
+            self._ct_profit_sum += delta
 
-    async def update_cycle_data(self, cycle_obj, latest_data: Dict):
+    def create_mock_bot(self, cycle_data: Dict) -> object:
+        """Create a mock bot object from cycle data for compatibility"""
+        key = (cycle_data.get('bot', ''), cycle_data.get('account', ''))
+        bot = self._mock_bots.get(key)
+        if bot is None:
+            bot = MockBot(*key)
+            self._mock_bots[key] = bot
+        return bot
+
+    async def update_cycle_data(self, cycle_obj, latest_data: Dict, now_iso: Optional[str] = None):
         """Update cycle object with latest data from database"""
         try:
             # Update key properties
             cycle_obj.total_profit = latest_data.get('total_profit', 0)
             cycle_obj.total_volume = latest_data.get('total_volume', 0)
             cycle_obj.status = latest_data.get('status', 'initial')
-            cycle_obj.updated_at = latest_data.get(
-                'updated_at', datetime.utcnow().isoformat())
+            updated_at = latest_data.get('updated_at')
+            if updated_at is None:
+                updated_at = now_iso or datetime.utcnow().isoformat()
+            cycle_obj.updated_at = updated_at
 
             # Update order arrays
             cycle_obj.initial_orders = latest_data.get('initial_orders', [])
@@ -192,10 +399,21 @@ class CyclesManagerV2:
     def remove_cycle(self, cycle_id: str):
         """Remove cycle from tracking"""
         try:
+            now = time.monotonic()
+
             # Move to closed buffer for validation
             if cycle_id in self.active_cycles:
                 self.closed_cycles_buffer[cycle_id] = self.active_cycles[cycle_id]
                 del self.active_cycles[cycle_id]
+                expiry = now + self.closed_buffer_ttl
+                self._close_deadline[cycle_id] = expiry
+                heapq.heappush(self._close_expiry, (expiry, cycle_id))
+
+            self._validation_sig.pop(cycle_id, None)
+            self._cycle_kind.pop(cycle_id, None)
+            if cycle_id in self._counted_profit:
+                self._count_cycle_profit(cycle_id, 0.0)
+                del self._counted_profit[cycle_id]
 
             # Remove from specific type tracking
             if cycle_id in self.ct_cycles:
@@ -203,140 +421,180 @@ class CyclesManagerV2:
             if cycle_id in self.ah_cycles:
                 del self.ah_cycles[cycle_id]
 
-            # Clean buffer periodically (keep only last hour)
-            current_time = datetime.utcnow()
-            for buffered_id, cycle_obj in list(self.closed_cycles_buffer.items()):
-                if hasattr(cycle_obj, 'updated_at'):
-                    cycle_time = datetime.fromisoformat(
-                        cycle_obj.updated_at.replace('Z', '+00:00'))
-                    if (current_time - cycle_time).total_seconds() > 3600:  # 1 hour
-                        del self.closed_cycles_buffer[buffered_id]
+            # Evict buffered cycles closed more than an hour ago; entries
+            # superseded by a later close of the same cycle are skipped
+            while self._close_expiry and self._close_expiry[0][0] <= now:
+                expiry, buffered_id = heapq.heappop(self._close_expiry)
+                if self._close_deadline.get(buffered_id) == expiry:
+                    del self._close_deadline[buffered_id]
+                    self.closed_cycles_buffer.pop(buffered_id, None)
 
         except Exception as e:
             self.logger.error(f"Error removing cycle {cycle_id}: {e}")
 
-    async def sync_cycle_profits(self):
+    async def sync_cycle_profits(self, now_iso: Optional[str] = None):
         """Sync cycle profits with current order status"""
         try:
-            update_tasks = []
-
-            for cycle_id, cycle_obj in self.active_cycles.items():
-                # Get orders for this cycle from orders manager
-                cycle_orders = await self.orders_manager.get_orders_by_cycle(cycle_id)
+            cycles = list(self.active_cycles.items())
+            if not cycles:
+                return
 
-                if cycle_orders:
-                    # Calculate current profit
-                    current_profit = sum(order.get('profit', 0)
-                                         for order in cycle_orders)
-                    current_volume = sum(order.get('volume', 0)
-                                         for order in cycle_orders)
+            # Current totals of every active cycle from orders manager
+            cycle_ids = [cycle_id for cycle_id, _ in cycles]
+            profits, volumes, counts = await self.orders_manager.get_cycle_totals(cycle_ids)
 
-                    # Check if profit has changed significantly
-                    if (abs(current_profit - cycle_obj.total_profit) >= 0.01 or
-                            abs(current_volume - cycle_obj.total_volume) >= 0.01):
+            known_profits = np.fromiter((cycle_obj.total_profit or 0 for _, cycle_obj in cycles),
+                                        dtype=np.float64, count=len(cycles))
+            known_volumes = np.fromiter((cycle_obj.total_volume or 0 for _, cycle_obj in cycles),
+                                        dtype=np.float64, count=len(cycles))
 
-                        update_tasks.append(self.update_cycle_profit(
-                            cycle_id, current_profit, current_volume
-                        ))
+            # Cycles with orders whose profit or volume changed significantly
+            changed_mask = (counts > 0) & (
+                (np.abs(profits - known_profits) >= 0.01) |
+                (np.abs(volumes - known_volumes) >= 0.01))
+            changed = [(cycle_ids[i], float(profits[i]), float(volumes[i]))
+                       for i in np.flatnonzero(changed_mask)]
 
-            # Execute all updates concurrently
-            if update_tasks:
-                await asyncio.gather(*update_tasks, return_exceptions=True)
+            # Write all changed cycles in a single request
+            if changed:
+                await self.update_cycle_profits(changed, now_iso)
 
         except Exception as e:
             self.logger.error(f"Error syncing cycle profits: {e}")
 
-    async def update_cycle_profit(self, cycle_id: str, profit: float, volume: float):
-        """Update single cycle profit in database"""
+    async def update_cycle_profits(self, changed: List[tuple], now_iso: Optional[str] = None):
+        """Update the profit of many existing cycles in one update_cycle_profits call"""
         try:
-            update_data = {
+            updated_at = now_iso or datetime.utcnow().isoformat()
+            rows = [{
+                'id': cycle_id,
                 'total_profit': round(profit, 2),
                 'total_volume': round(volume, 2),
-                'updated_at': datetime.utcnow().isoformat()
-            }
+                'updated_at': updated_at
+            } for cycle_id, profit, volume in changed]
 
-            # Update in Supabase
-            result = await self.supabase_client.table('cycles').update(update_data).eq('id', cycle_id).execute()
+            # Update in Supabase; only rows that still exist are written
+            result = await self.supabase_client.rpc(
+                'update_cycle_profits', {'rows': rows}).execute()
+            updated = {row['id'] for row in result.data or ()}
 
-            if result.data and cycle_id in self.active_cycles:
-                # Update local cache
-                cycle_obj = self.active_cycles[cycle_id]
-                cycle_obj.total_profit = profit
-                cycle_obj.total_volume = volume
-                cycle_obj.updated_at = update_data['updated_at']
-
-                # Send real-time update via WebSocket
-                if self.websocket_service:
-                    try:
-                        await self.websocket_service.send_cycle_update(self.account_id, {
-                            'cycle_id': cycle_id,
-                            'total_profit': profit,
-                            'total_volume': volume,
-                            'status': getattr(cycle_obj, 'status', 'active'),
-                            'updated_at': update_data['updated_at']
-                        })
-                    except Exception as e:
-                        self.logger.error(
-                            f"Error sending WebSocket cycle update: {e}")
+            async with asyncio.TaskGroup() as tg:
+                for cycle_id, profit, volume in changed:
+                    if cycle_id in updated:
+                        tg.create_task(self._apply_cycle_profit(
+                            cycle_id, profit, volume, updated_at))
 
         except Exception as e:
-            self.logger.error(f"Error updating cycle {cycle_id} profit: {e}")
+            self.logger.error(
+                f"Error updating profit of {len(changed)} cycles: {e}")
+
+    async def update_cycle_profit(self, cycle_id: str, profit: float, volume: float):
+        """Update single cycle profit in database"""
+        await self.update_cycle_profits([(cycle_id, profit, volume)])
+
+    async def _apply_cycle_profit(self, cycle_id: str, profit: float, volume: float, updated_at: str):
+        """Update the cached cycle and push the change over WebSocket"""
+        if cycle_id not in self.active_cycles:
+            return
+
+        # Update local cache
+        cycle_obj = self.active_cycles[cycle_id]
+        cycle_obj.total_profit = profit
+        cycle_obj.total_volume = volume
+        cycle_obj.updated_at = updated_at
+        self._count_cycle_profit(cycle_id, profit)
+
+        # Send real-time update via WebSocket
+        if self.websocket_service:
+            try:
+                await self.websocket_service.send_cycle_update(self.account_id, {
+                    'cycle_id': cycle_id,
+                    'total_profit': profit,
+                    'total_volume': volume,
+                    'status': getattr(cycle_obj, 'status', 'active'),
+                    'updated_at': updated_at
+                })
+            except Exception as e:
+                self.logger.error(
+                    f"Error sending WebSocket cycle update: {e}")
 
     async def validate_cycle_integrity(self):
         """Validate cycle integrity and fix issues"""
         try:
-            validation_tasks = []
-
-            for cycle_id, cycle_obj in self.active_cycles.items():
-                validation_tasks.append(
-                    self.validate_single_cycle(cycle_id, cycle_obj))
-
-            if validation_tasks:
-                results = await asyncio.gather(*validation_tasks, return_exceptions=True)
-                issues_found = sum(
-                    1 for result in results if isinstance(result, Exception))
-
-                if issues_found > 0:
-                    self.logger.warning(
-                        f"Found {issues_found} cycle integrity issues")
+            # Cycles whose order lists changed since they last passed validation
+            pending = {}
+            for cycle_id, cycle_obj in list(self.active_cycles.items()):
+                signature = self._order_lists_signature(cycle_obj)
+                if self._validation_sig.get(cycle_id) == signature:
+                    continue
+
+                cycle_order_ids = set(await cycle_obj.get_all_orders(include_closed=True))
+                if cycle_order_ids:
+                    pending[cycle_id] = (signature, cycle_order_ids)
+                else:
+                    self._validation_sig[cycle_id] = signature
 
-        except Exception as e:
-            self.logger.error(f"Error validating cycle integrity: {e}")
+            if not pending:
+                return
 
-    async def validate_single_cycle(self, cycle_id: str, cycle_obj):
-        """Validate single cycle integrity"""
-        try:
-            # Get all orders that should belong to this cycle
-            all_order_ids = await cycle_obj.get_all_orders(include_closed=True)
+            # Every order referencing one of those cycles, in one query
+            result = await self.supabase_client.table('orders').select(
+                'id, status, cycle').in_('cycle', list(pending)).execute()
 
-            # Check if all orders exist in database
-            if all_order_ids:
-                result = await self.supabase_client.table('orders').select('id, status').in_('id', all_order_ids).execute()
+            db_order_ids_by_cycle = defaultdict(set)
+            existing_order_ids = set()
+            for order in result.data:
+                db_order_ids_by_cycle[order.get('cycle')].add(order['id'])
+                existing_order_ids.add(order['id'])
+
+            # Listed orders stored under another cycle are looked up by id
+            unseen_order_ids = set().union(
+                *(order_ids for _, order_ids in pending.values())) - existing_order_ids
+            if unseen_order_ids:
+                unseen_result = await self.supabase_client.table('orders').select(
+                    'id').in_('id', list(unseen_order_ids)).execute()
+                existing_order_ids.update(
+                    order['id'] for order in unseen_result.data)
 
-                existing_order_ids = {order['id'] for order in result.data}
-                missing_order_ids = set(all_order_ids) - existing_order_ids
+            fix_tasks = []
+            for cycle_id, (signature, cycle_order_ids) in pending.items():
+                missing_order_ids = cycle_order_ids - existing_order_ids
+                orphaned_order_ids = db_order_ids_by_cycle.get(
+                    cycle_id, set()) - cycle_order_ids
+
+                if missing_order_ids or orphaned_order_ids:
+                    fix_tasks.append(self.fix_cycle_orders(
+                        cycle_id, missing_order_ids, orphaned_order_ids))
+                else:
+                    self._validation_sig[cycle_id] = signature
 
-                if missing_order_ids:
-                    self.logger.warning(
-                        f"Cycle {cycle_id} references missing orders: {missing_order_ids}")
-                    await self.fix_missing_orders(cycle_id, missing_order_ids)
+            if fix_tasks:
+                self.logger.warning(
+                    f"Found {len(fix_tasks)} cycle integrity issues")
+                async with asyncio.TaskGroup() as tg:
+                    for fix_task in fix_tasks:
+                        tg.create_task(fix_task)
 
-                # Check for orphaned orders (orders that reference this cycle but aren't in cycle's order lists)
-                orphaned_result = await self.supabase_client.table('orders').select('id').eq('cycle', cycle_id).execute()
+        except Exception as e:
+            self.logger.error(f"Error validating cycle integrity: {e}")
 
-                all_db_order_ids = {order['id']
-                                    for order in orphaned_result.data}
-                cycle_order_ids = set(all_order_ids)
-                orphaned_order_ids = all_db_order_ids - cycle_order_ids
+    @classmethod
+    def _order_lists_signature(cls, cycle_obj) -> int:
+        """Hash of a cycle's order id lists"""
+        return hash(tuple(tuple(getattr(cycle_obj, name, None) or ())
+                          for name in cls.ORDER_LIST_NAMES))
 
-                if orphaned_order_ids:
-                    self.logger.warning(
-                        f"Found orphaned orders for cycle {cycle_id}: {orphaned_order_ids}")
-                    await self.fix_orphaned_orders(cycle_id, orphaned_order_ids)
+    async def fix_cycle_orders(self, cycle_id: str, missing_order_ids, orphaned_order_ids):
+        """Fix a cycle's missing and orphaned order references"""
+        if missing_order_ids:
+            self.logger.warning(
+                f"Cycle {cycle_id} references missing orders: {missing_order_ids}")
+            await self.fix_missing_orders(cycle_id, missing_order_ids)
 
-        except Exception as e:
-            self.logger.error(f"Error validating cycle {cycle_id}: {e}")
-            raise e
+        if orphaned_order_ids:
+            self.logger.warning(
+                f"Found orphaned orders for cycle {cycle_id}: {orphaned_order_ids}")
+            await self.fix_orphaned_orders(cycle_id, orphaned_order_ids)
 
     async def fix_missing_orders(self, cycle_id: str, missing_order_ids: List[str]):
         """Fix cycle references to missing orders"""
@@ -345,21 +603,24 @@ class CyclesManagerV2:
             if not cycle_obj:
                 return
 
+            # Membership checked against a set, O(1) per listed order
+            missing_order_ids = set(missing_order_ids)
+
             # Remove missing order IDs from all order lists
-            for order_list_name in ['initial_orders', 'hedge_orders', 'recovery_orders',
-                                    'pending_orders', 'threshold_orders', 'closed_orders']:
-                if hasattr(cycle_obj, order_list_name):
-                    order_list = getattr(cycle_obj, order_list_name)
-                    if isinstance(order_list, list):
-                        original_length = len(order_list)
-                        setattr(cycle_obj, order_list_name, [
-                                oid for oid in order_list if oid not in missing_order_ids])
-                        if len(getattr(cycle_obj, order_list_name)) != original_length:
-                            self.logger.info(
-                                f"Removed {original_length - len(getattr(cycle_obj, order_list_name))} missing orders from {order_list_name}")
+            changed = False
+            for order_list_name in self.ORDER_LIST_NAMES:
+                order_list = getattr(cycle_obj, order_list_name, None)
+                if isinstance(order_list, list) and not missing_order_ids.isdisjoint(order_list):
+                    kept_orders = [
+                        oid for oid in order_list if oid not in missing_order_ids]
+                    setattr(cycle_obj, order_list_name, kept_orders)
+                    changed = True
+                    self.logger.info(
+                        f"Removed {len(order_list) - len(kept_orders)} missing orders from {order_list_name}")
 
-            # Update cycle in database
-            await cycle_obj.update_cycle()
+            # Update cycle in database, unless no list referenced them
+            if changed:
+                await cycle_obj.update_cycle()
 
         except Exception as e:
             self.logger.error(
@@ -375,36 +636,42 @@ class CyclesManagerV2:
             # Get order details to determine appropriate list
             result = await self.supabase_client.table('orders').select('*').in_('id', orphaned_order_ids).execute()
 
+            # Ids already tracked by the cycle, checked once per order in O(1)
+            known_order_ids = set(await cycle_obj.get_all_orders(include_closed=True))
+
             for order in result.data:
+                if order['id'] in known_order_ids:
+                    continue
+                known_order_ids.add(order['id'])
+
                 order_type = order.get('order_data', {}).get(
                     'order_type', 'initial')
                 order_status = order.get('status', 'EXECUTED')
 
                 # Add to appropriate list based on order type and status
                 if order_status == 'CLOSED':
-                    if order['id'] not in cycle_obj.closed_orders:
-                        cycle_obj.closed_orders.append(order['id'])
-                        self.logger.info(
-                            f"Added orphaned closed order {order['id']} to cycle {cycle_id}")
+                    cycle_obj.closed_orders.append(order['id'])
+                    self.logger.info(
+                        f"Added orphaned closed order {order['id']} to cycle {cycle_id}")
                 else:
                     # Add to appropriate active list
-                    if order_type == 'hedge' and order['id'] not in cycle_obj.hedge_orders:
+                    if order_type == 'hedge':
                         cycle_obj.hedge_orders.append(order['id'])
                         self.logger.info(
                             f"Added orphaned hedge order {order['id']} to cycle {cycle_id}")
-                    elif order_type == 'recovery' and order['id'] not in cycle_obj.recovery_orders:
+                    elif order_type == 'recovery':
                         cycle_obj.recovery_orders.append(order['id'])
                         self.logger.info(
                             f"Added orphaned recovery order {order['id']} to cycle {cycle_id}")
-                    elif order_type == 'pending' and order['id'] not in cycle_obj.pending_orders:
+                    elif order_type == 'pending':
                         cycle_obj.pending_orders.append(order['id'])
                         self.logger.info(
                             f"Added orphaned pending order {order['id']} to cycle {cycle_id}")
-                    elif order_type == 'threshold' and hasattr(cycle_obj, 'threshold_orders') and order['id'] not in cycle_obj.threshold_orders:
+                    elif order_type == 'threshold' and hasattr(cycle_obj, 'threshold_orders'):
                         cycle_obj.threshold_orders.append(order['id'])
                         self.logger.info(
                             f"Added orphaned threshold order {order['id']} to cycle {cycle_id}")
-                    elif order['id'] not in cycle_obj.initial_orders:
+                    else:
                         cycle_obj.initial_orders.append(order['id'])
                         self.logger.info(
                             f"Added orphaned order {order['id']} to initial orders for cycle {cycle_id}")
@@ -416,24 +683,29 @@ class CyclesManagerV2:
             self.logger.error(
                 f"Error fixing orphaned orders for cycle {cycle_id}: {e}")
 
-    async def fix_incorrectly_closed_cycles(self):
+    async def fix_incorrectly_closed_cycles(self, now: Optional[datetime] = None):
         """Check for cycles marked as closed but still have open orders in MT5"""
         try:
+            now = now or datetime.utcnow()
+            now_iso = now.isoformat()
+
             # Get recently closed cycles (last 24 hours)
-            time_24h_ago = (datetime.utcnow() -
-                            timedelta(hours=24)).isoformat()
+            time_24h_ago = (now - timedelta(hours=24)).isoformat()
 
             result = await self.supabase_client.table('cycles').select(
                 '*, orders(*)'
             ).eq('account', self.account_id).eq('is_closed', True).gte('updated_at', time_24h_ago).execute()
 
-            fix_tasks = []
-            for cycle_data in result.data:
-                fix_tasks.append(self.check_and_fix_closed_cycle(cycle_data))
-
-            if fix_tasks:
-                results = await asyncio.gather(*fix_tasks, return_exceptions=True)
-                fixed_count = sum(1 for result in results if result is True)
+            if result.data:
+                # check_and_fix_closed_cycle reports its own errors as False
+                async with asyncio.TaskGroup() as tg:
+                    fix_tasks = [
+                        tg.create_task(
+                            self.check_and_fix_closed_cycle(cycle_data, now_iso))
+                        for cycle_data in result.data
+                    ]
+                fixed_count = sum(
+                    1 for task in fix_tasks if task.result() is True)
 
                 if fixed_count > 0:
                     self.fixed_cycles_count += fixed_count
@@ -443,7 +715,7 @@ class CyclesManagerV2:
         except Exception as e:
             self.logger.error(f"Error fixing incorrectly closed cycles: {e}")
 
-    async def check_and_fix_closed_cycle(self, cycle_data: Dict) -> bool:
+    async def check_and_fix_closed_cycle(self, cycle_data: Dict, now_iso: Optional[str] = None) -> bool:
         """Check if a closed cycle still has open orders and reopen if needed"""
         try:
             cycle_id = cycle_data['id']
@@ -472,7 +744,7 @@ class CyclesManagerV2:
                 update_data = {
                     'is_closed': False,
                     'status': 'reopened',
-                    'updated_at': datetime.utcnow().isoformat()
+                    'updated_at': now_iso or datetime.utcnow().isoformat()
                 }
 
                 await self.supabase_client.table('cycles').update(update_data).eq('id', cycle_id).execute()
@@ -496,13 +768,14 @@ class CyclesManagerV2:
     async def send_cycle_event(self, event_type: str, content: Dict, severity: str = 'INFO'):
         """Send cycle-related event to Supabase"""
         try:
+            now = datetime.utcnow()
             event_data = {
-                'uuid': f"{datetime.utcnow().timestamp()}_{self.account_id}_cycles",
+                'uuid': f"{now.timestamp()}_{self.account_id}_cycles",
                 'account': self.account_id,
                 'content': content,
                 'event_type': event_type,
                 'severity': severity,
-                'created_at': datetime.utcnow().isoformat()
+                'created_at': now.isoformat()
             }
 
             await self.supabase_client.table('events').insert(event_data).execute()
@@ -538,16 +811,18 @@ class CyclesManagerV2:
     async def close_all_cycles(self, user_id: str = "system", username: str = "system") -> int:
         """Close all active cycles"""
         try:
-            close_tasks = []
             cycle_ids = list(self.active_cycles.keys())
 
-            for cycle_id in cycle_ids:
-                close_tasks.append(self.close_cycle_by_id(
-                    cycle_id, user_id, username))
-
-            if close_tasks:
-                results = await asyncio.gather(*close_tasks, return_exceptions=True)
-                closed_count = sum(1 for result in results if result is True)
+            if cycle_ids:
+                # close_cycle_by_id reports its own errors as False
+                async with asyncio.TaskGroup() as tg:
+                    close_tasks = [
+                        tg.create_task(self.close_cycle_by_id(
+                            cycle_id, user_id, username))
+                        for cycle_id in cycle_ids
+                    ]
+                closed_count = sum(
+                    1 for task in close_tasks if task.result() is True)
 
                 self.logger.info(
                     f"Closed {closed_count} out of {len(cycle_ids)} cycles")
@@ -561,10 +836,8 @@ class CyclesManagerV2:
 
     async def get_cycle_statistics(self) -> Dict:
         """Get cycles manager statistics"""
-        ct_profits = sum(
-            cycle.total_profit for cycle in self.ct_cycles.values())
-        ah_profits = sum(
-            cycle.total_profit for cycle in self.ah_cycles.values())
+        ct_profits = self._ct_profit_sum
+        ah_profits = self._ah_profit_sum
 
         return {
             'total_active_cycles': len(self.active_cycles),
@@ -8,6 +8,11 @@ from db.supabase_client import SupabaseClient
 
 logger = logging.getLogger(__name__)
 
+# Events sent within EVENT_BATCH_INTERVAL seconds are inserted with one
+# request; a batch is sent early once it reaches EVENT_BATCH_SIZE rows
+EVENT_BATCH_INTERVAL = 0.05
+EVENT_BATCH_SIZE = 500
+
 
 class EventType(Enum):
     """Event types for trading system communication"""
@@ -57,6 +62,9 @@ class EventHandler:
     """
     Event handler for real-time communication with the trading system
     Uses the 'events' collection for messaging and notifications
+
+    The Supabase client here is synchronous, so every execute() runs in a
+    worker thread to keep the event loop free while the request is in flight
     """
 
     def __init__(self, supabase_client: SupabaseClient):
@@ -65,6 +73,10 @@ class EventHandler:
         self.events_table = "events"
         self.listeners: Dict[str, List[Callable]] = {}
         self.subscription = None
+        # (row, future resolved with the inserted id) waiting for the next batch
+        self._pending: List[tuple[Dict[str, Any], asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
         logger.info("EventHandler initialized")
 
     async def send_event(
@@ -78,20 +90,16 @@ class EventHandler:
     ) -> str:
         """Send an event to the events table"""
         try:
-            event_data = {
-                "uuid": str(uuid.uuid4()),
-                "account": account_id,
-                "bot": bot_id,
-                "strategy": strategy_id,
-                "event_type": event_type.value,
-                "content": content,
-                "severity": severity.value,
-                "created_at": datetime.utcnow().isoformat()
-            }
+            future = asyncio.get_running_loop().create_future()
+            self._pending.append((self._build_event_row(
+                account_id, event_type, content, bot_id, strategy_id, severity), future))
 
-            response = self.client.table(
-                self.events_table).insert(event_data).execute()
-            event_id = response.data[0]["id"]
+            if len(self._pending) >= EVENT_BATCH_SIZE:
+                await self.flush()
+            elif self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._flush_later())
+
+            event_id = await future
 
             logger.info(
                 f"Event sent: {event_type.value} for account {account_id}")
@@ -100,6 +108,70 @@ class EventHandler:
             logger.error(f"Error sending event: {e}")
             raise
 
+    def _build_event_row(
+        self,
+        account_id: str,
+        event_type: EventType,
+        content: Dict[str, Any],
+        bot_id: Optional[str],
+        strategy_id: Optional[str],
+        severity: EventSeverity
+    ) -> Dict[str, Any]:
+        """Build the events table row for one event"""
+        return {
+            "uuid": str(uuid.uuid4()),
+            "account": account_id,
+            "bot": bot_id,
+            "strategy": strategy_id,
+            "event_type": event_type.value,
+            "content": content,
+            "severity": severity.value,
+            "created_at": datetime.utcnow().isoformat()
+        }
+
+    async def _flush_later(self):
+        await asyncio.sleep(EVENT_BATCH_INTERVAL)
+        await self.flush()
+
+    async def flush(self):
+        """Insert all pending events with a single multi-row insert"""
+        # The lock keeps batches, and so events of an account, in send order
+        async with self._flush_lock:
+            pending, self._pending = self._pending, []
+            if not pending:
+                return
+
+            try:
+                await self._insert_events(pending)
+            except Exception:
+                # One bad row fails the whole insert; retry the rows one at
+                # a time so only the bad ones fail their senders
+                for entry in pending:
+                    if entry[1].done():
+                        continue
+                    try:
+                        await self._insert_events([entry])
+                    except Exception as e:
+                        if not entry[1].done():
+                            entry[1].set_exception(e)
+
+    async def _insert_events(self, pending: list):
+        """Insert event rows and resolve their futures with the new ids"""
+        response = await asyncio.to_thread(
+            self.client.table(self.events_table).insert(
+                [row for row, _ in pending]).execute)
+
+        # Match inserted rows back to their senders by the event uuid
+        ids = {row["uuid"]: row["id"] for row in response.data or []}
+        for row, future in pending:
+            if future.done():
+                continue
+            if row["uuid"] in ids:
+                future.set_result(ids[row["uuid"]])
+            else:
+                future.set_exception(
+                    RuntimeError("Event insert returned no row"))
+
     async def send_bot_command(
         self,
         account_id: str,
@@ -240,7 +312,7 @@ class EventHandler:
                 event_type_values = [et.value for et in event_types]
                 query = query.in_("event_type", event_type_values)
 
-            response = query.execute()
+            response = await asyncio.to_thread(query.execute)
             return response.data
         except Exception as e:
             logger.error(f"Error getting recent events: {e}")
@@ -260,7 +332,7 @@ class EventHandler:
             if account_id:
                 query = query.eq("account", account_id)
 
-            response = query.execute()
+            response = await asyncio.to_thread(query.execute)
             return response.data
         except Exception as e:
             logger.error(f"Error getting events since {since}: {e}")
@@ -335,8 +407,9 @@ class EventHandler:
         """Mark an event as processed (add to content)"""
         try:
             # Get current event
-            response = self.client.table(self.events_table).select(
-                "content").eq("id", event_id).execute()
+            response = await asyncio.to_thread(
+                self.client.table(self.events_table).select(
+                    "content").eq("id", event_id).execute)
             if not response.data:
                 return
 
@@ -345,9 +418,10 @@ class EventHandler:
             current_content["processed_at"] = datetime.utcnow().isoformat()
 
             # Update event
-            self.client.table(self.events_table).update({
-                "content": current_content
-            }).eq("id", event_id).execute()
+            await asyncio.to_thread(
+                self.client.table(self.events_table).update({
+                    "content": current_content
+                }).eq("id", event_id).execute)
 
             logger.debug(f"Marked event {event_id} as processed")
         except Exception as e:
@@ -361,9 +435,10 @@ class EventHandler:
             cutoff_date = cutoff_date.replace(
                 day=cutoff_date.day - days_to_keep)
 
-            response = self.client.table(self.events_table).delete().lt(
-                "created_at", cutoff_date.isoformat()
-            ).execute()
+            response = await asyncio.to_thread(
+                self.client.table(self.events_table).delete().lt(
+                    "created_at", cutoff_date.isoformat()
+                ).execute)
 
             deleted_count = len(response.data) if response.data else 0
             logger.info(f"Cleaned up {deleted_count} old events")
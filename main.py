@@ -83,13 +83,10 @@ def main(page: flet.Page):
                 app_logger.info("No authenticated user, redirecting to login")
                 page.go(AppRoutes.LOGIN_SUPABASE)
 
-            page.update()
-
         except Exception as e:
             app_logger.error(f"Error initializing authentication: {e}")
             # Fallback to login page
             page.go(AppRoutes.LOGIN_SUPABASE)
-            page.update()
 
     async def fetch_legacy_data():
         """Legacy data fetching for backward compatibility - DEPRECATED"""
@@ -514,6 +514,10 @@ SYSTEM HEALTH:
             if all_tasks:
                 await asyncio.gather(*all_tasks, return_exceptions=True)
 
+            # Send queued cycle events before the connections go away
+            if self.cycles_manager:
+                await self.cycles_manager.shutdown()
+
             # Close connections
             if self.supabase_service:
                 await self.supabase_service.close()
@@ -0,0 +1,72 @@
+"""
+Direct Postgres Connection Pool
+asyncpg pool for hot-path queries that would otherwise go through the Supabase HTTP API
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Optional
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+# Singleton pool for global use
+_db_pool: Optional[asyncpg.Pool] = None
+_db_pool_lock = asyncio.Lock()
+
+# After a failed connect, callers fall back to Supabase until this
+# monotonic time instead of retrying (and timing out) on every call
+POOL_RETRY_BACKOFF = 60
+_db_pool_retry_at = 0.0
+
+
+async def get_db_pool() -> Optional[asyncpg.Pool]:
+    """
+    Get or create the global asyncpg pool.
+
+    Returns None when DATABASE_URL is not configured or the pool cannot be
+    created, so callers can fall back to the Supabase client. A failed
+    attempt is not repeated for POOL_RETRY_BACKOFF seconds.
+    """
+    global _db_pool, _db_pool_retry_at
+
+    if _db_pool is not None:
+        return _db_pool
+
+    dsn = os.getenv('DATABASE_URL')
+    if not dsn or time.monotonic() < _db_pool_retry_at:
+        return None
+
+    async with _db_pool_lock:
+        if _db_pool is None:
+            if time.monotonic() < _db_pool_retry_at:
+                return None
+            try:
+                _db_pool = await asyncpg.create_pool(
+                    dsn,
+                    min_size=int(os.getenv('DB_POOL_MIN_SIZE', 5)),
+                    max_size=int(os.getenv('DB_POOL_MAX_SIZE', 20)),
+                    command_timeout=float(os.getenv('QUERY_TIMEOUT', 60)),
+                    # Supavisor (transaction mode) does not support prepared statements
+                    statement_cache_size=0
+                )
+                logger.info("Postgres connection pool created")
+            except Exception as e:
+                _db_pool_retry_at = time.monotonic() + POOL_RETRY_BACKOFF
+                logger.error(
+                    f"Failed to create Postgres connection pool, retrying in {POOL_RETRY_BACKOFF}s: {e}")
+                return None
+
+    return _db_pool
+
+
+async def close_db_pool():
+    """Close the global asyncpg pool"""
+    global _db_pool
+
+    if _db_pool is not None:
+        await _db_pool.close()
+        _db_pool = None
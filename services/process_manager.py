@@ -153,17 +153,20 @@ class TradingProcessManager:
             env['TRADING_USER_ID'] = config['user_id']
             env['TRADING_ACCOUNT_ID'] = config['account_id']
 
-            # Start process
-            process = subprocess.Popen(
-                command,
-                env=env,
-                cwd=str(self.base_path),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
-            )
+            # Console output goes to a file: nothing reads a pipe once the
+            # process is up, and a full pipe would block the account's event
+            # loop on its next log line
+            output_path = self.base_path / \
+                f"trading_process_{config['session_id']}.out"
+            with open(output_path, 'w') as output:
+                process = subprocess.Popen(
+                    command,
+                    env=env,
+                    cwd=str(self.base_path),
+                    stdout=output,
+                    stderr=subprocess.STDOUT,
+                    text=True
+                )
 
             # Wait a moment to see if process starts successfully
             await asyncio.sleep(2)
@@ -173,9 +176,9 @@ class TradingProcessManager:
                 return process
             else:
                 # Process exited immediately
-                stdout, stderr = process.communicate()
+                output = output_path.read_text(errors='replace')
                 logger.error(
-                    f"Process exited immediately. Stdout: {stdout}, Stderr: {stderr}")
+                    f"Process exited immediately. Output: {output}")
                 return None
 
         except Exception as e:
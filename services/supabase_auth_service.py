@@ -6,6 +6,7 @@ Handles user authentication, JWT tokens, and account management
 import asyncio
 import logging
 import os
+import time
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import json
@@ -23,6 +24,10 @@ class SupabaseAuthService:
     Handles user login/logout, JWT management, and account loading
     """
 
+    # Refresh the access token this many seconds before it expires, so
+    # requests from the background managers never go out with a stale JWT
+    SESSION_REFRESH_MARGIN = 60
+
     def __init__(self, url: str = None, key: str = None, service_role_key: str = None):
         # Use provided values or environment variables or hardcoded fallbacks
         self.url = url or os.getenv(
@@ -313,13 +318,12 @@ class SupabaseAuthService:
             return False
 
         try:
-            # Check if token is expired
-            if self.current_session.expires_at:
-                expires_at = datetime.fromtimestamp(
-                    self.current_session.expires_at)
-                if datetime.utcnow() >= expires_at:
-                    # Try to refresh session
-                    return await self.refresh_session()
+            # Check if token is expired or about to expire; expires_at is a
+            # unix timestamp taken from the token's exp claim
+            expires_at = self.current_session.expires_at
+            if expires_at and expires_at - time.time() < self.SESSION_REFRESH_MARGIN:
+                # Try to refresh session
+                return await self.refresh_session()
 
             return True
 
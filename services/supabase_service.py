@@ -15,6 +15,15 @@ import aiohttp
 
 logger = logging.getLogger(__name__)
 
+# PostgREST `or` filters splitting open cycles by strategy the same way
+# CyclesManagerV2.track_cycle does: a cycle with hedge levels or of type
+# HEDGE is an AH cycle, every other cycle is a CT cycle
+CYCLE_KIND_FILTERS = {
+    'AH': 'cycle_type.eq.HEDGE,and(hedge_levels.not.is.null,hedge_levels.neq.[])',
+    'CT': ('and(or(cycle_type.is.null,cycle_type.neq.HEDGE),'
+           'or(hedge_levels.is.null,hedge_levels.eq.[]))'),
+}
+
 
 class SupabaseService:
     """
@@ -39,6 +48,9 @@ class SupabaseService:
 
         # Connection pool settings
         self.timeout = aiohttp.ClientTimeout(total=15, connect=5)
+        # Skip the health-check query while the pooled connection was used
+        # successfully within this many seconds
+        self.health_check_interval = 30
 
     async def initialize(self) -> bool:
         """Initialize the Supabase client with connection pooling"""
@@ -78,6 +90,11 @@ class SupabaseService:
         if not self.is_connected or not self.client:
             return await self.reconnect()
 
+        # A recent successful query proves the connection, no extra round-trip
+        idle_seconds = (datetime.utcnow() - self.last_query_time).total_seconds()
+        if idle_seconds < self.health_check_interval:
+            return True
+
         # Test connection periodically
         if not await self.test_connection():
             return await self.reconnect()
@@ -153,6 +170,8 @@ class SupabaseService:
                 elif filter_key == 'in':
                     for field, values in filter_value.items():
                         query = query.in_(field, values)
+                elif filter_key == 'or':
+                    query = query.or_(filter_value)
 
             # Apply limit
             if 'limit' in kwargs:
@@ -286,6 +305,51 @@ class SupabaseService:
             logger.error(f"Error getting active cycles: {e}")
             return []
 
+    async def get_active_cycles_by_account(self, account_id: str, columns: str = '*',
+                                           kind: Optional[str] = None) -> List[Dict]:
+        """Get the open cycles of an account, filtered by the database
+
+        kind ('AH' or 'CT') keeps only the cycles of that strategy
+        """
+        try:
+            filters = {'eq': {
+                'account': account_id,
+                'is_closed': False
+            }}
+            if kind:
+                filters['or'] = CYCLE_KIND_FILTERS[kind]
+
+            result = await self.execute_query(
+                'select',
+                table='cycles',
+                columns=columns,
+                filters=filters
+            )
+
+            return result.data if result else []
+
+        except Exception as e:
+            logger.error(f"Error getting active cycles for account {account_id}: {e}")
+            return []
+
+    async def get_cycles_by_ids(self, cycle_ids: List[str]) -> List[Dict]:
+        """Get all cycles matching any of the given ids in one query"""
+        if not cycle_ids:
+            return []
+
+        try:
+            result = await self.execute_query(
+                'select',
+                table='cycles',
+                filters={'in': {'id': list(cycle_ids)}}
+            )
+
+            return result.data if result else []
+
+        except Exception as e:
+            logger.error(f"Error getting cycles by ids: {e}")
+            return []
+
     async def get_bot_config(self, user_id: str, config_name: str) -> Optional[Dict]:
         """Get bot configuration"""
         try:
@@ -379,6 +443,24 @@ class SupabaseService:
             logger.error(f"Error getting orders for cycle {cycle_id}: {e}")
             return []
 
+    async def get_orders_by_tickets(self, tickets: List[int]) -> List[Dict]:
+        """Get all orders matching any of the given tickets in one query"""
+        if not tickets:
+            return []
+
+        try:
+            result = await self.execute_query(
+                'select',
+                table='orders',
+                filters={'in': {'ticket': list(tickets)}}
+            )
+
+            return result.data if result else []
+
+        except Exception as e:
+            logger.error(f"Error getting orders by tickets: {e}")
+            return []
+
     async def bulk_insert_orders(self, orders: List[Dict]) -> bool:
         """Bulk insert multiple orders for performance"""
         try:
@@ -59,7 +59,8 @@ class TradingService:
             # Stop all bots
             await self.stop_all_bots()
 
-            # Stop event listener
+            # Send events still waiting for a batch, then stop the listener
+            await self.event_handler.flush()
             self.event_handler.stop_real_time_listener()
 
             # Close database connections